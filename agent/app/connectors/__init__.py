@@ -1,3 +1,4 @@
+import httpx
 from app.connectors.base import BaseConnector
 from app.connectors.html_connector import HTMLConnector
 from app.connectors.ics_connector import ICSConnector
@@ -11,6 +12,13 @@ CONNECTOR_MAP = {
 }
 
 
-def get_connector(connector_type: str, source_id: str, url: str, name: str = "") -> BaseConnector:
+def get_connector(
+    connector_type: str,
+    source_id: str,
+    url: str,
+    name: str = "",
+    client: httpx.AsyncClient | None = None,
+    request_delay: float | None = None,
+) -> BaseConnector:
     cls = CONNECTOR_MAP.get(connector_type, HTMLConnector)
-    return cls(source_id=source_id, url=url, name=name)
+    return cls(source_id=source_id, url=url, name=name, client=client, request_delay=request_delay)
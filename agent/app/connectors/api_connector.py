@@ -12,9 +12,15 @@ class SkiddleConnector(BaseConnector):
     """Skiddle public API connector."""
     connector_type = "api"
 
-    def __init__(self, source_id: str, api_key: str = ""):
+    def __init__(
+        self,
+        source_id: str,
+        api_key: str = "",
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
         url = "https://www.skiddle.com/api/v1/events/search/"
-        super().__init__(source_id, url)
+        super().__init__(source_id, url, client=client, request_delay=request_delay)
         self.name = "Skiddle"
         self.api_key = api_key
 
@@ -67,9 +73,15 @@ class EventbriteConnector(BaseConnector):
     """Eventbrite API connector."""
     connector_type = "api"
 
-    def __init__(self, source_id: str, api_key: str = ""):
+    def __init__(
+        self,
+        source_id: str,
+        api_key: str = "",
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
         url = "https://www.eventbriteapi.com/v3/events/search/"
-        super().__init__(source_id, url)
+        super().__init__(source_id, url, client=client, request_delay=request_delay)
         self.name = "Eventbrite"
         self.api_key = api_key
 
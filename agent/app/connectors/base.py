@@ -3,12 +3,12 @@ Base Connector class.
 All connectors must implement: discover(), fetch(), extract(), normalize().
 """
 from __future__ import annotations
-import asyncio
-import time
+import hashlib
 import httpx
 from abc import ABC, abstractmethod
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from app.core.config import settings
+from app.core.http import get_http_client, host_slot
+from app.core.rate_limit import rate_limiter
 from app.workers.normaliser import normalise_raw, normalise_with_ai
 from rich.console import Console
 
@@ -19,20 +19,32 @@ class ConnectorError(Exception):
     pass
 
 
+class NotModified(Exception):
+    """The source page is unchanged since the last successful run."""
+
+
 class BaseConnector(ABC):
     name: str = "base"
     connector_type: str = "html"  # api / html / ics / pdf / operator
 
-    def __init__(self, source_id: str, url: str):
+    def __init__(
+        self,
+        source_id: str,
+        url: str,
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
         self.source_id = source_id
         self.url = url
-        self._last_request_time = 0.0
+        self.client = client or get_http_client()
+        self.request_delay = request_delay  # per-source override of settings.request_delay
+        # Validators from the last successful run ({"etag", "last_modified", "body_hash"}),
+        # and the ones seen on this run, which the ingestion runner persists on success
+        self.cached_page: dict | None = None
+        self.page_state: dict | None = None
 
-    def _throttle(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < settings.request_delay:
-            time.sleep(settings.request_delay - elapsed)
-        self._last_request_time = time.time()
+    async def _throttle(self, url: str):
+        await rate_limiter.acquire(url, self.request_delay)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -41,17 +53,39 @@ class BaseConnector(ABC):
         reraise=True,
     )
     async def _get(self, url: str, headers: dict | None = None) -> httpx.Response:
-        self._throttle()
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            response = await client.get(url, headers=headers or {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            })
+        await self._throttle(url)
+        async with host_slot(self.client, url):
+            response = await self.client.get(url, headers=headers)
+        if response.status_code != 304:  # httpx treats 3xx as errors; 304 answers a conditional GET
             response.raise_for_status()
-            return response
+        return response
+
+    async def _get_page(self, url: str) -> httpx.Response:
+        """
+        Conditional GET for the source page.
+        Raises NotModified on a 304 or when the body hashes the same as last time.
+        """
+        cached = self.cached_page or {}
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await self._get(url, headers=headers)
+        if response.status_code == 304:
+            self.page_state = dict(cached)
+            raise NotModified(url)
+
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        self.page_state = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_hash": body_hash,
+        }
+        if cached.get("body_hash") == body_hash:
+            raise NotModified(url)
+        return response
 
     @abstractmethod
     async def fetch(self) -> list[dict]:
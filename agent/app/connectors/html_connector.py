@@ -1,84 +1,111 @@
 """
 HTML Calendar Connector
-Parses venue "What's On" pages using BeautifulSoup + Claude AI.
+Parses venue "What's On" pages with the fastest installed HTML backend
+(see app.workers.html_text) + Claude AI.
 """
 from __future__ import annotations
-from bs4 import BeautifulSoup
-from app.connectors.base import BaseConnector
-from app.workers.normaliser import normalise_with_ai
+from collections import Counter
+import httpx
+from app.connectors.base import BaseConnector, ConnectorError
+from app.workers.html_text import NOISE_TAGS, find_containers, parse_html
+from app.workers.normaliser import normalise_with_ai, normalise_batch_with_ai
+
+# Common event container patterns
+CONTAINER_SELECTORS = [
+    "article",
+    "[class*='event']",
+    "[class*='listing']",
+    "[class*='card']",
+    "li[class*='event']",
+]
+
+# Pages extracted per strategy ("containers" / "full_page") since process start
+STRATEGY_COUNTS: Counter = Counter()
 
 
 class HTMLConnector(BaseConnector):
     connector_type = "html"
 
-    def __init__(self, source_id: str, url: str, name: str = ""):
-        super().__init__(source_id, url)
+    def __init__(
+        self,
+        source_id: str,
+        url: str,
+        name: str = "",
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
+        super().__init__(source_id, url, client=client, request_delay=request_delay)
         self.name = name or "HTML Connector"
+        self.strategy: str | None = None  # which extraction strategy the last run used
+        self._running = False
 
     async def fetch(self) -> list[dict]:
-        response = await self._get(self.url)
+        response = await self._get_page(self.url)
         html = response.text
         return [{"_html": html, "_url": self.url}]
 
     async def extract(self, raw: dict) -> dict:
-        html = raw.get("_html", "")
-        url = raw.get("_url", self.url)
+        """Single event from the whole page (the full-page strategy)."""
+        document = parse_html(raw.get("_html", ""))
+        return await self._extract_page(document, raw.get("_url", self.url))
 
-        soup = BeautifulSoup(html, "lxml")
+    async def _extract_page(self, document, url: str) -> dict:
         # Remove nav, footer, scripts to reduce noise
-        for tag in soup.find_all(["nav", "footer", "script", "style", "aside"]):
-            tag.decompose()
-        clean_text = soup.get_text(separator=" ", strip=True)
+        clean_text = document.page_text(NOISE_TAGS)
 
         # Use AI to extract events from the clean text
         extracted = await normalise_with_ai(clean_text, url)
         if "error" in extracted:
             return {}
-
-        # HTMLConnector may return multiple events from one page
-        # We return the first hit here; multi_extract below handles many
         return extracted
 
-    async def multi_extract(self) -> list[dict]:
-        """
-        For pages with multiple event listings, try to extract each listing
-        separately by finding event-like containers.
-        """
-        response = await self._get(self.url)
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # Common event container patterns
-        SELECTORS = [
-            "article",
-            "[class*='event']",
-            "[class*='listing']",
-            "[class*='card']",
-            "li[class*='event']",
-        ]
+    @staticmethod
+    def _find_containers(document) -> list:
+        return find_containers(document, CONTAINER_SELECTORS, minimum=3)
 
-        containers = []
-        for sel in SELECTORS:
-            found = soup.select(sel)
-            if len(found) > 2:
-                containers = found
-                break
+    async def _extract_containers(self, document, containers: list) -> list[dict]:
+        texts = []
+        for container in containers[:30]:  # cap at 30
+            text = document.node_text(container)
+            if len(text) >= 30:
+                texts.append(text)
+        return await normalise_batch_with_ai(texts, self.url)
 
-        if not containers:
-            # Fall back to single full-page extract
-            return await self.run()
+    async def extract_document(self, raw: dict) -> list[dict]:
+        """
+        Parse a fetched page once and extract its events: one per event-like
+        container when the page has them, otherwise one from the full page.
+        """
+        document = parse_html(raw.get("_html", ""))
+        containers = self._find_containers(document)
+        if containers:
+            self.strategy = "containers"
+            extracted = await self._extract_containers(document, containers)
+        else:
+            self.strategy = "full_page"
+            extracted = [await self._extract_page(document, raw.get("_url", self.url))]
+        STRATEGY_COUNTS[self.strategy] += 1
 
         events = []
-        for container in containers[:30]:  # cap at 30
-            text = container.get_text(separator=" ", strip=True)
-            if len(text) < 30:
-                continue
-            extracted = await normalise_with_ai(text, self.url)
-            if extracted.get("title"):
-                extracted["source_url"] = self.url
-                extracted["source_name"] = self.name
-                events.append(extracted)
-
+        for event in extracted:
+            if event.get("title"):
+                event["source_url"] = self.url
+                event["source_name"] = self.name
+                events.append(event)
         return events
 
     async def run(self) -> list[dict]:
-        return await self.multi_extract()
+        """Single-fetch pipeline: fetch the page once, then extract_document."""
+        if self._running:
+            raise ConnectorError(f"[{self.name}] run() re-entered")
+        self._running = True
+        try:
+            events = []
+            for raw in await self.fetch():
+                events.extend(await self.extract_document(raw))
+            return events
+        finally:
+            self._running = False
+
+    async def multi_extract(self) -> list[dict]:
+        return await self.run()
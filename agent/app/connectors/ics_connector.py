@@ -4,6 +4,7 @@ Parses .ics calendar feeds.
 """
 from __future__ import annotations
 from icalendar import Calendar
+import httpx
 from app.connectors.base import BaseConnector
 from app.workers.normaliser import normalise_raw
 
@@ -11,12 +12,19 @@ from app.workers.normaliser import normalise_raw
 class ICSConnector(BaseConnector):
     connector_type = "ics"
 
-    def __init__(self, source_id: str, url: str, name: str = ""):
-        super().__init__(source_id, url)
+    def __init__(
+        self,
+        source_id: str,
+        url: str,
+        name: str = "",
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
+        super().__init__(source_id, url, client=client, request_delay=request_delay)
         self.name = name or "ICS Connector"
 
     async def fetch(self) -> list[dict]:
-        response = await self._get(self.url)
+        response = await self._get_page(self.url)
         cal = Calendar.from_ical(response.content)
 
         events = []
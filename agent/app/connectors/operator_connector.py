@@ -8,6 +8,7 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
+import httpx
 from app.connectors.base import BaseConnector
 from app.workers.normaliser import normalise_with_ai
 from app.core.config import settings
@@ -23,8 +24,15 @@ class OperatorConnector(BaseConnector):
     """
     connector_type = "operator"
 
-    def __init__(self, source_id: str, url: str, name: str = ""):
-        super().__init__(source_id, url)
+    def __init__(
+        self,
+        source_id: str,
+        url: str,
+        name: str = "",
+        client: httpx.AsyncClient | None = None,
+        request_delay: float | None = None,
+    ):
+        super().__init__(source_id, url, client=client, request_delay=request_delay)
         self.name = name or "Operator Connector"
 
     async def fetch(self) -> list[dict]:
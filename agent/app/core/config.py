@@ -13,7 +13,37 @@ class Settings(BaseSettings):
     auto_approve_threshold: int = 80
     evidence_dir: str = "evidence"
     exports_dir: str = "exports"
-    request_delay: float = 2.0
+    request_delay: float = 2.0   # seconds between requests to the same host
+    request_burst: float = 1.0   # requests a host may receive back-to-back
+
+    # Shared HTTP connection pool
+    http_timeout: float = 30.0
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_max_per_host: int = 4
+    http2: bool = False
+
+    # Concurrent ingestion
+    ingest_concurrency: int = 6   # sources scraped at once
+    ingest_per_host: int = 2      # sources on the same domain scraped at once
+
+    # AI extraction cache (on-disk, content-addressed)
+    ai_cache_enabled: bool = True
+    ai_cache_path: str = "cache/ai_extractions.sqlite3"
+    ai_cache_ttl_days: int = 30
+    ai_cache_max_entries: int = 50000
+
+    # Batched AI extraction (many listing containers per call)
+    ai_batch_size: int = 15             # max listings per call
+    ai_batch_token_budget: int = 6000   # estimated input tokens per call
+    ai_batch_item_chars: int = 2000     # per-listing truncation
+
+    # AI request gate (match these to your provider tier)
+    ai_max_concurrency: int = 4
+    ai_requests_per_minute: int = 50
+    ai_input_tokens_per_minute: int = 50000
+    ai_max_retries: int = 4
 
     class Config:
         env_file = ".env"
@@ -1,9 +1,29 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from pathlib import Path
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
+AGENT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def enable_sqlite_savepoints(engine: AsyncEngine):
+    """
+    Let SQLAlchemy emit BEGIN itself on SQLite. The driver's own deferred BEGIN
+    turns the first SAVEPOINT into the outer transaction, so releasing it commits.
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
 
 engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True)
+if engine.dialect.name == "sqlite":
+    enable_sqlite_savepoints(engine)
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -19,8 +39,33 @@ async def get_db():
             await session.close()
 
 
+def migrate(connection):
+    """
+    Sync helper: bring the schema up to date with the Alembic migrations.
+    A database that has tables but no alembic_version was created by an older
+    init_db() with create_all; it is stamped at the baseline first, and the
+    later migrations skip whatever create_all already made.
+    """
+    from alembic import command
+
+    config = alembic_config(connection)
+    tables = set(inspect(connection).get_table_names())
+    if tables and "alembic_version" not in tables:
+        command.stamp(config, "0001")
+    command.upgrade(config, "head")
+
+
+def alembic_config(connection):
+    """Alembic config running the migrations on `connection`, without alembic.ini's logging setup."""
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(AGENT_ROOT / "migrations"))
+    config.attributes["connection"] = connection
+    return config
+
+
 async def init_db():
-    """Create all tables (use Alembic for migrations in production)."""
+    """Create or upgrade the schema (see migrate)."""
     async with engine.begin() as conn:
-        from app.models import venue, event, source, review, job  # noqa: F401
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(migrate)
@@ -0,0 +1,87 @@
+"""
+Shared HTTP client.
+One connection-pooled httpx.AsyncClient per process, opened by the app
+lifespan (or the CLI) and injected into every connector.
+"""
+from __future__ import annotations
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+import httpx
+from app.core.config import settings
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+_client: httpx.AsyncClient | None = None
+# Per-client, per-host connection caps (httpx only limits the pool as a whole)
+_host_slots: "weakref.WeakKeyDictionary[httpx.AsyncClient, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build a pooled keep-alive client from settings."""
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        timeout=settings.http_timeout,
+        limits=limits,
+        http2=settings.http2 and _http2_available(),
+        follow_redirects=True,
+        headers=DEFAULT_HEADERS,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it lazily if nothing opened one."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+@asynccontextmanager
+async def http_client_scope():
+    """Own the shared client for the duration of an app lifespan or CLI command."""
+    client = get_http_client()
+    try:
+        yield client
+    finally:
+        await close_http_client()
+
+
+@asynccontextmanager
+async def host_slot(client: httpx.AsyncClient, url: str):
+    """Hold one of the per-host connection slots for `url` on `client`."""
+    host = urlparse(url).netloc.lower()
+    slots = _host_slots.setdefault(client, {})
+    sem = slots.get(host)
+    if sem is None:
+        sem = slots[host] = asyncio.Semaphore(settings.http_max_per_host)
+    async with sem:
+        yield
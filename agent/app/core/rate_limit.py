@@ -0,0 +1,74 @@
+"""
+Per-host rate limiting.
+Async token buckets keyed by host and shared across every connector, so
+politeness is enforced per domain without blocking the event loop.
+"""
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+from app.core.config import settings
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of locking.
+    The balance may go negative: each caller takes a token immediately and
+    sleeps off the debt, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens and return how many seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= cost
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    async def acquire(self, cost: float = 1.0):
+        wait = self.reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    One TokenBucket per host; `delay` is the steady-state gap between requests.
+    A host keeps the largest delay any of its sources has asked for.
+    """
+
+    def __init__(self, default_delay: float, burst: float = 1.0):
+        self.default_delay = default_delay
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str, delay: float) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        rate = 1.0 / delay
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(rate, self.burst)
+        elif rate < bucket.rate:
+            # Sources sharing a host may ask for different delays; the strictest wins
+            bucket.rate = rate
+        return bucket
+
+    async def acquire(self, url: str, delay: float | None = None):
+        delay = self.default_delay if delay is None else delay
+        if delay <= 0:
+            return
+        await self.bucket(url, delay).acquire()
+
+
+rate_limiter = HostRateLimiter(settings.request_delay, burst=settings.request_burst)
@@ -32,6 +32,7 @@ class SourceCreate(BaseModel):
     source_type: str     # venue/council/platform/aggregator
     priority: int = 3
     schedule: str = "daily"
+    request_delay: Optional[float] = None
     notes: Optional[str] = None
 
 
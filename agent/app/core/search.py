@@ -0,0 +1,147 @@
+"""
+Event full-text search
+PostgreSQL: a generated, weighted `events.search_vector` tsvector with a GIN index.
+SQLite: an external-content FTS5 table `events_fts` kept in step by triggers.
+Both are maintained by the database on every insert/update/delete, so the
+ingestion runner, change detector and admin API need no extra writes.
+Other backends fall back to ILIKE.
+"""
+from __future__ import annotations
+import re
+from sqlalchemy import text, select, and_, or_, false, ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import Event
+
+MAX_TERMS = 8
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(venue_name, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_search_vector ON events USING gin (search_vector)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        title, venue_name, description,
+        content='events', content_rowid='rowid', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, title, venue_name, description)
+        VALUES (new.rowid, new.title, new.venue_name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, venue_name, description)
+        VALUES ('delete', old.rowid, old.title, old.venue_name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_update AFTER UPDATE OF title, venue_name, description ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, venue_name, description)
+        VALUES ('delete', old.rowid, old.title, old.venue_name, old.description);
+        INSERT INTO events_fts(rowid, title, venue_name, description)
+        VALUES (new.rowid, new.title, new.venue_name, new.description);
+    END
+    """,
+]
+
+
+def search_ddl(dialect: str) -> list[str]:
+    """Idempotent DDL creating the search structures for a dialect."""
+    return {"postgresql": POSTGRES_DDL, "sqlite": SQLITE_DDL}.get(dialect, [])
+
+
+def create_search_index(connection):
+    """Sync helper for init_db / migrations: create the index if missing."""
+    for statement in search_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+def rebuild_search_index(connection):
+    """Repopulate the index from events (after bulk loads or restores)."""
+    create_search_index(connection)
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+    elif connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("REINDEX INDEX ix_events_search_vector")
+
+
+def search_terms(q: str) -> list[str]:
+    return re.findall(r"\w+", q.lower())[:MAX_TERMS]
+
+
+def _tsquery(terms: list[str]) -> str:
+    # Every term must match, each as a prefix ("jaz" -> jazz), as in the FTS5 query
+    return " & ".join(f"{t}:*" for t in terms)
+
+
+def _fts5_query(terms: list[str]) -> str:
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def search_filter(dialect: str, q: str) -> ColumnElement[bool]:
+    """WHERE clause matching events for `q`; nothing matches if it has no searchable terms."""
+    terms = search_terms(q)
+    if not terms:
+        return false()  # as search_events: "!!" finds nothing rather than everything
+    if dialect == "postgresql":
+        return text("events.search_vector @@ to_tsquery('english', :tsq)").bindparams(tsq=_tsquery(terms))
+    if dialect == "sqlite":
+        return text(
+            "events.rowid IN (SELECT rowid FROM events_fts WHERE events_fts MATCH :fts)"
+        ).bindparams(fts=_fts5_query(terms))
+    return and_(*(
+        or_(Event.title.ilike(f"%{t}%"), Event.description.ilike(f"%{t}%"), Event.venue_name.ilike(f"%{t}%"))
+        for t in terms
+    ))
+
+
+async def search_events(db: AsyncSession, q: str, status: str | None = "approved", limit: int = 50) -> list[Event]:
+    """Canonical events matching `q`, best match first (title > venue > description)."""
+    terms = search_terms(q)
+    if not terms:
+        return []
+    dialect = db.bind.dialect.name
+    status_sql = "AND events.status = :status" if status else ""
+    params = {"status": status, "limit": limit} if status else {"limit": limit}
+
+    if dialect == "postgresql":
+        sql = f"""
+            SELECT events.id FROM events
+            WHERE events.search_vector @@ to_tsquery('english', :tsq)
+              AND events.canonical {status_sql}
+            ORDER BY ts_rank_cd(events.search_vector, to_tsquery('english', :tsq)) DESC, events.start_datetime
+            LIMIT :limit
+        """
+        params["tsq"] = _tsquery(terms)
+    elif dialect == "sqlite":
+        sql = f"""
+            SELECT events.id FROM events_fts JOIN events ON events.rowid = events_fts.rowid
+            WHERE events_fts MATCH :fts AND events.canonical = 1 {status_sql}
+            ORDER BY bm25(events_fts, 10.0, 5.0, 1.0), events.start_datetime
+            LIMIT :limit
+        """
+        params["fts"] = _fts5_query(terms)
+    else:
+        stmt = select(Event).where(Event.canonical == True, search_filter(dialect, q))
+        if status:
+            stmt = stmt.where(Event.status == status)
+        result = await db.execute(stmt.order_by(Event.start_datetime).limit(limit))
+        return list(result.scalars().all())
+
+    ids = (await db.execute(text(sql), params)).scalars().all()
+    if not ids:
+        return []
+    result = await db.execute(select(Event).where(Event.id.in_(ids)))
+    by_id = {e.id: e for e in result.scalars()}
+    return [by_id[i] for i in ids if i in by_id]
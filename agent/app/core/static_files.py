@@ -0,0 +1,82 @@
+"""
+Static file serving for exports
+PrecompressedStaticFiles serves `name.br` / `name.gz` written next to `name`
+by the exporter when the client accepts that encoding, with a strong ETag
+derived from the served bytes so unchanged files revalidate with a 304.
+"""
+from __future__ import annotations
+import hashlib
+import mimetypes
+import os
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+# Preferred first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_etags: dict[tuple[str, int, int], str] = {}
+MAX_CACHED_ETAGS = 1024
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Codings from an Accept-Encoding header, minus those refused with q=0."""
+    accepted = set()
+    for part in header.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip())
+    return accepted
+
+
+def strong_etag(path: str, stat_result: os.stat_result) -> str:
+    """Quoted sha256 of the file contents, cached until the file changes."""
+    key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+    etag = _etags.get(key)
+    if etag is None:
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 16), b""):
+                digest.update(block)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        if len(_etags) >= MAX_CACHED_ETAGS:
+            _etags.clear()
+        _etags[key] = etag
+    return etag
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = os.fspath(full_path)
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+        headers = {"vary": "Accept-Encoding"}
+
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        for coding, suffix in ENCODINGS:
+            if coding not in accepted:
+                continue
+            try:
+                variant_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            # Skip variants left behind by an older export
+            if variant_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                full_path, stat_result = full_path + suffix, variant_stat
+                headers["content-encoding"] = coding
+                break
+
+        headers["etag"] = strong_etag(full_path, stat_result)
+        response = FileResponse(
+            full_path, status_code=status_code, stat_result=stat_result, media_type=media_type, headers=headers
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
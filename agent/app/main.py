@@ -1,16 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
 from app.core.database import init_db
+from app.core.http import http_client_scope
+from app.core.static_files import PrecompressedStaticFiles
 from app.routers import events, venues, sources, review, jobs, stats
 import os
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
-    yield
+    async with http_client_scope() as client:
+        app.state.http_client = client
+        yield
 
 
 app = FastAPI(
@@ -30,6 +33,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # API routers
@@ -49,7 +53,7 @@ async def health():
 # Serve exported JSON files for website consumption (Mode A)
 exports_dir = os.path.join(os.path.dirname(__file__), "..", "exports")
 if os.path.exists(exports_dir):
-    app.mount("/exports", StaticFiles(directory=exports_dir), name="exports")
+    app.mount("/exports", PrecompressedStaticFiles(directory=exports_dir), name="exports")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 from app.models.venue import Venue, VenueSource
-from app.models.source import Source
+from app.models.source import Source, SourcePage
 from app.models.event import Event, EventObservation
 from app.models.review import ReviewQueueItem
 from app.models.job import Job
+from app.models.stats import StatCounter
+from app.models.export import ExportedEvent, ExportCheckpoint, ExportQueueItem
 
-__all__ = ["Venue", "VenueSource", "Source", "Event", "EventObservation", "ReviewQueueItem", "Job"]
+__all__ = [
+    "Venue", "VenueSource", "Source", "SourcePage", "Event", "EventObservation", "ReviewQueueItem", "Job", "StatCounter",
+    "ExportedEvent", "ExportCheckpoint", "ExportQueueItem",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Text, Integer, Float, DateTime, func, Numeric
+from sqlalchemy import String, Boolean, Text, Integer, Float, DateTime, func, Numeric, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 import uuid
@@ -6,15 +6,23 @@ import uuid
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Public listing / export: status + canonical filter, ordered by start; id
+        # completes the (start_datetime, id) keyset the listing cursor seeks on
+        Index("ix_events_status_canonical_start_id", "status", "canonical", "start_datetime", "id"),
+        # Ingest change detection looks events up by their (often long) ticket URL
+        Index("ix_events_ticket_url", "ticket_url", postgresql_using="hash", mysql_length=255),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
-    start_datetime: Mapped[DateTime | None] = mapped_column(DateTime)
+    start_datetime: Mapped[DateTime | None] = mapped_column(DateTime, index=True)
     end_datetime: Mapped[DateTime | None] = mapped_column(DateTime)
     all_day: Mapped[bool] = mapped_column(Boolean, default=False)
     venue_id: Mapped[str | None] = mapped_column(String(36))
     venue_name: Mapped[str | None] = mapped_column(String(255))  # raw, before linking
+    venue_key: Mapped[str | None] = mapped_column(String(255), index=True)  # normalised venue_name, for dedup blocking
     organiser_id: Mapped[str | None] = mapped_column(String(36))
     ticket_url: Mapped[str | None] = mapped_column(Text)
     price_min: Mapped[float | None] = mapped_column(Numeric(10, 2))
@@ -38,8 +46,12 @@ class Event(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    venue: Mapped["Venue | None"] = relationship("Venue", back_populates="events")  # noqa: F821
-    observations: Mapped[list["EventObservation"]] = relationship("EventObservation", back_populates="event")
+    venue: Mapped["Venue | None"] = relationship(  # noqa: F821
+        "Venue", back_populates="events", primaryjoin="Venue.id == foreign(Event.venue_id)"
+    )
+    observations: Mapped[list["EventObservation"]] = relationship(
+        "EventObservation", back_populates="event", primaryjoin="Event.id == foreign(EventObservation.event_id)"
+    )
 
 
 class EventObservation(Base):
@@ -47,7 +59,7 @@ class EventObservation(Base):
     __tablename__ = "event_observations"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    event_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
     source_id: Mapped[str | None] = mapped_column(String(36))
     source_url: Mapped[str] = mapped_column(Text)
     observed_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
@@ -56,4 +68,6 @@ class EventObservation(Base):
     extracted_json: Mapped[str | None] = mapped_column(Text)
     content_hash: Mapped[str | None] = mapped_column(String(64))
 
-    event: Mapped["Event"] = relationship("Event", back_populates="observations")
+    event: Mapped["Event"] = relationship(
+        "Event", back_populates="observations", primaryjoin="Event.id == foreign(EventObservation.event_id)"
+    )
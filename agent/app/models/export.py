@@ -0,0 +1,85 @@
+from sqlalchemy import String, Text, Integer, DateTime, func, event, Index
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, mapped_column, Session
+from app.core.database import Base
+from app.models.event import Event
+
+
+class ExportedEvent(Base):
+    """The website payload last exported for an event (one row per exported event)."""
+    __tablename__ = "exported_events"
+    __table_args__ = (
+        # The exporter streams the snapshot in (start_datetime, event_id) order
+        Index("ix_exported_events_start_event", "start_datetime", "event_id"),
+    )
+
+    event_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    start_datetime: Mapped[DateTime | None] = mapped_column(DateTime)
+    fingerprint: Mapped[str] = mapped_column(Text)
+    payload: Mapped[str] = mapped_column(Text)  # JSON from format_event_for_website
+    exported_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class ExportCheckpoint(Base):
+    """What the last export of a file wrote, so unchanged runs can skip rewriting it."""
+    __tablename__ = "export_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)  # events/venues
+    content_hash: Mapped[str | None] = mapped_column(String(64))
+    item_count: Mapped[int] = mapped_column(Integer, default=0)
+    written_at: Mapped[DateTime | None] = mapped_column(DateTime)
+
+
+class ExportQueueItem(Base):
+    """
+    An event inserted, updated or deleted since the exporter last looked at it.
+    Written by the flush hook below in the same transaction as the change, so
+    it becomes visible exactly when the change commits. `version` goes up on
+    every further change; the exporter only clears the versions it has seen.
+    """
+    __tablename__ = "export_queue"
+
+    event_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_export_changes(session, flush_context, instances):
+    # Objects rather than ids: new events only get a default id during the flush
+    changed = session.info.setdefault("export_queue", [])
+    changed.extend(obj for obj in (*session.new, *session.deleted) if isinstance(obj, Event))
+    changed.extend(obj for obj in session.dirty if isinstance(obj, Event) and session.is_modified(obj))
+
+
+@event.listens_for(Session, "after_flush")
+def _write_export_queue(session, flush_context):
+    changed = {obj.id for obj in session.info.pop("export_queue", ())}
+    if changed:
+        queue_exports(session.connection(), changed)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_export_changes(session, previous_transaction):
+    # A flush that failed before after_flush leaves its changes behind
+    session.info.pop("export_queue", None)
+
+
+def queue_exports(connection, event_ids):
+    """Queue `event_ids` for the exporter, bumping the version of ones already queued."""
+    table = ExportQueueItem.__table__
+    # Key order, so concurrent flushes lock shared rows in the same order
+    rows = [{"event_id": i, "version": 1} for i in sorted(event_ids)]
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+        connection.execute(
+            insert.on_conflict_do_update(index_elements=["event_id"], set_={"version": table.c.version + 1}),
+            rows,
+        )
+        return
+    for row in rows:
+        updated = connection.execute(
+            table.update().where(table.c.event_id == row["event_id"]).values(version=table.c.version + 1)
+        )
+        if not updated.rowcount:
+            connection.execute(table.insert().values(**row))
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text, DateTime, func, Integer
+from sqlalchemy import String, Text, DateTime, func, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 import uuid
@@ -6,6 +6,9 @@ import uuid
 
 class ReviewQueueItem(Base):
     __tablename__ = "review_queue"
+    __table_args__ = (
+        Index("ix_review_queue_status_created", "status", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     event_id: Mapped[str] = mapped_column(String(36), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Text, Integer, DateTime, func
+from sqlalchemy import String, Boolean, Text, Integer, Float, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 import uuid
@@ -9,12 +9,13 @@ class Source(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    url: Mapped[str] = mapped_column(Text, nullable=False)
+    url: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     connector_type: Mapped[str] = mapped_column(String(50))  # api/html/ics/pdf/operator
     source_type: Mapped[str] = mapped_column(String(50))     # venue/council/platform/aggregator
     priority: Mapped[int] = mapped_column(Integer, default=3)
     active: Mapped[bool] = mapped_column(Boolean, default=True)
     schedule: Mapped[str] = mapped_column(String(50), default="daily")  # hourly/daily/weekly
+    request_delay: Mapped[float | None] = mapped_column(Float)  # seconds; overrides settings.request_delay
     last_run: Mapped[DateTime | None] = mapped_column(DateTime)
     last_success: Mapped[DateTime | None] = mapped_column(DateTime)
     error_streak: Mapped[int] = mapped_column(Integer, default=0)
@@ -22,4 +23,20 @@ class Source(Base):
     notes: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
 
-    venue_sources: Mapped[list["VenueSource"]] = relationship("VenueSource", back_populates="source")  # noqa: F821
+    venue_sources: Mapped[list["VenueSource"]] = relationship(  # noqa: F821
+        "VenueSource", back_populates="source", primaryjoin="Source.id == foreign(VenueSource.source_id)"
+    )
+
+
+class SourcePage(Base):
+    """HTTP cache validators for a fetched source page (conditional GET)."""
+    __tablename__ = "source_pages"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    source_id: Mapped[str | None] = mapped_column(String(36))
+    url: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    etag: Mapped[str | None] = mapped_column(Text)
+    last_modified: Mapped[str | None] = mapped_column(String(64))  # raw Last-Modified header
+    body_hash: Mapped[str | None] = mapped_column(String(64))      # sha256 of the response body
+    checked_at: Mapped[DateTime | None] = mapped_column(DateTime)
+    changed_at: Mapped[DateTime | None] = mapped_column(DateTime)
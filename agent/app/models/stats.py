@@ -0,0 +1,96 @@
+from collections import Counter
+from sqlalchemy import String, Integer, event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, mapped_column, Session
+from app.core.database import Base
+from app.models.event import Event
+from app.models.review import ReviewQueueItem
+
+
+class StatCounter(Base):
+    """
+    Running row counts for the dashboard, keyed e.g. "events:approved:1"
+    (status, canonical) or "review:pending". Kept current by the flush hook below.
+    """
+    __tablename__ = "stat_counters"
+
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, default=0)
+
+
+def event_key(status: str | None, canonical: bool | None) -> str:
+    return f"events:{status or 'pending'}:{0 if canonical is False else 1}"
+
+
+def review_key(status: str | None) -> str:
+    return f"review:{status or 'pending'}"
+
+
+def _old(obj, attr: str):
+    """Value as last loaded from / written to the database."""
+    history = inspect(obj).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return history.unchanged[0] if history.unchanged else getattr(obj, attr)
+
+
+def _key(obj, value=getattr):
+    if isinstance(obj, Event):
+        return event_key(value(obj, "status"), value(obj, "canonical"))
+    return review_key(value(obj, "status"))
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_counter_deltas(session, flush_context, instances):
+    """Work out count changes while the pre-flush state is still visible."""
+    deltas = session.info.setdefault("stat_counter_deltas", Counter())
+    tracked = (Event, ReviewQueueItem)
+    for obj in session.new:
+        if isinstance(obj, tracked):
+            deltas[_key(obj)] += 1
+    for obj in session.deleted:
+        if isinstance(obj, tracked):
+            deltas[_key(obj, _old)] -= 1
+    for obj in session.dirty:
+        if isinstance(obj, tracked) and session.is_modified(obj):
+            old, new = _key(obj, _old), _key(obj)
+            if old != new:
+                deltas[old] -= 1
+                deltas[new] += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_counter_deltas(session, flush_context):
+    deltas = {k: v for k, v in session.info.pop("stat_counter_deltas", {}).items() if v}
+    if deltas:
+        bump_counters(session.connection(), deltas)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_counter_deltas(session, previous_transaction):
+    # A flush that failed before after_flush leaves its deltas behind
+    session.info.pop("stat_counter_deltas", None)
+
+
+def bump_counters(connection, deltas: dict[str, int]):
+    """
+    Add `deltas` to the counters in one upsert (create missing keys).
+    Rows are written in key order, so concurrent flushes lock shared counters
+    in the same order instead of deadlocking on Postgres.
+    """
+    table = StatCounter.__table__
+    rows = [{"key": k, "value": deltas[k]} for k in sorted(deltas)]
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+        connection.execute(
+            insert.on_conflict_do_update(index_elements=["key"], set_={"value": table.c.value + insert.excluded.value}),
+            rows,
+        )
+        return
+    for row in rows:
+        updated = connection.execute(
+            table.update().where(table.c.key == row["key"]).values(value=table.c.value + row["value"])
+        )
+        if not updated.rowcount:
+            connection.execute(table.insert().values(**row))
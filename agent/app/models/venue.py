@@ -23,8 +23,12 @@ class Venue(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    events: Mapped[list["Event"]] = relationship("Event", back_populates="venue")  # noqa: F821
-    venue_sources: Mapped[list["VenueSource"]] = relationship("VenueSource", back_populates="venue")  # noqa: F821
+    events: Mapped[list["Event"]] = relationship(  # noqa: F821
+        "Event", back_populates="venue", primaryjoin="Venue.id == foreign(Event.venue_id)"
+    )
+    venue_sources: Mapped[list["VenueSource"]] = relationship(  # noqa: F821
+        "VenueSource", back_populates="venue", primaryjoin="Venue.id == foreign(VenueSource.venue_id)"
+    )
 
 
 class VenueSource(Base):
@@ -39,5 +43,9 @@ class VenueSource(Base):
     active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
 
-    venue: Mapped["Venue"] = relationship("Venue", back_populates="venue_sources")
-    source: Mapped["Source"] = relationship("Source", back_populates="venue_sources")  # noqa: F821
+    venue: Mapped["Venue"] = relationship(
+        "Venue", back_populates="venue_sources", primaryjoin="Venue.id == foreign(VenueSource.venue_id)"
+    )
+    source: Mapped["Source"] = relationship(  # noqa: F821
+        "Source", back_populates="venue_sources", primaryjoin="Source.id == foreign(VenueSource.source_id)"
+    )
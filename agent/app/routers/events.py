@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, func, tuple_
 from app.core.database import get_db
 from app.core.schemas import EventCreate, EventOut, StatusUpdate
+from app.core.search import search_events, search_filter
 from app.models.event import Event
+from app.workers.deduplicator import venue_key
 from datetime import datetime, date
+import base64
 import json
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -12,6 +15,7 @@ router = APIRouter(prefix="/events", tags=["events"])
 
 @router.get("/", response_model=list[EventOut])
 async def list_events(
+    response: Response,
     status: str = Query("approved"),
     category: str | None = Query(None),
     date_from: str | None = Query(None),
@@ -22,8 +26,14 @@ async def list_events(
     q: str | None = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page; replaces offset"),
     db: AsyncSession = Depends(get_db),
 ):
+    """
+    Events ordered by start time (undated last), then id. Every full page sets
+    an X-Next-Cursor header; passing it back as `cursor` seeks straight to the
+    next page through the listing index instead of re-reading `offset` rows.
+    """
     stmt = select(Event).where(Event.canonical == True)
 
     if status != "all":
@@ -49,18 +59,20 @@ async def list_events(
         except ValueError:
             pass
     if q:
-        stmt = stmt.where(
-            or_(
-                Event.title.ilike(f"%{q}%"),
-                Event.description.ilike(f"%{q}%"),
-                Event.venue_name.ilike(f"%{q}%"),
-            )
-        )
-
-    stmt = stmt.order_by(Event.start_datetime.asc()).offset(offset).limit(limit)
-    result = await db.execute(stmt)
-    events = result.scalars().all()
-
+        stmt = stmt.where(search_filter(db.bind.dialect.name, q))
+
+    if offset and not cursor:
+        stmt = stmt.order_by(Event.start_datetime.asc().nulls_last(), Event.id.asc()).offset(offset).limit(limit)
+        events = (await db.execute(stmt)).scalars().all()
+    else:
+        events = []
+        for page in _keyset_pages(stmt, _decode_cursor(cursor) if cursor else None):
+            events += (await db.execute(page.limit(limit - len(events)))).scalars().all()
+            if len(events) == limit:
+                break
+
+    if events and len(events) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(events[-1])
     return [_to_out(e) for e in events]
 
 
@@ -79,6 +91,18 @@ async def get_today_events(db: AsyncSession = Depends(get_db)):
     return [_to_out(e) for e in result.scalars().all()]
 
 
+@router.get("/search", response_model=list[EventOut])
+async def search(
+    q: str = Query(..., min_length=1),
+    status: str = Query("approved"),
+    limit: int = Query(50, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ranked full-text search over title, venue and description; terms match as prefixes."""
+    events = await search_events(db, q, status=None if status == "all" else status, limit=limit)
+    return [_to_out(e) for e in events]
+
+
 @router.get("/{event_id}", response_model=EventOut)
 async def get_event(event_id: str, db: AsyncSession = Depends(get_db)):
     event = await db.get(Event, event_id)
@@ -90,7 +114,8 @@ async def get_event(event_id: str, db: AsyncSession = Depends(get_db)):
 @router.post("/", response_model=EventOut, status_code=201)
 async def create_event(data: EventCreate, db: AsyncSession = Depends(get_db)):
     event = Event(
-        **{k: (json.dumps(v) if isinstance(v, list) else v) for k, v in data.model_dump().items()}
+        **{k: (json.dumps(v) if isinstance(v, list) else v) for k, v in data.model_dump().items()},
+        venue_key=venue_key(data.venue_name),
     )
     db.add(event)
     await db.commit()
@@ -118,6 +143,36 @@ async def delete_event(event_id: str, db: AsyncSession = Depends(get_db)):
     return {"success": True}
 
 
+def _encode_cursor(event: Event) -> str:
+    start = event.start_datetime.isoformat() if event.start_datetime else None
+    return base64.urlsafe_b64encode(json.dumps([start, event.id]).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime | None, str]:
+    try:
+        start, event_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return (datetime.fromisoformat(start) if start else None), str(event_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset_pages(stmt, after: tuple[datetime | None, str] | None) -> list:
+    """
+    The rows after `after` in (start_datetime nulls last, id) order, as up to
+    two queries run in turn: dated events seeking on (start_datetime, id),
+    then the undated tail by id. Each reads the listing index in order; one
+    NULLS LAST query would instead sort the whole partition on every page.
+    """
+    start, event_id = after or (None, None)
+    undated = stmt.where(Event.start_datetime.is_(None)).order_by(Event.id)
+    if after and start is None:
+        return [undated.where(Event.id > event_id)]
+    dated = stmt.where(Event.start_datetime.is_not(None)).order_by(Event.start_datetime, Event.id)
+    if after:
+        dated = dated.where(tuple_(Event.start_datetime, Event.id) > (start, event_id))
+    return [dated, undated]
+
+
 def _to_out(event: Event) -> dict:
     d = {c.name: getattr(event, c.name) for c in event.__table__.columns}
     for field in ("tags", "images"):
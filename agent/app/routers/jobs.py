@@ -35,19 +35,14 @@ async def trigger_scrape(source_id: str, background_tasks: BackgroundTasks, db:
 
 @router.post("/scrape-all")
 async def trigger_scrape_all(background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
+    from app.workers.orchestrator import queue_scrape_jobs, run_sources
+
     result = await db.execute(select(Source).where(Source.active == True))
     sources = result.scalars().all()
 
-    job_ids = []
-    for source in sources:
-        job = Job(job_type="scrape", source_id=source.id, status="pending")
-        db.add(job)
-        await db.commit()
-        await db.refresh(job)
-        background_tasks.add_task(_run_scrape_job, job.id, source.id)
-        job_ids.append(job.id)
-
-    return {"queued": len(job_ids), "job_ids": job_ids}
+    job_ids = await queue_scrape_jobs(db, sources)
+    background_tasks.add_task(run_sources, list(job_ids), job_ids=job_ids)
+    return {"queued": len(job_ids), "job_ids": list(job_ids.values())}
 
 
 @router.post("/export")
@@ -62,29 +57,9 @@ async def trigger_export(background_tasks: BackgroundTasks, db: AsyncSession = D
 
 async def _run_scrape_job(job_id: str, source_id: str):
     """Background task: run the ingestion worker for one source."""
-    from app.core.database import AsyncSessionLocal
-    from app.workers.ingestion_runner import run_source
-    from datetime import datetime
+    from app.workers.orchestrator import run_sources
 
-    async with AsyncSessionLocal() as db:
-        job = await db.get(Job, job_id)
-        job.status = "running"
-        job.started_at = datetime.utcnow()
-        await db.commit()
-
-        try:
-            stats = await run_source(source_id, db)
-            job.status = "done"
-            job.events_found = stats.get("found", 0)
-            job.events_added = stats.get("added", 0)
-            job.events_updated = stats.get("updated", 0)
-            job.events_queued = stats.get("queued", 0)
-        except Exception as e:
-            job.status = "failed"
-            job.error_message = str(e)
-        finally:
-            job.finished_at = datetime.utcnow()
-            await db.commit()
+    await run_sources([source_id], job_ids={source_id: job_id})
 
 
 async def _run_export_job(job_id: str):
@@ -1,34 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import aliased
 from app.core.database import get_db
 from app.models.review import ReviewQueueItem
 from app.models.event import Event
 from app.core.schemas import ReviewAction
+from app.workers.stat_counters import dashboard_counts
 from datetime import datetime
 
 router = APIRouter(prefix="/review", tags=["review"])
 
 
 @router.get("/")
-async def list_review_queue(status: str = "pending", db: AsyncSession = Depends(get_db)):
-    stmt = select(ReviewQueueItem).where(ReviewQueueItem.status == status).order_by(ReviewQueueItem.created_at)
+async def list_review_queue(
+    status: str = "pending",
+    limit: int = Query(100, le=500),
+    offset: int = Query(0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Queue items with their event and duplicate candidate, loaded in one joined query."""
+    candidate = aliased(Event)
+    stmt = (
+        select(ReviewQueueItem, Event, candidate)
+        .outerjoin(Event, Event.id == ReviewQueueItem.event_id)
+        .outerjoin(candidate, candidate.id == ReviewQueueItem.duplicate_candidate_id)
+        .where(ReviewQueueItem.status == status)
+        .order_by(ReviewQueueItem.created_at, ReviewQueueItem.id)
+        .offset(offset)
+        .limit(limit)
+    )
     result = await db.execute(stmt)
-    items = result.scalars().all()
 
-    out = []
-    for item in items:
-        event = await db.get(Event, item.event_id)
-        out.append({
+    return [
+        {
             "queue_id": item.id,
             "reason": item.reason,
             "notes": item.notes,
             "duplicate_candidate_id": item.duplicate_candidate_id,
             "duplicate_score": item.duplicate_score,
             "created_at": item.created_at,
-            "event": {c.name: getattr(event, c.name) for c in event.__table__.columns} if event else None,
-        })
-    return out
+            "event": _columns(event),
+            "duplicate_candidate": _columns(dup),
+        }
+        for item, event, dup in result.all()
+    ]
+
+
+def _columns(event: Event | None) -> dict | None:
+    return {c.name: getattr(event, c.name) for c in event.__table__.columns} if event else None
 
 
 @router.post("/{queue_id}/action")
@@ -64,14 +84,8 @@ async def take_action(queue_id: str, body: ReviewAction, db: AsyncSession = Depe
 
 @router.get("/stats")
 async def review_stats(db: AsyncSession = Depends(get_db)):
-    from sqlalchemy import func
-    pending = await db.execute(
-        select(func.count()).select_from(ReviewQueueItem).where(ReviewQueueItem.status == "pending")
-    )
-    resolved = await db.execute(
-        select(func.count()).select_from(ReviewQueueItem).where(ReviewQueueItem.status == "resolved")
-    )
+    counts = await dashboard_counts(db)
     return {
-        "pending": pending.scalar(),
-        "resolved": resolved.scalar(),
+        "pending": counts["review_queue"],
+        "resolved": counts["review_resolved"],
     }
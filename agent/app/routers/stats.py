@@ -1,40 +1,19 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from app.core.database import get_db
-from app.models.event import Event
-from app.models.venue import Venue
-from app.models.source import Source
-from app.models.review import ReviewQueueItem
 from app.models.job import Job
-from datetime import date, datetime
+from app.connectors.html_connector import STRATEGY_COUNTS
+from app.workers.ai_cache import ai_cache
+from app.workers.ai_gate import ai_gate
+from app.workers.stat_counters import dashboard_counts
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/")
 async def get_stats(db: AsyncSession = Depends(get_db)):
-    today = date.today()
-    today_start = datetime(today.year, today.month, today.day)
-
-    total_events = (await db.execute(select(func.count()).select_from(Event))).scalar()
-    approved = (await db.execute(
-        select(func.count()).select_from(Event).where(Event.status == "approved")
-    )).scalar()
-    pending = (await db.execute(
-        select(func.count()).select_from(Event).where(Event.status == "pending")
-    )).scalar()
-    review_queue = (await db.execute(
-        select(func.count()).select_from(ReviewQueueItem).where(ReviewQueueItem.status == "pending")
-    )).scalar()
-    venues = (await db.execute(select(func.count()).select_from(Venue).where(Venue.active == True))).scalar()
-    sources = (await db.execute(select(func.count()).select_from(Source).where(Source.active == True))).scalar()
-    today_events = (await db.execute(
-        select(func.count()).select_from(Event).where(
-            Event.status == "approved",
-            Event.start_datetime >= today_start,
-        )
-    )).scalar()
+    counts = await dashboard_counts(db)
 
     # Last 5 jobs
     jobs_result = await db.execute(
@@ -46,12 +25,15 @@ async def get_stats(db: AsyncSession = Depends(get_db)):
     ]
 
     return {
-        "total_events": total_events,
-        "approved_events": approved,
-        "pending_events": pending,
-        "review_queue": review_queue,
-        "venues": venues,
-        "sources": sources,
-        "today_events": today_events,
+        "total_events": counts["total_events"],
+        "approved_events": counts["approved_events"],
+        "pending_events": counts["pending_events"],
+        "review_queue": counts["review_queue"],
+        "venues": counts["venues"],
+        "sources": counts["sources"],
+        "today_events": counts["today_events"],
         "recent_jobs": recent_jobs,
+        "ai_cache": ai_cache.counters(),
+        "ai_queue": ai_gate.snapshot(),
+        "html_strategies": dict(STRATEGY_COUNTS),
     }
@@ -0,0 +1,162 @@
+"""
+AI Extraction Cache
+Content-addressed on-disk cache for AI extraction results, so listing text
+that was already extracted is never sent to the model twice.
+Keys hash (prompt version, model, cleaned text); entries expire after a TTL
+and the least recently used ones are evicted beyond a size cap.
+Lookups only read: hit/miss counts and LRU touches are buffered and written
+with the next put(), counters() call or at exit. Async callers use
+aget()/aput(), which run off the event loop and treat cache errors as misses.
+"""
+from __future__ import annotations
+import asyncio
+import atexit
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from rich.console import Console
+from app.core.config import settings
+
+console = Console()
+
+COUNTER_NAMES = ("hits", "misses", "stores", "evictions")
+
+
+def cache_key(prompt_version: str, model: str, text: str) -> str:
+    raw = f"{prompt_version}\x00{model}\x00{text}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class AIExtractionCache:
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int, enabled: bool = True):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._pending_counts: Counter = Counter()
+        self._touched: dict[str, float] = {}
+        if enabled:
+            atexit.register(self._flush_at_exit)
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_last_used ON entries (last_used)")
+            conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self._conn = conn
+        return self._conn
+
+    def _bump(self, conn: sqlite3.Connection, name: str, by: int = 1):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, by),
+        )
+
+    def _flush(self, conn: sqlite3.Connection, now: float):
+        """Write buffered counters and LRU touches, and drop expired entries."""
+        if self._touched:
+            conn.executemany("UPDATE entries SET last_used = ? WHERE key = ?",
+                             [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+        for name, by in self._pending_counts.items():
+            self._bump(conn, name, by)
+        self._pending_counts.clear()
+        if self.ttl_seconds != float("inf"):
+            conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,))
+
+    def _flush_at_exit(self):
+        try:
+            with self._lock:
+                if self._pending_counts or self._touched:
+                    self._flush(self._db(), time.time())
+        except Exception:
+            pass
+
+    def get(self, key: str) -> dict | None:
+        """Read-only lookup; expired entries count as misses and are removed on the next flush."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._db().execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self._pending_counts["misses"] += 1
+                return None
+            self._pending_counts["hits"] += 1
+            self._touched[key] = now
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict):
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._db()
+            self._flush(conn, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            self._bump(conn, "stores")
+            (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._bump(conn, "evictions", excess)
+
+    def counters(self) -> dict:
+        """Lifetime hit/miss counters plus current size, for /stats and `run.py status`."""
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            conn = self._db()
+            self._flush(conn, time.time())
+            values = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            (entries,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        out = {name: values.get(name, 0) for name in COUNTER_NAMES}
+        lookups = out["hits"] + out["misses"]
+        out["hit_rate"] = round(out["hits"] / lookups, 3) if lookups else 0.0
+        out["entries"] = entries
+        out["enabled"] = True
+        return out
+
+    async def aget(self, key: str) -> dict | None:
+        """get() in a worker thread; a failing cache is logged and treated as a miss."""
+        try:
+            return await asyncio.to_thread(self.get, key)
+        except Exception as e:
+            console.log(f"AI cache lookup failed, calling the model instead: {e}")
+            return None
+
+    async def aput(self, key: str, value: dict):
+        """put() in a worker thread; a failing cache is logged and otherwise ignored."""
+        try:
+            await asyncio.to_thread(self.put, key, value)
+        except Exception as e:
+            console.log(f"AI cache store failed: {e}")
+
+
+ai_cache = AIExtractionCache(
+    path=settings.ai_cache_path,
+    ttl_seconds=settings.ai_cache_ttl_days * 86400,
+    max_entries=settings.ai_cache_max_entries,
+    enabled=settings.ai_cache_enabled,
+)
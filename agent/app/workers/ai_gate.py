@@ -0,0 +1,134 @@
+"""
+AI Request Gate
+Process-wide admission control for model calls: a concurrency cap, the
+provider's requests/tokens-per-minute budgets, and a shared cooldown when
+the provider answers 429, so concurrent extractions back off together.
+"""
+from __future__ import annotations
+import asyncio
+import time
+import weakref
+from typing import Awaitable, Callable, TypeVar
+from app.core.config import settings
+from app.core.rate_limit import TokenBucket
+from rich.console import Console
+
+console = Console()
+T = TypeVar("T")
+
+
+def _status_code(error: Exception) -> int | None:
+    return getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds from a 429's retry-after header, if the provider sent one."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    # Connection errors and timeouts carry no status code
+    return "Connection" in type(error).__name__ or "Timeout" in type(error).__name__
+
+
+class AIGate:
+    def __init__(self, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int, max_retries: int):
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._requests = TokenBucket(requests_per_minute / 60, capacity=requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute / 60, capacity=tokens_per_minute)
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._cooldown_until = 0.0
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._slots.get(loop)
+        if sem is None:
+            sem = self._slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    async def _admit(self, tokens: int):
+        while (pause := self._cooldown_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause)
+        await self._requests.acquire()
+        await self._tokens.acquire(tokens)
+
+    def _cool_down(self, seconds: float):
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    async def call(self, fn: Callable[[], Awaitable[T]], tokens: int) -> T:
+        """Run `fn` once admitted, retrying 429s (after retry-after) and transient errors."""
+        attempt = 0
+        while True:
+            try:
+                result = await self._call_once(fn, tokens)
+            except Exception as e:
+                if not _is_retryable(e) or attempt >= self.max_retries:
+                    self.failed += 1
+                    raise
+                if _status_code(e) == 429:
+                    self.rate_limited += 1
+                    # Everyone waits, not just this caller: the budget is shared
+                    delay = _retry_after(e)
+                    self._cool_down(delay if delay is not None else 2 ** attempt)
+                else:
+                    await asyncio.sleep(2 ** attempt)
+                attempt += 1
+                console.log(f"AI call retry {attempt}/{self.max_retries}: {e}")
+                continue
+            self.completed += 1
+            return result
+
+    async def _call_once(self, fn: Callable[[], Awaitable[T]], tokens: int) -> T:
+        sem = self._semaphore()
+        self.waiting += 1
+        try:
+            await sem.acquire()
+            try:
+                await self._admit(tokens)
+            except BaseException:
+                sem.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            return await fn()
+        finally:
+            self.in_flight -= 1
+            sem.release()
+
+    def snapshot(self) -> dict:
+        """Queue depth and outcome counters for /stats."""
+        return {
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "cooling_down_s": round(max(0.0, self._cooldown_until - time.monotonic()), 1),
+        }
+
+
+ai_gate = AIGate(
+    max_concurrency=settings.ai_max_concurrency,
+    requests_per_minute=settings.ai_requests_per_minute,
+    tokens_per_minute=settings.ai_input_tokens_per_minute,
+    max_retries=settings.ai_max_retries,
+)
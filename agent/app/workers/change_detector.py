@@ -51,7 +51,6 @@ async def record_observation(
         # Detect what changed
         _apply_changes(event, extracted)
         event.content_hash = new_hash
-        event.updated_at = datetime.utcnow()
 
     elif event.content_hash is None:
         event.content_hash = new_hash
@@ -63,6 +62,11 @@ def _apply_changes(event: Event, new_data: dict):
     """Apply detected changes to the event record."""
     # Time change
     new_start = new_data.get("start_datetime")
+    if isinstance(new_start, str):
+        try:
+            new_start = datetime.fromisoformat(new_start.replace("Z", "+00:00"))
+        except ValueError:
+            new_start = None
     if new_start and str(new_start) != str(event.start_datetime):
         event.start_datetime = new_start
 
@@ -1,12 +1,18 @@
 """
 Deduplication Engine
 Score-based merge system with fuzzy matching.
+Candidates are blocked first (same ticket URL, start date within a day, or
+same normalised venue) so each check only scores a handful of events.
+The batch pass scores whole blocks at once with rapidfuzz.process.cdist.
 """
 from __future__ import annotations
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_, and_
 from app.models.event import Event
 from app.models.review import ReviewQueueItem
 from app.core.config import settings
@@ -15,6 +21,139 @@ from app.core.config import settings
 AUTO_MERGE_THRESHOLD = 92
 REVIEW_THRESHOLD = 70
 
+# Blocking: candidates must start within this many days of the new event
+DATE_WINDOW = timedelta(days=1)
+
+# Batch pass: pending events scored per chunk against their blocked candidates
+BATCH_CHUNK_ROWS = 512
+EPOCH = datetime(1970, 1, 1)
+
+
+def venue_key(name: str | None) -> str | None:
+    """Order-insensitive venue key: 'The Halls, Norwich' -> 'halls norwich the'."""
+    tokens = re.findall(r"[a-z0-9]+", (name or "").lower())
+    return " ".join(sorted(tokens)) or None
+
+
+def blocking_clause(event: Event):
+    """SQL filter matching events that share a block with `event` (None if it has no keys)."""
+    clauses = []
+    if event.ticket_url:
+        clauses.append(Event.ticket_url == event.ticket_url)
+    if event.start_datetime:
+        day = datetime.combine(event.start_datetime.date(), datetime.min.time())
+        clauses.append(and_(
+            Event.start_datetime >= day - DATE_WINDOW,
+            Event.start_datetime < day + timedelta(days=1) + DATE_WINDOW,
+        ))
+    key = event.venue_key or venue_key(event.venue_name)
+    if key:
+        clauses.append(Event.venue_key == key)
+    return or_(*clauses) if clauses else None
+
+
+async def find_candidates(event: Event, db: AsyncSession) -> list[Event]:
+    """Canonical events sharing a block with `event`."""
+    block = blocking_clause(event)
+    if block is None:
+        return []
+    stmt = select(Event).where(Event.canonical == True, Event.id != event.id, block)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def find_batch_candidates(events: list[Event], db: AsyncSession) -> list[Event]:
+    """Canonical events sharing a block with any of `events`, in one query."""
+    tickets = {e.ticket_url for e in events if e.ticket_url}
+    keys = {k for e in events if (k := e.venue_key or venue_key(e.venue_name))}
+    days = sorted({e.start_datetime.date().toordinal() + d
+                   for e in events if e.start_datetime
+                   for d in range(-DATE_WINDOW.days, DATE_WINDOW.days + 1)})
+
+    clauses = []
+    if tickets:
+        clauses.append(Event.ticket_url.in_(tickets))
+    if keys:
+        clauses.append(Event.venue_key.in_(keys))
+    # Collapse the day set into contiguous ranges
+    for first, last in _day_ranges(days):
+        clauses.append(and_(
+            Event.start_datetime >= datetime.fromordinal(first),
+            Event.start_datetime < datetime.fromordinal(last + 1),
+        ))
+    if not clauses:
+        return []
+    result = await db.execute(select(Event).where(Event.canonical == True, or_(*clauses)))
+    return list(result.scalars().all())
+
+
+def _day_ranges(days: list[int]) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    for day in days:
+        if ranges and day == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+class CandidateIndex:
+    """
+    In-memory version of find_candidates for a batch: built from
+    find_batch_candidates(), extended as the batch adds events.
+    """
+
+    def __init__(self, events: list[Event] = ()):
+        self._order: dict[str, int] = {}
+        self._events: dict[str, Event] = {}
+        self._keyed: dict[str, set[tuple]] = {}
+        self._blocks: dict[tuple, list[str]] = defaultdict(list)
+        for event in events:
+            self.add(event)
+
+    @staticmethod
+    def _keys(event: Event) -> list[tuple]:
+        keys = []
+        if event.ticket_url:
+            keys.append(("ticket", event.ticket_url))
+        if key := event.venue_key or venue_key(event.venue_name):
+            keys.append(("venue", key))
+        if event.start_datetime:
+            keys.append(("day", event.start_datetime.date().toordinal()))
+        return keys
+
+    def add(self, event: Event):
+        if event.id in self._events:
+            return
+        self._order[event.id] = len(self._order)
+        self._events[event.id] = event
+        self._keyed[event.id] = set()
+        self.refresh(event.id)
+
+    def refresh(self, event_id: str):
+        """Re-block an indexed event after merge_events filled its ticket URL or venue."""
+        event = self._events.get(event_id)
+        if event is None:
+            return
+        for key in self._keys(event):
+            if key not in self._keyed[event_id]:
+                self._keyed[event_id].add(key)
+                self._blocks[key].append(event_id)
+
+    def candidates(self, event: Event) -> list[Event]:
+        ids: set[str] = set()
+        for kind, value in self._keys(event):
+            if kind == "day":
+                for d in range(value - DATE_WINDOW.days, value + DATE_WINDOW.days + 1):
+                    ids.update(self._blocks.get(("day", d), ()))
+            else:
+                ids.update(self._blocks.get((kind, value), ()))
+        ids.discard(event.id)
+        return [
+            self._events[i] for i in sorted(ids, key=self._order.__getitem__)
+            if self._events[i].canonical
+        ]
+
 
 def score_pair(a: Event, b: Event) -> int:
     """Score similarity between two events. 0-100."""
@@ -64,6 +203,7 @@ def merge_events(canonical: Event, duplicate: Event) -> Event:
         canonical.ticket_url = duplicate.ticket_url
     if not canonical.venue_name and duplicate.venue_name:
         canonical.venue_name = duplicate.venue_name
+        canonical.venue_key = duplicate.venue_key or venue_key(duplicate.venue_name)
     if canonical.price_min is None and duplicate.price_min is not None:
         canonical.price_min = duplicate.price_min
         canonical.price_max = duplicate.price_max
@@ -97,14 +237,16 @@ async def check_and_handle_duplicate(
     If auto-merged, marks new_event as non-canonical.
     If ambiguous, queues for review.
     """
-    # Only compare against approved + pending canonical events
-    stmt = select(Event).where(
-        Event.canonical == True,
-        Event.id != new_event.id,
-    )
-    result = await db.execute(stmt)
-    candidates = result.scalars().all()
+    candidates = await find_candidates(new_event, db)
+    return resolve_duplicate(new_event, candidates, db)
 
+
+def resolve_duplicate(
+    new_event: Event,
+    candidates: list[Event],
+    db: AsyncSession,
+) -> tuple[bool, str | None]:
+    """Score `new_event` against `candidates` and merge / queue / keep it."""
     best_score = 0
     best_match: Event | None = None
 
@@ -114,6 +256,16 @@ async def check_and_handle_duplicate(
             best_score = s
             best_match = candidate
 
+    return apply_best_match(new_event, best_match, best_score, db)
+
+
+def apply_best_match(
+    new_event: Event,
+    best_match: Event | None,
+    best_score: int,
+    db: AsyncSession,
+) -> tuple[bool, str | None]:
+    """Merge into / queue against the best-scoring candidate per the thresholds."""
     if best_score >= AUTO_MERGE_THRESHOLD and best_match:
         # Auto-merge: mark new event as non-canonical
         merged = merge_events(best_match, new_event)
@@ -138,20 +290,175 @@ async def check_and_handle_duplicate(
     return False, None
 
 
-async def run_deduplication_pass(db: AsyncSession) -> dict:
-    """Full deduplication pass on all pending events."""
-    stmt = select(Event).where(Event.status == "pending", Event.canonical == True)
-    result = await db.execute(stmt)
+async def backfill_venue_keys(db: AsyncSession) -> int:
+    """Fill venue_key on events stored before it existed."""
+    result = await db.execute(
+        select(Event).where(Event.venue_key.is_(None), Event.venue_name.is_not(None))
+    )
     events = result.scalars().all()
+    for event in events:
+        event.venue_key = venue_key(event.venue_name)
+    return len(events)
+
+
+def _features(events: list[Event]) -> dict:
+    """Column arrays for score_matrix / block_matrix."""
+    days = np.full(len(events), np.nan)
+    seconds = np.full(len(events), np.nan)
+    for i, e in enumerate(events):
+        if e.start_datetime:
+            days[i] = e.start_datetime.toordinal()
+            seconds[i] = (e.start_datetime - EPOCH).total_seconds()
+    return {
+        "ids": np.array([e.id for e in events], dtype=object),
+        "titles": [(e.title or "").lower() for e in events],
+        "venues": [(e.venue_name or "").lower().strip() for e in events],
+        "venue_keys": np.array([e.venue_key or venue_key(e.venue_name) or "" for e in events], dtype=object),
+        "tickets": np.array([e.ticket_url or "" for e in events], dtype=object),
+        "days": days,
+        "seconds": seconds,
+    }
+
+
+def _ticket_match(a: dict, b: dict) -> np.ndarray:
+    return (a["tickets"][:, None] == b["tickets"][None, :]) & (a["tickets"][:, None] != "")
+
+
+def score_matrix(a: dict, b: dict) -> np.ndarray:
+    """score_pair for every (row, column) pair of two _features() sets."""
+    title_sim = process.cdist(a["titles"], b["titles"], scorer=fuzz.token_sort_ratio, dtype=np.float64, workers=-1)
+    venue_sim = process.cdist(a["venues"], b["venues"], scorer=fuzz.token_sort_ratio, dtype=np.float64, workers=-1)
+    has_venue = np.array([bool(v) for v in a["venues"]])[:, None] & np.array([bool(v) for v in b["venues"]])[None, :]
+
+    same_day = a["days"][:, None] == b["days"][None, :]
+    close = np.abs(a["seconds"][:, None] - b["seconds"][None, :]) <= 7200
+
+    score = np.floor(title_sim * 0.45)
+    score += np.where(has_venue & (venue_sim > 80), 25, 0)
+    score += np.where(same_day, 20, 0) + np.where(same_day & close, 10, 0)
+    score = np.minimum(score, 100)
+    score[_ticket_match(a, b)] = 100
+    return score.astype(np.int64)
+
+
+def block_matrix(a: dict, b: dict) -> np.ndarray:
+    """Pairs find_candidates would return: shared ticket URL, date window or venue key."""
+    window = DATE_WINDOW.days
+    near = np.abs(a["days"][:, None] - b["days"][None, :]) <= window
+    same_venue = (a["venue_keys"][:, None] == b["venue_keys"][None, :]) & (a["venue_keys"][:, None] != "")
+    not_self = a["ids"][:, None] != b["ids"][None, :]
+    return (_ticket_match(a, b) | near | same_venue) & not_self
+
+
+def _block_index(features: dict) -> tuple[dict, dict, dict]:
+    by_day, by_venue, by_ticket = defaultdict(list), defaultdict(list), defaultdict(list)
+    for j in range(len(features["ids"])):
+        if not np.isnan(features["days"][j]):
+            by_day[int(features["days"][j])].append(j)
+        if features["venue_keys"][j]:
+            by_venue[features["venue_keys"][j]].append(j)
+        if features["tickets"][j]:
+            by_ticket[features["tickets"][j]].append(j)
+    return by_day, by_venue, by_ticket
+
+
+def _blocked_columns(rows: dict, i: int, blocks: tuple[dict, dict, dict]) -> set[int]:
+    """Indexed columns sharing a block with row `i` of `rows`."""
+    by_day, by_venue, by_ticket = blocks
+    found: set[int] = set()
+    if not np.isnan(rows["days"][i]):
+        day = int(rows["days"][i])
+        for d in range(day - DATE_WINDOW.days, day + DATE_WINDOW.days + 1):
+            found.update(by_day.get(d, ()))
+    found.update(by_venue.get(rows["venue_keys"][i], ()))
+    found.update(by_ticket.get(rows["tickets"][i], ()))
+    return found
+
+
+def _refresh_column(cols: dict, blocks: tuple[dict, dict, dict], j: int, event: Event):
+    """Update column `j` and its blocks after merge_events filled in `event`."""
+    _, by_venue, by_ticket = blocks
+    cols["venues"][j] = (event.venue_name or "").lower().strip()
+    for field, index, value in (
+        ("venue_keys", by_venue, event.venue_key or venue_key(event.venue_name) or ""),
+        ("tickets", by_ticket, event.ticket_url or ""),
+    ):
+        old = cols[field][j]
+        if value == old:
+            continue
+        if old:
+            index[old].remove(j)
+        if value:
+            index[value].append(j)
+        cols[field][j] = value
+
+
+async def run_deduplication_pass(db: AsyncSession) -> dict:
+    """
+    Full deduplication pass on all pending events.
+    Same scores and thresholds as check_and_handle_duplicate, but candidates are
+    loaded once and each chunk of pending events is scored as a matrix against
+    the union of its blocks. Events are still resolved in order, so one merged
+    earlier in the pass is neither resolved again nor matched against, and a
+    canonical that absorbed a merge is re-blocked and rescored with its new fields.
+    """
+    await backfill_venue_keys(db)
+    result = await db.execute(select(Event).where(Event.canonical == True).order_by(Event.created_at, Event.id))
+    candidates = list(result.scalars().all())
+    events = [e for e in candidates if e.status == "pending"]
+
+    cols = _features(candidates)
+    blocks = _block_index(cols)
+    alive = np.ones(len(candidates), dtype=bool)
+    # Canonicals merged into during the current chunk: their matrix scores are stale
+    stale = np.zeros(len(candidates), dtype=bool)
+    position = {e.id: j for j, e in enumerate(candidates)}
 
     merged = 0
     queued = 0
-    for event in events:
-        is_dup, canonical_id = await check_and_handle_duplicate(event, db)
-        if is_dup:
-            merged += 1
-        elif event.status == "pending":
-            queued += 1
+    for start in range(0, len(events), BATCH_CHUNK_ROWS):
+        chunk = events[start:start + BATCH_CHUNK_ROWS]
+        rows = _features(chunk)
+
+        # Union of every block touched by this chunk, in candidate order
+        subset: set[int] = set()
+        for i in range(len(chunk)):
+            subset.update(_blocked_columns(rows, i, blocks))
+        col_idx = np.array(sorted(subset), dtype=np.int64)
+        sub = {k: v[col_idx] if isinstance(v, np.ndarray) else [v[j] for j in col_idx] for k, v in cols.items()}
+
+        scores = score_matrix(rows, sub) if len(col_idx) else np.zeros((len(chunk), 0), dtype=np.int64)
+        scores[~block_matrix(rows, sub)] = 0
+
+        stale_cols: set[int] = set()
+        for i, event in enumerate(chunk):
+            if not alive[position[event.id]]:
+                continue  # merged into an earlier event this pass
+            row = np.where(alive[col_idx] & ~stale[col_idx], scores[i], 0)
+            best = int(row.argmax()) if len(row) else 0
+            best_score = int(row[best]) if len(row) else 0
+            best_j = int(col_idx[best]) if best_score > 0 else None
+
+            # Rescore stale canonicals against their merged fields, ties to the earliest
+            for j in sorted(_blocked_columns(rows, i, blocks).intersection(stale_cols)):
+                if not alive[j] or j == position[event.id]:
+                    continue
+                s = score_pair(event, candidates[j])
+                if s > best_score or (s == best_score and s > 0 and j < best_j):
+                    best_score, best_j = s, j
+            best_match = candidates[best_j] if best_j is not None else None
+
+            is_dup, canonical_id = apply_best_match(event, best_match, best_score, db)
+            if is_dup:
+                merged += 1
+                alive[position[event.id]] = False
+                j = position[canonical_id]
+                _refresh_column(cols, blocks, j, candidates[j])
+                stale[j] = True
+                stale_cols.add(j)
+            elif event.status == "pending":
+                queued += 1
+        stale[list(stale_cols)] = False
 
     await db.commit()
     return {"checked": len(events), "merged": merged, "queued_for_review": queued}
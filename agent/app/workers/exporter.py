@@ -1,71 +1,318 @@
 """
 JSON Exporter
 Generates events.json and venues.json for website consumption (Mode A).
+Exports are incremental: changes since the last run are patched into an
+exported_events snapshot, and files are only rewritten when it changed.
+Alongside events.json it writes shards (per month, per category and the next
+7 days) under shards/, indexed by manifest.json with counts and hashes.
+Everything is streamed from the snapshot in one pass (see json_stream), so
+memory stays flat however large the export; every file is minified, written
+atomically and gets .gz (and .br, if brotli is installed) siblings for
+PrecompressedStaticFiles to serve.
 Also optionally syncs to Google Sheets.
 """
 from __future__ import annotations
 
+import hashlib
 import json
-from datetime import datetime
+from contextlib import ExitStack, aclosing
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import AsyncIterator
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.event import Event
+from app.models.export import ExportedEvent, ExportCheckpoint, ExportQueueItem
 from app.models.venue import Venue
-from app.workers.export_format import format_event_for_website
+from app.workers.export_format import format_event_for_website, slugify
+from app.workers.json_stream import JSONArrayWriter, compressed_paths, dumps, write_json
 from rich.console import Console
 
 console = Console()
 EXPORTS_DIR = Path(settings.exports_dir)
 
+UPCOMING_DAYS = 7
+# Snapshot rows fetched per round trip while streaming
+STREAM_BATCH_ROWS = 500
 
-async def run_export(db: AsyncSession) -> dict:
-    """Export all approved events and venues to JSON files."""
+
+async def run_export(db: AsyncSession, full: bool = False) -> dict:
+    """
+    Export approved events and venues to JSON files.
+    Only events in the export queue (changed since the last run, see
+    ExportQueueItem) are re-formatted and patched into the exported_events
+    snapshot; deleted events are dropped from it. events.json is rewritten only
+    when the snapshot changed. `full` rebuilds the snapshot from every event.
+    """
     EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    events_path = EXPORTS_DIR / "events.json"
 
-    result = await db.execute(
-        select(Event)
-        .where(Event.status == "approved", Event.canonical == True)
-        .order_by(Event.start_datetime.asc())
-    )
-    events = result.scalars().all()
+    checkpoint = await db.get(ExportCheckpoint, "events")
+    if checkpoint is None:
+        checkpoint = ExportCheckpoint(name="events", item_count=0)
+        db.add(checkpoint)
+        full = True
 
-    events_data = []
-    seen_fingerprints: set[str] = set()
-    for event in events:
-        data = {column.name: getattr(event, column.name) for column in event.__table__.columns}
-        for field in ("tags", "images"):
-            raw = data.get(field, "[]")
-            try:
-                data[field] = json.loads(raw) if isinstance(raw, str) else raw
-            except Exception:
-                data[field] = []
-
-        for field in ("start_datetime", "end_datetime", "created_at", "updated_at"):
-            if data.get(field) and isinstance(data[field], datetime):
-                data[field] = data[field].isoformat()
-
-        event_export = format_event_for_website(data)
-        if not event_export:
-            continue
+    changed, removed = await _patch_snapshot(db, full)
+
+    written = bool(changed or removed or full or not events_path.exists())
+    today = date.today()
+    if written or _shards_stale(today):
+        count = await _write_exports(db, today, write_events=written)
+    if written:
+        checkpoint.item_count = count
+        checkpoint.written_at = datetime.utcnow()
+        console.log(f"Exported {count} events ({changed} changed, {removed} removed)")
+    else:
+        console.log("Events unchanged since last export, events.json left as is")
+    await db.commit()
+
+    venues = await _export_venues(db)
+
+    if settings.google_apps_script_url and written and checkpoint.item_count:
+        await _sync_to_google_sheets(await _snapshot_head(db, 50))
+
+    return {
+        "events": checkpoint.item_count,
+        "venues": venues,
+        "changed": changed,
+        "removed": removed,
+        "written": written,
+    }
+
+
+def _event_payload(event: Event) -> dict | None:
+    """Website dict for an exportable event, None if it should not be exported."""
+    if event.status != "approved" or not event.canonical:
+        return None
+    data = {column.name: getattr(event, column.name) for column in event.__table__.columns}
+    for field in ("tags", "images"):
+        raw = data.get(field, "[]")
+        try:
+            data[field] = json.loads(raw) if isinstance(raw, str) else raw
+        except Exception:
+            data[field] = []
+
+    for field in ("start_datetime", "end_datetime", "created_at", "updated_at"):
+        if data.get(field) and isinstance(data[field], datetime):
+            data[field] = data[field].isoformat()
+
+    return format_event_for_website(data)
 
-        fingerprint = event_export["fingerprint"]
-        if fingerprint in seen_fingerprints:
+
+async def _patch_snapshot(db: AsyncSession, full: bool) -> tuple[int, int]:
+    """Bring exported_events up to date; returns (changed, removed)."""
+    queue = ExportQueueItem.__table__
+    if full:
+        await db.execute(delete(ExportedEvent))
+        # Everything queued so far is covered by the rebuild
+        seen = [{"id": i, "seen": v} for i, v in await db.execute(select(queue.c.event_id, queue.c.version))]
+        stmt = select(Event.id.label("event_id"), Event).where(Event.status == "approved", Event.canonical == True)
+    else:
+        seen = []
+        stmt = select(ExportQueueItem.event_id, ExportQueueItem.version, Event).outerjoin(
+            Event, Event.id == ExportQueueItem.event_id
+        )
+
+    changed = removed = 0
+    result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_ROWS))
+    try:
+        async for rows in result.partitions():
+            if not full:
+                seen.extend({"id": row.event_id, "seen": row.version} for row in rows)
+            batch_changed, batch_removed = await _patch_batch(db, [(row.event_id, row.Event) for row in rows], full)
+            changed += batch_changed
+            removed += batch_removed
+    finally:
+        await result.close()
+
+    if seen:
+        # Entries changed again since they were read have a newer version and stay queued
+        await db.execute(
+            queue.delete().where(queue.c.event_id == bindparam("id"), queue.c.version == bindparam("seen")),
+            seen,
+        )
+    if not full:
+        # Deletes that bypass the session (e.g. raw SQL) never reach the queue
+        gone = await db.execute(
+            delete(ExportedEvent)
+            .where(~select(Event.id).where(Event.id == ExportedEvent.event_id).exists())
+            .execution_options(synchronize_session=False)
+        )
+        removed += gone.rowcount or 0
+
+    await db.flush()
+    return changed, removed
+
+
+async def _patch_batch(db: AsyncSession, batch: list[tuple[str, Event | None]], full: bool) -> tuple[int, int]:
+    """Patch one streamed batch of (event id, event or None if deleted) into the snapshot."""
+    existing = {}
+    if not full:
+        rows = await db.execute(
+            select(ExportedEvent).where(ExportedEvent.event_id.in_([event_id for event_id, _ in batch]))
+        )
+        existing = {row.event_id: row for row in rows.scalars()}
+
+    changed = removed = 0
+    for event_id, event in batch:
+        payload = _event_payload(event) if event is not None else None
+        row = existing.get(event_id)
+        if payload is None:
+            if row is not None:
+                await db.delete(row)
+                removed += 1
             continue
+        encoded = dumps(payload).decode("utf-8")
+        if row is None:
+            db.add(ExportedEvent(
+                event_id=event_id,
+                start_datetime=event.start_datetime,
+                fingerprint=payload["fingerprint"],
+                payload=encoded,
+            ))
+            changed += 1
+        elif row.payload != encoded:
+            row.start_datetime = event.start_datetime
+            row.fingerprint = payload["fingerprint"]
+            row.payload = encoded
+            changed += 1
+    # Write each batch out so the session only ever holds one
+    await db.flush()
+    return changed, removed
+
 
-        seen_fingerprints.add(fingerprint)
-        events_data.append(event_export)
+async def _iter_snapshot(db: AsyncSession) -> AsyncIterator[tuple[bytes, dict]]:
+    """
+    Stream the exported payloads in start order, first event per fingerprint,
+    as (encoded JSON, decoded event) pairs.
+    """
+    result = await db.stream(
+        select(ExportedEvent.fingerprint, ExportedEvent.payload)
+        .order_by(ExportedEvent.start_datetime.asc(), ExportedEvent.event_id)
+        .execution_options(yield_per=STREAM_BATCH_ROWS)
+    )
+    seen_fingerprints: set[str] = set()
+    try:
+        async for fingerprint, payload in result:
+            if fingerprint in seen_fingerprints:
+                continue
+            seen_fingerprints.add(fingerprint)
+            yield payload.encode("utf-8"), json.loads(payload)
+    finally:
+        await result.close()
 
-    with open(EXPORTS_DIR / "events.json", "w", encoding="utf-8") as handle:
-        json.dump({
-            "events": events_data,
-            "generated_at": datetime.utcnow().isoformat(),
-            "count": len(events_data)
-        }, handle, indent=2)
 
+async def _snapshot_head(db: AsyncSession, limit: int) -> list[dict]:
+    events = []
+    async with aclosing(_iter_snapshot(db)) as snapshot:
+        async for _, event in snapshot:
+            events.append(event)
+            if len(events) >= limit:
+                break
+    return events
+
+
+def _shards_stale(today: date) -> bool:
+    """The manifest is missing or its next-7-days window started on another day."""
+    manifest = _read_manifest()
+    upcoming = manifest.get("upcoming") or {}
+    return upcoming.get("from") != today.isoformat()
+
+
+def _read_manifest() -> dict:
+    try:
+        return json.loads((EXPORTS_DIR / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_upcoming(event: dict, start: str, end: str) -> bool:
+    # Multi-day events that are still running count as upcoming
+    return event["date"] <= end and (event.get("endDate") or event["date"]) >= start
+
+
+def _shard_names(event: dict, start: str, end: str) -> list[str]:
+    names = [
+        f"month/{event['date'][:7]}.json",
+        f"category/{slugify(event.get('category') or 'general')}.json",
+    ]
+    if _is_upcoming(event, start, end):
+        names.append("next-7-days.json")
+    return names
+
+
+async def _write_exports(db: AsyncSession, today: date, write_events: bool = True) -> int:
+    """
+    Stream the snapshot once into events.json and its shards:
+    shards/month/YYYY-MM.json, shards/category/<slug>.json and
+    shards/next-7-days.json. Then write manifest.json listing each file's path,
+    event count and content hash. Shards whose hash is unchanged are left as
+    they are, and shards that no longer have events are removed. events.json
+    is only replaced when `write_events` is set. Returns the event count.
+    """
+    start = today.isoformat()
+    end = (today + timedelta(days=UPCOMING_DAYS - 1)).isoformat()
+    shards_dir = EXPORTS_DIR / "shards"
+    previous = {entry["path"]: entry["hash"] for entry in _manifest_entries(_read_manifest())}
+    generated_at = datetime.utcnow().isoformat()
+
+    with ExitStack() as stack:
+        everything = stack.enter_context(JSONArrayWriter(EXPORTS_DIR / "events.json", compress=True))
+        shards: dict[str, JSONArrayWriter] = {}
+
+        def shard(name: str) -> JSONArrayWriter:
+            if name not in shards:
+                shards[name] = stack.enter_context(JSONArrayWriter(shards_dir / name, compress=True))
+            return shards[name]
+
+        shard("next-7-days.json")
+        async with aclosing(_iter_snapshot(db)) as snapshot:
+            async for encoded, event in snapshot:
+                everything.write_raw(encoded)
+                for name in _shard_names(event, start, end):
+                    shard(name).write_raw(encoded)
+
+        if write_events:
+            everything.commit(generated_at=generated_at)
+        rewritten = 0
+        entries = {}
+        for name, writer in sorted(shards.items()):
+            relative = f"shards/{name}"
+            entries[name] = {"path": relative, "count": writer.count, "hash": writer.content_hash}
+            if previous.get(relative) != writer.content_hash or not writer.path.exists():
+                writer.commit(generated_at=generated_at)
+                rewritten += 1
+        # Writers left uncommitted are discarded on exit
+
+    for path in shards_dir.rglob("*.json"):
+        if path.relative_to(shards_dir).as_posix() not in entries:
+            for stale in (path, *compressed_paths(path)):
+                stale.unlink(missing_ok=True)
+
+    write_json(EXPORTS_DIR / "manifest.json", {
+        "generated_at": generated_at,
+        "all": {"path": "events.json", "count": everything.count, "hash": everything.content_hash},
+        "upcoming": {**entries.pop("next-7-days.json"), "from": start, "to": end},
+        "months": {name[6:-5]: entry for name, entry in entries.items() if name.startswith("month/")},
+        "categories": {name[9:-5]: entry for name, entry in entries.items() if name.startswith("category/")},
+    }, compress=True)
+    console.log(f"Wrote {rewritten} of {len(shards)} shards")
+    return everything.count
+
+
+def _manifest_entries(manifest: dict) -> list[dict]:
+    entries = [manifest[key] for key in ("all", "upcoming") if key in manifest]
+    for key in ("months", "categories"):
+        entries.extend((manifest.get(key) or {}).values())
+    return entries
+
+
+async def _export_venues(db: AsyncSession) -> int:
+    """Write venues.json if the active venue list changed since the last export."""
     result = await db.execute(select(Venue).where(Venue.active == True).order_by(Venue.name))
     venues = result.scalars().all()
     venues_data = [
@@ -83,18 +330,25 @@ async def run_export(db: AsyncSession) -> dict:
         for venue in venues
     ]
 
-    with open(EXPORTS_DIR / "venues.json", "w", encoding="utf-8") as handle:
-        json.dump({
-            "venues": venues_data,
-            "generated_at": datetime.utcnow().isoformat()
-        }, handle, indent=2)
-
-    console.log(f"Exported {len(events_data)} events and {len(venues_data)} venues")
+    content_hash = hashlib.sha256(json.dumps(venues_data, sort_keys=True).encode()).hexdigest()
+    checkpoint = await db.get(ExportCheckpoint, "venues")
+    venues_path = EXPORTS_DIR / "venues.json"
+    if checkpoint and checkpoint.content_hash == content_hash and venues_path.exists():
+        return len(venues_data)
 
-    if settings.google_apps_script_url:
-        await _sync_to_google_sheets(events_data)
+    write_json(venues_path, {
+        "venues": venues_data,
+        "generated_at": datetime.utcnow().isoformat()
+    }, compress=True)
 
-    return {"events": len(events_data), "venues": len(venues_data)}
+    if checkpoint is None:
+        checkpoint = ExportCheckpoint(name="venues")
+        db.add(checkpoint)
+    checkpoint.content_hash = content_hash
+    checkpoint.item_count = len(venues_data)
+    checkpoint.written_at = datetime.utcnow()
+    await db.commit()
+    return len(venues_data)
 
 
 async def _sync_to_google_sheets(events_data: list[dict]):
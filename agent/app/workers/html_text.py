@@ -0,0 +1,173 @@
+"""
+HTML text extraction
+Parses a page once, then yields either its noise-stripped text or the
+elements matching event-container selectors. Backends, fastest first:
+selectolax (if installed), lxml, BeautifulSoup; HTML_PARSER_BACKEND forces
+one. All three produce the text BeautifulSoup's get_text(" ", strip=True)
+would. Shared with the botasaurus scraper, so it must not import app settings.
+"""
+from __future__ import annotations
+import os
+import re
+import time
+from functools import lru_cache
+from typing import Iterable
+
+NOISE_TAGS = ("nav", "footer", "script", "style", "aside")
+# BeautifulSoup's get_text never includes these, whether or not they are noise
+_INVISIBLE_TAGS = ("script", "style", "template")
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        # selectolax < 0.3.13
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+try:
+    import lxml.html as _lxml_html
+    from lxml import etree as _etree
+except ImportError:
+    _lxml_html = _etree = None
+
+
+class BS4Document:
+    name = "bs4"
+
+    def __init__(self, html: str):
+        from bs4 import BeautifulSoup
+        self._soup = BeautifulSoup(html, "lxml")
+
+    def select(self, selector: str) -> list:
+        return self._soup.select(selector)
+
+    def node_text(self, node) -> str:
+        return node.get_text(separator=" ", strip=True)
+
+    def page_text(self, drop: Iterable[str] = NOISE_TAGS) -> str:
+        for tag in self._soup.find_all(list(drop)):
+            tag.decompose()
+        return self._soup.get_text(separator=" ", strip=True)
+
+
+_SIMPLE_SELECTOR = re.compile(r"^([a-z][a-z0-9]*)?(?:\[([a-z-]+)\*=['\"]([^'\"]*)['\"]\])?$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def css_to_xpath(selector: str) -> str:
+    """XPath for the selector forms the connectors use: `tag`, `[attr*='x']`, `tag[attr*='x']`."""
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        raise ValueError(f"Unsupported selector for the lxml backend: {selector!r}")
+    tag, attr, value = match.groups()
+    xpath = f"//{tag.lower() if tag else '*'}"
+    if attr:
+        xpath += f"[contains(@{attr}, '{value}')]"
+    return xpath
+
+
+class LxmlDocument:
+    name = "lxml"
+
+    def __init__(self, html: str):
+        try:
+            self._root = _lxml_html.document_fromstring(html) if html.strip() else None
+        except ValueError:
+            # Strings carrying an XML encoding declaration must be parsed as bytes
+            self._root = _lxml_html.document_fromstring(html.encode("utf-8"))
+        except Exception:
+            self._root = None
+        if self._root is not None:
+            # with_tail=False keeps the text that follows a removed element
+            _etree.strip_elements(self._root, *_INVISIBLE_TAGS, with_tail=False)
+
+    def select(self, selector: str) -> list:
+        return self._root.xpath(css_to_xpath(selector)) if self._root is not None else []
+
+    def node_text(self, node) -> str:
+        strings = (s.strip() for s in node.itertext())
+        return " ".join(s for s in strings if s)
+
+    def page_text(self, drop: Iterable[str] = NOISE_TAGS) -> str:
+        if self._root is None:
+            return ""
+        _etree.strip_elements(self._root, *drop, with_tail=False)
+        return self.node_text(self._root)
+
+
+_UNIT_SEPARATOR = "\x1f"
+
+
+def _selectolax_text(node) -> str:
+    # strip=True still emits whitespace-only nodes as empty strings; drop them
+    parts = node.text(separator=_UNIT_SEPARATOR, strip=True).split(_UNIT_SEPARATOR)
+    return " ".join(part for part in parts if part)
+
+
+class SelectolaxDocument:
+    name = "selectolax"
+
+    def __init__(self, html: str):
+        self._tree = _SelectolaxParser(html)
+        self._tree.strip_tags(list(_INVISIBLE_TAGS))
+
+    def select(self, selector: str) -> list:
+        return self._tree.css(selector)
+
+    def node_text(self, node) -> str:
+        return _selectolax_text(node)
+
+    def page_text(self, drop: Iterable[str] = NOISE_TAGS) -> str:
+        self._tree.strip_tags(list(drop))
+        root = self._tree.root
+        return _selectolax_text(root) if root is not None else ""
+
+
+BACKENDS = {"selectolax": SelectolaxDocument, "lxml": LxmlDocument, "bs4": BS4Document}
+
+
+def available_backends() -> list[str]:
+    installed = {"selectolax": _SelectolaxParser is not None, "lxml": _lxml_html is not None, "bs4": True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+def default_backend() -> str:
+    forced = os.environ.get("HTML_PARSER_BACKEND", "").strip().lower()
+    available = available_backends()
+    return forced if forced in available else available[0]
+
+
+def parse_html(html: str, backend: str | None = None):
+    """Parse once; the returned document offers select/node_text/page_text."""
+    return BACKENDS[backend or default_backend()](html or "")
+
+
+def find_containers(document, selectors: Iterable[str], minimum: int = 3) -> list:
+    """Elements for the first selector matching at least `minimum` of them."""
+    for selector in selectors:
+        found = document.select(selector)
+        if len(found) >= minimum:
+            return found
+    return []
+
+
+def benchmark(pages: dict[str, str], selectors: Iterable[str], repeat: int = 5) -> dict[str, dict[str, float]]:
+    """
+    Mean milliseconds per page for each installed backend, covering the
+    connector's work: parse, container texts, then full page text.
+    """
+    selectors = list(selectors)
+    timings: dict[str, dict[str, float]] = {}
+    for backend in available_backends():
+        per_page = {}
+        for name, html in pages.items():
+            started = time.perf_counter()
+            for _ in range(repeat):
+                document = parse_html(html, backend)
+                [document.node_text(node) for node in find_containers(document, selectors)]
+                document.page_text()
+            per_page[name] = (time.perf_counter() - started) * 1000 / repeat
+        timings[backend] = per_page
+    return timings
@@ -4,14 +4,17 @@ Orchestrates the full ingestion pipeline for a single source.
 """
 from __future__ import annotations
 import json
+import uuid
 from datetime import datetime
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.source import Source
-from app.models.event import Event
+from app.models.source import Source, SourcePage
+from app.models.event import Event, EventObservation
 from app.models.review import ReviewQueueItem
 from app.connectors import get_connector
-from app.workers.deduplicator import check_and_handle_duplicate
+from app.connectors.base import NotModified
+from app.workers.deduplicator import CandidateIndex, find_batch_candidates, resolve_duplicate, venue_key
 from app.workers.change_detector import record_observation, compute_hash
 from app.core.config import settings
 from rich.console import Console
@@ -19,13 +22,23 @@ from rich.console import Console
 console = Console()
 
 
-async def run_source(source_id: str, db: AsyncSession) -> dict:
-    """Run the full ingestion pipeline for one source."""
+async def run_source(
+    source_id: str,
+    db: AsyncSession,
+    client: httpx.AsyncClient | None = None,
+    force: bool = False,
+) -> dict:
+    """
+    Run the full ingestion pipeline for one source.
+    `client` is the pooled HTTP client to fetch with; defaults to the shared one.
+    Unless `force` is set, an unchanged source page (304 or same body hash)
+    skips extraction, normalisation and dedup entirely.
+    """
     source = await db.get(Source, source_id)
     if not source:
         raise ValueError(f"Source {source_id} not found")
 
-    stats = {"found": 0, "added": 0, "updated": 0, "queued": 0, "errors": 0}
+    stats = {"found": 0, "added": 0, "updated": 0, "queued": 0, "errors": 0, "unchanged": 0}
 
     try:
         connector = get_connector(
@@ -33,23 +46,40 @@ async def run_source(source_id: str, db: AsyncSession) -> dict:
             source_id=source.id,
             url=source.url,
             name=source.name,
+            client=client,
+            request_delay=source.request_delay,
         )
+        page = await _get_source_page(source, db)
+        if not force:
+            connector.cached_page = {
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+                "body_hash": page.body_hash,
+            }
 
-        events_data = await connector.run()
+        try:
+            events_data = await connector.run()
+        except NotModified:
+            console.log(f"[{source.name}] page unchanged, skipping")
+            stats["unchanged"] = 1
+            source.last_run = source.last_success = datetime.utcnow()
+            source.error_streak = 0
+            # A body-hash match may still bring new validators; keep them so the next run can get a real 304
+            _store_page_state(page, connector.page_state)
+            await db.commit()
+            return stats
         stats["found"] = len(events_data)
+        if getattr(connector, "strategy", None):
+            stats["strategy"] = connector.strategy
 
-        for event_data in events_data:
-            try:
-                await _ingest_event(event_data, source, db, stats)
-            except Exception as e:
-                console.log(f"[{source.name}] ingest error: {e}")
-                stats["errors"] += 1
+        await _ingest_events(events_data, source, db, stats)
 
         # Update source metadata
         source.last_run = datetime.utcnow()
         source.last_success = datetime.utcnow()
         source.events_found_last_run = stats["found"]
         source.error_streak = 0
+        _store_page_state(page, connector.page_state)
         await db.commit()
 
     except Exception as e:
@@ -61,50 +91,124 @@ async def run_source(source_id: str, db: AsyncSession) -> dict:
     return stats
 
 
-async def _ingest_event(event_data: dict, source: Source, db: AsyncSession, stats: dict):
-    """Process one normalised event dict."""
-    title = event_data.get("title", "").strip()
-    if not title:
+async def _get_source_page(source: Source, db: AsyncSession) -> SourcePage:
+    result = await db.execute(select(SourcePage).where(SourcePage.url == source.url))
+    page = result.scalar_one_or_none()
+    if page is None:
+        page = SourcePage(source_id=source.id, url=source.url)
+        db.add(page)
+    return page
+
+
+def _store_page_state(page: SourcePage, state: dict | None):
+    """Persist validators only after a successful run, so a failed run is retried in full."""
+    if not state:
         return
+    now = datetime.utcnow()
+    if state.get("body_hash") != page.body_hash:
+        page.changed_at = now
+    page.etag = state.get("etag")
+    page.last_modified = state.get("last_modified")
+    page.body_hash = state.get("body_hash")
+    page.checked_at = now
+
+
+async def _ingest_events(events_data: list[dict], source: Source, db: AsyncSession, stats: dict):
+    """
+    Ingest a source's events as one batch inside a savepoint: one IN query for
+    known ticket URLs, one blocked candidate query for dedup, one flush. If the
+    batch fails, it is replayed event by event, each in its own savepoint, so
+    one bad event only costs itself. The caller commits.
+    """
+    counts = dict.fromkeys(("added", "updated", "queued", "errors"), 0)
+    try:
+        async with db.begin_nested():
+            await _ingest_batch(events_data, source, db, counts)
+    except Exception as e:
+        console.log(f"[{source.name}] batch ingest failed ({e}), retrying event by event")
+        counts = dict.fromkeys(counts, 0)
+        await _ingest_batch(events_data, source, db, counts, isolate=True)
+    for key, value in counts.items():
+        stats[key] += value
 
-    # Check if we've seen this URL before (change detection)
-    ticket_url = event_data.get("ticket_url") or event_data.get("source_url")
-    content_hash = compute_hash(event_data)
 
-    existing = None
-    if ticket_url:
+async def _ingest_batch(
+    events_data: list[dict],
+    source: Source,
+    db: AsyncSession,
+    stats: dict,
+    isolate: bool = False,
+):
+    """Process normalised event dicts; with `isolate`, each one in its own savepoint."""
+    items = []
+    for event_data in events_data:
+        title = (event_data.get("title") or "").strip()
+        if title:
+            # Ticket URL doubles as the change-detection key
+            ticket_url = event_data.get("ticket_url") or event_data.get("source_url")
+            items.append((event_data, title, ticket_url))
+
+    existing_by_url: dict[str, Event] = {}
+    urls = {url for _, _, url in items if url}
+    if urls:
         result = await db.execute(
-            select(Event).where(Event.ticket_url == ticket_url, Event.canonical == True)
+            select(Event).where(Event.ticket_url.in_(urls), Event.canonical == True)
         )
-        existing = result.scalar_one_or_none()
+        for event in result.scalars():
+            existing_by_url.setdefault(event.ticket_url, event)
 
-    if existing:
-        # Check for changes
-        changed = await record_observation(
-            event=existing,
-            source_url=event_data.get("source_url", source.url),
-            raw_data=json.dumps(event_data),
-            extracted=event_data,
-            db=db,
-        )
-        if changed:
-            stats["updated"] += 1
-        return
+    pending = []
+    for event_data, title, url in items:
+        try:
+            new_event = None if url in existing_by_url else _build_event(event_data, title, url, source)
+        except Exception as e:
+            if not isolate:
+                raise
+            console.log(f"[{source.name}] ingest error: {e}")
+            stats["errors"] += 1
+            continue
+        pending.append((event_data, url, new_event))
+    index = CandidateIndex(await find_batch_candidates([e for _, _, e in pending if e], db))
 
-    # New event — create it
+    for event_data, url, new_event in pending:
+        # An earlier event in this batch may have claimed the URL since
+        existing = existing_by_url.get(url) if url else None
+        try:
+            if isolate:
+                async with db.begin_nested():
+                    outcome = await _ingest_one(event_data, existing, new_event, source, db, index)
+            else:
+                outcome = await _ingest_one(event_data, existing, new_event, source, db, index)
+        except Exception as e:
+            if not isolate:
+                raise
+            console.log(f"[{source.name}] ingest error: {e}")
+            stats["errors"] += 1
+            continue
+        if outcome:
+            stats[outcome] += 1
+        if existing is None and new_event.canonical:
+            index.add(new_event)
+            if url:
+                existing_by_url[url] = new_event
+
+
+def _build_event(event_data: dict, title: str, ticket_url: str | None, source: Source) -> Event:
     confidence = int(event_data.get("confidence", 60))
     auto_approve = confidence >= settings.auto_approve_threshold and source.source_type in ("venue", "council")
 
     tags = event_data.get("tags", [])
     images = event_data.get("images", [])
 
-    event = Event(
+    return Event(
+        id=str(uuid.uuid4()),  # assigned up front so dedup and observations need no flush
         title=title,
         description=event_data.get("description"),
         start_datetime=_parse_dt(event_data.get("start_datetime")),
         end_datetime=_parse_dt(event_data.get("end_datetime")),
         all_day=event_data.get("all_day", False),
         venue_name=event_data.get("venue_name"),
+        venue_key=venue_key(event_data.get("venue_name")),
         ticket_url=ticket_url,
         price_min=event_data.get("price_min"),
         price_max=event_data.get("price_max"),
@@ -117,39 +221,60 @@ async def _ingest_event(event_data: dict, source: Source, db: AsyncSession, stat
         source_id=source.id,
         source_url=event_data.get("source_url"),
         source_name=source.name,
+        canonical=True,
         status="approved" if auto_approve else "pending",
-        content_hash=content_hash,
+        content_hash=compute_hash(event_data),
     )
+
+
+async def _ingest_one(
+    event_data: dict,
+    existing: Event | None,
+    event: Event,
+    source: Source,
+    db: AsyncSession,
+    index: CandidateIndex,
+) -> str | None:
+    """Ingest one event dict; returns the stats key to bump, if any."""
+    if existing:
+        # Seen this URL before: record the observation and detect changes
+        changed = await record_observation(
+            event=existing,
+            source_url=event_data.get("source_url", source.url),
+            raw_data=json.dumps(event_data),
+            extracted=event_data,
+            db=db,
+        )
+        return "updated" if changed else None
+
+    # New event
     db.add(event)
-    await db.flush()  # get ID before dedup check
 
-    # Deduplication
-    is_dup, canonical_id = await check_and_handle_duplicate(event, db)
+    # Deduplication against the in-memory candidate set
+    is_dup, canonical_id = resolve_duplicate(event, index.candidates(event), db)
+    outcome = None
     if is_dup:
-        pass  # merged, not counted as new
-    elif event.status == "pending" and confidence < settings.min_quality_score:
+        index.refresh(canonical_id)  # the merge may have given it a ticket URL or venue
+    elif event.status == "pending" and event.confidence_score < settings.min_quality_score:
         # Queue low-confidence events for review
-        q = ReviewQueueItem(
+        db.add(ReviewQueueItem(
             event_id=event.id,
             reason="low_confidence",
-            notes=f"Confidence: {confidence}",
-        )
-        db.add(q)
-        stats["queued"] += 1
+            notes=f"Confidence: {event.confidence_score}",
+        ))
+        outcome = "queued"
     else:
-        stats["added"] += 1
+        outcome = "added"
 
     # Record observation (evidence)
-    from app.models.event import EventObservation
-    obs = EventObservation(
+    db.add(EventObservation(
         event_id=event.id,
         source_id=source.id,
         source_url=event_data.get("source_url", source.url),
         extracted_json=json.dumps(event_data)[:50000],
-        content_hash=content_hash,
-    )
-    db.add(obs)
-    await db.commit()
+        content_hash=event.content_hash,
+    ))
+    return outcome
 
 
 def _parse_dt(val) -> datetime | None:
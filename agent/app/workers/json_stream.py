@@ -0,0 +1,156 @@
+"""
+Streaming JSON writer
+Writes {"events": [...], ...} documents one item at a time so exports never
+hold the whole payload in memory. Output goes to a temporary file beside the
+target and replaces it with os.replace, so readers never see a half-written
+file. Uses orjson when installed, the standard library otherwise. Also used
+by the botasaurus scraper, so it must not import app settings or models.
+"""
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CHUNK_SIZE = 1 << 16
+
+
+def dumps(obj) -> bytes:
+    """Minified UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compressed_paths(path: Path) -> tuple[Path, Path]:
+    return path.with_name(path.name + ".gz"), path.with_name(path.name + ".br")
+
+
+def _temp_file(target: Path) -> tuple[int, str]:
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    # mkstemp creates 0600; exports are served by other processes
+    os.chmod(tmp, 0o644)
+    return fd, tmp
+
+
+class JSONArrayWriter:
+    """
+    Streams `{"<key>": [item, ...], **fields, "count": n}` to `path`.
+    Nothing is visible at `path` until commit(); abort() (or leaving the
+    `with` block without committing) discards the output. With `compress`,
+    commit() also writes .gz (and .br if brotli is installed) siblings.
+    `content_hash` covers the array items only, so it is stable across runs.
+    """
+
+    def __init__(self, path: Path, key: str = "events", compress: bool = False):
+        self.path = Path(path)
+        self.compress = compress
+        self.count = 0
+        self._hash = hashlib.sha256()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = _temp_file(self.path)
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(b"{" + dumps(key) + b":[")
+
+    @property
+    def content_hash(self) -> str:
+        return self._hash.hexdigest()
+
+    def write(self, item):
+        self.write_raw(dumps(item))
+
+    def write_raw(self, encoded: bytes):
+        """Append an item that is already encoded as JSON."""
+        if self.count:
+            self._file.write(b",")
+            self._hash.update(b",")
+        self._file.write(encoded)
+        self._hash.update(encoded)
+        self.count += 1
+
+    def commit(self, **fields) -> int:
+        fields["count"] = self.count
+        self._file.write(b"]")
+        for name, value in fields.items():
+            self._file.write(b"," + dumps(name) + b":" + dumps(value))
+        self._file.write(b"}")
+        self._file.close()
+        try:
+            if self.compress:
+                _write_compressed(Path(self._tmp), self.path)
+            os.replace(self._tmp, self.path)
+        except BaseException:
+            Path(self._tmp).unlink(missing_ok=True)
+            raise
+        return self.count
+
+    def abort(self):
+        self._file.close()
+        Path(self._tmp).unlink(missing_ok=True)
+
+    def __enter__(self) -> "JSONArrayWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self._file.closed:
+            self.abort()
+
+
+def write_json(path: Path, payload, compress: bool = False):
+    """Atomically write a small document (manifests, venue lists)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _temp_file(path)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(dumps(payload))
+        if compress:
+            _write_compressed(Path(tmp), path)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def write_json_array(path: Path, items: Iterable, key: str = "events", compress: bool = False, **fields) -> int:
+    """Stream `items` into `path`; returns how many were written."""
+    with JSONArrayWriter(path, key, compress) as writer:
+        for item in items:
+            writer.write(item)
+        return writer.commit(**fields)
+
+
+def _write_compressed(source: Path, target: Path):
+    """Write target.gz/.br from the finished temp file at `source`."""
+    gz_path, br_path = compressed_paths(target)
+    fd, gz_tmp = _temp_file(gz_path)
+    # mtime=0 keeps the output (and so its ETag) stable for unchanged content
+    with open(source, "rb") as raw, os.fdopen(fd, "wb") as out:
+        with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=9, mtime=0) as gz:
+            shutil.copyfileobj(raw, gz, CHUNK_SIZE)
+    os.replace(gz_tmp, gz_path)
+
+    if brotli is None:
+        br_path.unlink(missing_ok=True)
+        return
+    fd, br_tmp = _temp_file(br_path)
+    compressor = brotli.Compressor(quality=11)
+    with open(source, "rb") as raw, os.fdopen(fd, "wb") as out:
+        for block in iter(lambda: raw.read(CHUNK_SIZE), b""):
+            out.write(compressor.process(block))
+        out.write(compressor.finish())
+    os.replace(br_tmp, br_path)
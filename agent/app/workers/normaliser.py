@@ -3,6 +3,7 @@ Event Normalisation Engine
 Takes raw extracted data and returns a canonical Event-compatible dict.
 Uses Claude AI for intelligent parsing.
 """
+import asyncio
 import hashlib
 import json
 import re
@@ -10,6 +11,14 @@ from datetime import datetime
 from typing import Any
 import anthropic
 from app.core.config import settings
+from app.workers.ai_cache import ai_cache, cache_key
+from app.workers.ai_gate import ai_gate
+
+AI_MODEL = "claude-haiku-4-5-20251001"
+# Bump whenever the extraction prompts change so cached results are not reused
+PROMPT_VERSION = "1"
+BATCH_PROMPT_VERSION = "batch-1"
+CHARS_PER_TOKEN = 4  # rough estimate used to size batches
 
 
 _client: anthropic.AsyncAnthropic | None = None
@@ -18,7 +27,8 @@ _client: anthropic.AsyncAnthropic | None = None
 def get_client() -> anthropic.AsyncAnthropic:
     global _client
     if _client is None:
-        _client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        # Retries are handled by ai_gate so 429s pause every caller, not just one
+        _client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
     return _client
 
 
@@ -65,17 +75,12 @@ def make_content_hash(title: str, start: str, venue: str) -> str:
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
-async def normalise_with_ai(raw_text: str, source_url: str) -> dict[str, Any]:
-    """Use Claude to extract structured event data from raw HTML/text."""
-    prompt = f"""Extract event information from the following text and return ONLY a valid JSON object.
-
-Source URL: {source_url}
+def clean_text_for_prompt(raw_text: str, limit: int = 6000) -> str:
+    """Collapse whitespace and truncate, so cosmetic page changes still hit the cache."""
+    return " ".join(raw_text.split())[:limit]
 
-Text:
-{raw_text[:6000]}
 
-Return JSON with these fields (use null for missing):
-{{
+EVENT_SCHEMA = """{
   "title": "Full event name",
   "description": "1-3 sentence description",
   "start_datetime": "YYYY-MM-DDTHH:MM:SS or null",
@@ -89,27 +94,151 @@ Return JSON with these fields (use null for missing):
   "tags": ["tag1", "tag2"],
   "images": ["url1"],
   "confidence": 0-100
-}}
+}"""
+
+
+def _parse_json_reply(reply: str) -> Any:
+    reply = reply.strip()
+    # Strip markdown code blocks if present
+    reply = re.sub(r"^```json\s*", "", reply)
+    reply = re.sub(r"\s*```$", "", reply)
+    return json.loads(reply)
+
+
+async def _complete(prompt: str, max_tokens: int) -> str:
+    client = get_client()
+    msg = await ai_gate.call(
+        lambda: client.messages.create(
+            model=AI_MODEL,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ),
+        tokens=len(prompt) // CHARS_PER_TOKEN,
+    )
+    return msg.content[0].text
+
+
+async def normalise_with_ai(raw_text: str, source_url: str) -> dict[str, Any]:
+    """Use Claude to extract structured event data from raw HTML/text."""
+    text = clean_text_for_prompt(raw_text)
+    key = cache_key(PROMPT_VERSION, AI_MODEL, text)
+    cached = await ai_cache.aget(key)
+    if cached is not None:
+        return _post_process(cached)
+
+    prompt = f"""Extract event information from the following text and return ONLY a valid JSON object.
+
+Source URL: {source_url}
+
+Text:
+{text}
+
+Return JSON with these fields (use null for missing):
+{EVENT_SCHEMA}
 
 Only return the JSON object, no explanation."""
 
     try:
-        client = get_client()
-        msg = await client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        text = msg.content[0].text.strip()
-        # Strip markdown code blocks if present
-        text = re.sub(r"^```json\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
-        data = json.loads(text)
+        data = _parse_json_reply(await _complete(prompt, max_tokens=1024))
+        await ai_cache.aput(key, data)
         return _post_process(data)
     except Exception as e:
         return {"error": str(e), "confidence": 0}
 
 
+def pack_batches(texts: list[str], token_budget: int, max_items: int) -> list[list[int]]:
+    """Group text indices into batches whose estimated prompt size fits the token budget."""
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for i, text in enumerate(texts):
+        cost = len(text) // CHARS_PER_TOKEN + 10  # + listing header
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def normalise_batch_with_ai(raw_texts: list[str], source_url: str) -> list[dict[str, Any]]:
+    """
+    Extract one event per text, packing many texts into each Claude call.
+    Returns a dict per input, in order. Cached texts skip the API, and any
+    batch whose reply cannot be mapped back falls back to per-item calls.
+    Batches and fallbacks run concurrently behind ai_gate.
+    """
+    texts = [clean_text_for_prompt(t, settings.ai_batch_item_chars) for t in raw_texts]
+    keys = [cache_key(BATCH_PROMPT_VERSION, AI_MODEL, t) for t in texts]
+    results: list[dict[str, Any] | None] = [None] * len(texts)
+
+    pending = []
+    for i, cached in enumerate(await asyncio.gather(*(ai_cache.aget(key) for key in keys))):
+        if cached is not None:
+            results[i] = _post_process(cached)
+        else:
+            pending.append(i)
+
+    async def run_batch(indices: list[int]):
+        extracted = await _extract_batch([texts[i] for i in indices], source_url)
+        retry = []
+        for local, i in enumerate(indices):
+            data = extracted.get(local)
+            if data is None:
+                # Whole batch unparseable, or this listing was dropped from the reply
+                retry.append(i)
+                continue
+            await ai_cache.aput(keys[i], data)
+            results[i] = _post_process(data)
+        singles = await asyncio.gather(*(normalise_with_ai(raw_texts[i], source_url) for i in retry))
+        for i, data in zip(retry, singles):
+            results[i] = data
+
+    batches = pack_batches([texts[i] for i in pending], settings.ai_batch_token_budget, settings.ai_batch_size)
+    # Batches run concurrently; ai_gate bounds how many reach the API at once
+    await asyncio.gather(*(run_batch([pending[j] for j in batch]) for batch in batches))
+    return results
+
+
+async def _extract_batch(texts: list[str], source_url: str) -> dict[int, dict]:
+    """One Claude call for several listings; returns listing index -> data (empty on failure)."""
+    listings = "\n\n".join(f"### Listing {i}\n{text}" for i, text in enumerate(texts))
+    prompt = f"""Each numbered listing below was cut from one events page. Extract the event described by each listing
+and return ONLY a valid JSON array with exactly one object per listing, in the same order.
+
+Source URL: {source_url}
+
+{listings}
+
+Every object must include "index" (the listing number) plus these fields (use null for missing):
+{EVENT_SCHEMA}
+
+If a listing is not an event, return {{"index": n, "title": null}} for it.
+Only return the JSON array, no explanation."""
+
+    try:
+        reply = await _complete(prompt, max_tokens=min(8192, 400 * len(texts)))
+        items = _parse_json_reply(reply)
+    except Exception:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    out: dict[int, dict] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.pop("index"))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= index < len(texts):
+            out[index] = item
+    return out
+
+
 def _post_process(data: dict) -> dict:
     """Clean and enrich AI output."""
     price_min, price_max, is_free = parse_price(data.get("price_text", "") or "")
@@ -135,8 +264,8 @@ def _post_process(data: dict) -> dict:
     # Auto-detect category if not set or generic
     if not data.get("category") or data["category"] == "general":
         data["category"] = detect_category(
-            data.get("title", ""),
-            data.get("description", "") or "",
+            data.get("title") or "",
+            data.get("description") or "",
         )
 
     return data
@@ -0,0 +1,124 @@
+"""
+Ingestion Orchestrator
+Runs the ingestion pipeline for many sources concurrently.
+A global cap bounds total parallelism, a per-host cap keeps sources that
+share a domain from piling onto it, and every worker gets its own DB session.
+"""
+from __future__ import annotations
+import asyncio
+from datetime import datetime
+from typing import Callable
+from urllib.parse import urlparse
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.job import Job
+from app.models.source import Source
+from app.workers.ingestion_runner import run_source
+from rich.console import Console
+
+console = Console()
+
+STAT_KEYS = ("found", "added", "updated", "queued", "errors", "unchanged")
+
+# Called as on_done(source, stats, error) when each source finishes
+SourceCallback = Callable[[Source, "dict | None", "Exception | None"], None]
+
+
+async def run_sources(
+    source_ids: list[str],
+    client: httpx.AsyncClient | None = None,
+    job_ids: dict[str, str] | None = None,
+    concurrency: int | None = None,
+    per_host: int | None = None,
+    on_done: SourceCallback | None = None,
+    force: bool = False,
+) -> dict:
+    """
+    Ingest `source_ids` concurrently and return aggregated stats.
+    `job_ids` maps source id -> Job id; those jobs are moved through
+    running/done/failed as their source is processed.
+    `force` re-ingests pages even when they are unchanged since the last run.
+    """
+    job_ids = job_ids or {}
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Source).where(Source.id.in_(source_ids)))
+        by_id = {s.id: s for s in result.scalars().all()}
+    sources = [by_id[sid] for sid in source_ids if sid in by_id]
+
+    global_slots = asyncio.Semaphore(concurrency or settings.ingest_concurrency)
+    host_limit = per_host or settings.ingest_per_host
+    host_slots: dict[str, asyncio.Semaphore] = {}
+
+    totals = {k: 0 for k in STAT_KEYS}
+    totals.update(sources=len(sources), succeeded=0, failed=0)
+    per_source: dict[str, dict] = {}
+
+    async def worker(source: Source):
+        host = urlparse(source.url).netloc.lower()
+        host_sem = host_slots.setdefault(host, asyncio.Semaphore(host_limit))
+        async with global_slots, host_sem:
+            stats, error = await _run_one(source, job_ids.get(source.id), client, force)
+
+        if error is None:
+            totals["succeeded"] += 1
+            for k in STAT_KEYS:
+                totals[k] += stats.get(k, 0)
+            per_source[source.id] = stats
+        else:
+            totals["failed"] += 1
+            per_source[source.id] = {"error": str(error)}
+        if on_done:
+            on_done(source, stats, error)
+
+    await asyncio.gather(*(worker(s) for s in sources))
+    totals["per_source"] = per_source
+    return totals
+
+
+async def _run_one(
+    source: Source,
+    job_id: str | None,
+    client: httpx.AsyncClient | None,
+    force: bool = False,
+) -> tuple[dict | None, Exception | None]:
+    """Run one source in its own session, keeping its Job record (if any) up to date."""
+    async with AsyncSessionLocal() as db:
+        job = await db.get(Job, job_id) if job_id else None
+        if job:
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            await db.commit()
+
+        stats, error = None, None
+        try:
+            stats = await run_source(source.id, db, client=client, force=force)
+        except Exception as e:
+            error = e
+            await db.rollback()
+            console.log(f"[{source.name}] ingestion failed: {e}")
+
+        if job:
+            if error is None:
+                job.status = "done"
+                job.events_found = stats.get("found", 0)
+                job.events_added = stats.get("added", 0)
+                job.events_updated = stats.get("updated", 0)
+                job.events_queued = stats.get("queued", 0)
+            else:
+                job.status = "failed"
+                job.error_message = str(error)
+            job.finished_at = datetime.utcnow()
+            await db.commit()
+
+    return stats, error
+
+
+async def queue_scrape_jobs(db: AsyncSession, sources: list[Source]) -> dict[str, str]:
+    """Create a pending scrape Job per source in one commit; returns source id -> job id."""
+    jobs = {s.id: Job(job_type="scrape", source_id=s.id, status="pending") for s in sources}
+    db.add_all(jobs.values())
+    await db.commit()
+    return {source_id: job.id for source_id, job in jobs.items()}
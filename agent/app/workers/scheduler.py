@@ -5,7 +5,6 @@ Runs in its own thread alongside FastAPI.
 """
 import asyncio
 import threading
-from datetime import datetime, timedelta
 from sqlalchemy import select
 import schedule
 import time
@@ -41,34 +40,25 @@ def _job_wrapper(schedule_type: str):
 async def _run_scheduled_jobs(schedule_type: str):
     from app.core.database import AsyncSessionLocal
     from app.models.source import Source
-    from app.workers.ingestion_runner import run_source
+    from app.workers.orchestrator import queue_scrape_jobs, run_sources
     from app.workers.exporter import run_export
-    from app.models.job import Job
+    from app.core.http import create_http_client
 
     console.log(f"Running scheduled jobs: {schedule_type}")
 
-    async with AsyncSessionLocal() as db:
+    # This runs on the scheduler thread's own event loop, so it gets its own pool
+    async with create_http_client() as client, AsyncSessionLocal() as db:
         result = await db.execute(
             select(Source).where(Source.active == True, Source.schedule == schedule_type)
         )
         sources = result.scalars().all()
+        job_ids = await queue_scrape_jobs(db, sources)
 
+        totals = await run_sources(list(job_ids), client=client, job_ids=job_ids)
         for source in sources:
-            job = Job(job_type="scrape", source_id=source.id, status="running", started_at=datetime.utcnow())
-            db.add(job)
-            await db.commit()
-            try:
-                stats = await run_source(source.id, db)
-                job.status = "done"
-                job.events_found = stats.get("found", 0)
-                job.events_added = stats.get("added", 0)
-            except Exception as e:
-                job.status = "failed"
-                job.error_message = str(e)
-                console.log(f"Job failed for {source.name}: {e}")
-            finally:
-                job.finished_at = datetime.utcnow()
-                await db.commit()
+            outcome = totals["per_source"].get(source.id, {})
+            if "error" in outcome:
+                console.log(f"Job failed for {source.name}: {outcome['error']}")
 
         # Export after all sources done
         await run_export(db)
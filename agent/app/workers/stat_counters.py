@@ -0,0 +1,66 @@
+"""
+Dashboard counters
+Reads the incrementally maintained stat_counters table (see app.models.stats)
+together with the few counts that cannot be kept incrementally, in a single
+query. rebuild_counters() recomputes the table from two GROUP BYs.
+"""
+from __future__ import annotations
+from collections import Counter
+from datetime import date, datetime
+from sqlalchemy import select, func, literal, union_all, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import Event
+from app.models.review import ReviewQueueItem
+from app.models.source import Source
+from app.models.stats import StatCounter, event_key, review_key
+from app.models.venue import Venue
+
+
+def rebuild_counters(connection):
+    """Sync helper: replace stat_counters with fresh grouped counts."""
+    events = connection.execute(
+        select(Event.status, Event.canonical, func.count()).group_by(Event.status, Event.canonical)
+    ).all()
+    reviews = connection.execute(
+        select(ReviewQueueItem.status, func.count()).group_by(ReviewQueueItem.status)
+    ).all()
+    counts = Counter()
+    for status, canonical, n in events:
+        counts[event_key(status, canonical)] += n
+    for status, n in reviews:
+        counts[review_key(status)] += n
+    connection.execute(delete(StatCounter))
+    if counts:
+        connection.execute(insert(StatCounter), [{"key": k, "value": v} for k, v in counts.items()])
+
+
+async def dashboard_counts(db: AsyncSession) -> dict:
+    """Every dashboard count in one round trip."""
+    today = date.today()
+    today_start = datetime(today.year, today.month, today.day)
+    stmt = union_all(
+        select(StatCounter.key, StatCounter.value),
+        select(literal("venues"), func.count()).select_from(Venue).where(Venue.active == True),
+        select(literal("sources"), func.count()).select_from(Source).where(Source.active == True),
+        select(literal("today"), func.count()).select_from(Event).where(
+            Event.status == "approved",
+            Event.canonical == True,
+            Event.start_datetime >= today_start,
+        ),
+    )
+    counters = dict((await db.execute(stmt)).all())
+
+    def events(status: str | None = None) -> int:
+        prefix = f"events:{status}:" if status else "events:"
+        return sum(v for k, v in counters.items() if k.startswith(prefix))
+
+    return {
+        "total_events": events(),
+        "approved_events": events("approved"),
+        "pending_events": events("pending"),
+        "review_queue": counters.get(review_key("pending"), 0),
+        "review_resolved": counters.get(review_key("resolved"), 0),
+        "venues": counters.get("venues", 0),
+        "sources": counters.get("sources", 0),
+        "today_events": counters.get("today", 0),
+    }
@@ -0,0 +1,99 @@
+"""
+Page text chunking
+Splits long listing-page text into overlapping windows that break on event
+boundaries (dates, then sentence ends) rather than mid-event, and merges the
+events extracted from each window. Dependency-free so the botasaurus scraper
+can share it.
+"""
+from __future__ import annotations
+import bisect
+import re
+from typing import Callable, Iterable
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DAY = r"(?:mon|tue|tues|wed|thu|thur|thurs|fri|sat|sun)[a-z]*\.?,?"
+
+# Where a listing entry is likely to start: "Fri 12 Jun", "12th June", "June 12", ISO or d/m/y dates
+DATE_BOUNDARY = re.compile(
+    rf"\b(?:{_DAY}\s+\d{{1,2}}(?:st|nd|rd|th)?\b"
+    rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH}(?=\W)"
+    rf"|{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?\b"
+    r"|\d{4}-\d{2}-\d{2}\b"
+    r"|\d{1,2}/\d{1,2}/\d{2,4}\b)",
+    re.IGNORECASE,
+)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?|»])\s+|\n+")
+
+
+def _last_in(positions: list[int], low: int, high: int) -> int | None:
+    i = bisect.bisect_right(positions, high) - 1
+    return positions[i] if i >= 0 and positions[i] > low else None
+
+
+def _first_in(positions: list[int], low: int, high: int) -> int | None:
+    i = bisect.bisect_left(positions, low)
+    return positions[i] if i < len(positions) and positions[i] < high else None
+
+
+def chunk_text(text: str, max_chars: int = 8000, overlap: int = 600, max_chunks: int | None = None) -> list[str]:
+    """
+    Split `text` into windows of at most `max_chars`. Each window ends just
+    before a date if one falls in its second half, else at a sentence end,
+    else at whitespace. The next window starts up to `overlap` characters
+    earlier, at a boundary where possible, so an event cut at the edge is seen
+    whole by one of the two windows.
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+    overlap = min(overlap, max_chars // 4)
+    dates = [m.start() for m in DATE_BOUNDARY.finditer(text)]
+    sentences = [m.end() for m in SENTENCE_BOUNDARY.finditer(text)]
+    spaces = [m.start() for m in re.finditer(r"\s", text)]
+
+    chunks: list[str] = []
+    start = 0
+    while start < len(text):
+        if max_chunks and len(chunks) == max_chunks:
+            break
+        end = start + max_chars
+        if end >= len(text):
+            chunks.append(text[start:].strip())
+            break
+        floor = start + max_chars // 2
+        cut = (
+            _last_in(dates, floor, end)
+            or _last_in(sentences, floor, end)
+            or _last_in(spaces, floor, end)
+            or end
+        )
+        chunks.append(text[start:cut].strip())
+        back = cut - overlap
+        start = (
+            _first_in(dates, back, cut)
+            or _first_in(sentences, back, cut)
+            or _first_in(spaces, back, cut)
+            or back
+        )
+    return [chunk for chunk in chunks if chunk]
+
+
+def _filled(record: dict) -> int:
+    return sum(1 for value in record.values() if value not in (None, "", [], {}))
+
+
+def merge_chunk_results(results: Iterable[list[dict]], key: Callable[[dict], tuple]) -> list[dict]:
+    """
+    Concatenate per-chunk extractions in chunk order, keeping one record per
+    `key` (the most complete one, in the position it was first seen).
+    """
+    merged: dict[tuple, dict] = {}
+    for events in results:
+        for event in events:
+            k = key(event)
+            current = merged.get(k)
+            if current is None:
+                merged[k] = event
+            elif _filled(event) > _filled(current):
+                merged[k] = event
+    return list(merged.values())
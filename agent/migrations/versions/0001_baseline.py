@@ -0,0 +1,156 @@
+"""Baseline: the schema init_db() created before migrations existed
+
+Databases created by `python run.py seed` before this point should be
+stamped rather than upgraded: `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _id():
+    return sa.Column("id", sa.String(36), primary_key=True)
+
+
+def _created():
+    return sa.Column("created_at", sa.DateTime, server_default=sa.func.now(), nullable=False)
+
+
+def _updated():
+    return sa.Column("updated_at", sa.DateTime, server_default=sa.func.now(), nullable=False)
+
+
+def upgrade():
+    op.create_table(
+        "venues",
+        _id(),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("slug", sa.String(255), unique=True, nullable=False),
+        sa.Column("aliases", sa.Text, nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("address", sa.Text),
+        sa.Column("postcode", sa.String(20)),
+        sa.Column("lat", sa.Float),
+        sa.Column("lng", sa.Float),
+        sa.Column("website", sa.Text),
+        sa.Column("inside_norwich", sa.Boolean, nullable=False),
+        sa.Column("allowed_outside_boundary", sa.Boolean, nullable=False),
+        sa.Column("active", sa.Boolean, nullable=False),
+        _created(),
+        _updated(),
+    )
+    op.create_table(
+        "venue_sources",
+        _id(),
+        sa.Column("venue_id", sa.String(36), nullable=False),
+        sa.Column("source_id", sa.String(36), nullable=False),
+        sa.Column("scrape_url", sa.Text),
+        sa.Column("scrape_method", sa.String(50), nullable=False),
+        sa.Column("last_scraped", sa.DateTime),
+        sa.Column("active", sa.Boolean, nullable=False),
+        _created(),
+    )
+    op.create_table(
+        "sources",
+        _id(),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("url", sa.Text, nullable=False),
+        sa.Column("connector_type", sa.String(50), nullable=False),
+        sa.Column("source_type", sa.String(50), nullable=False),
+        sa.Column("priority", sa.Integer, nullable=False),
+        sa.Column("active", sa.Boolean, nullable=False),
+        sa.Column("schedule", sa.String(50), nullable=False),
+        sa.Column("last_run", sa.DateTime),
+        sa.Column("last_success", sa.DateTime),
+        sa.Column("error_streak", sa.Integer, nullable=False),
+        sa.Column("events_found_last_run", sa.Integer, nullable=False),
+        sa.Column("notes", sa.Text),
+        _created(),
+    )
+    op.create_table(
+        "events",
+        _id(),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("description", sa.Text),
+        sa.Column("start_datetime", sa.DateTime),
+        sa.Column("end_datetime", sa.DateTime),
+        sa.Column("all_day", sa.Boolean, nullable=False),
+        sa.Column("venue_id", sa.String(36)),
+        sa.Column("venue_name", sa.String(255)),
+        sa.Column("organiser_id", sa.String(36)),
+        sa.Column("ticket_url", sa.Text),
+        sa.Column("price_min", sa.Numeric(10, 2)),
+        sa.Column("price_max", sa.Numeric(10, 2)),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("is_free", sa.Boolean, nullable=False),
+        sa.Column("age_restriction", sa.String(20)),
+        sa.Column("tags", sa.Text, nullable=False),
+        sa.Column("images", sa.Text, nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("featured", sa.Boolean, nullable=False),
+        sa.Column("editors_choice", sa.Boolean, nullable=False),
+        sa.Column("confidence_score", sa.Integer, nullable=False),
+        sa.Column("source_id", sa.String(36)),
+        sa.Column("source_url", sa.Text),
+        sa.Column("source_name", sa.String(255)),
+        sa.Column("canonical", sa.Boolean, nullable=False),
+        sa.Column("duplicate_of", sa.String(36)),
+        sa.Column("content_hash", sa.String(64)),
+        _created(),
+        _updated(),
+    )
+    op.create_table(
+        "event_observations",
+        _id(),
+        sa.Column("event_id", sa.String(36), nullable=False),
+        sa.Column("source_id", sa.String(36)),
+        sa.Column("source_url", sa.Text, nullable=False),
+        sa.Column("observed_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+        sa.Column("raw_data", sa.Text),
+        sa.Column("screenshot_path", sa.Text),
+        sa.Column("extracted_json", sa.Text),
+        sa.Column("content_hash", sa.String(64)),
+    )
+    op.create_table(
+        "review_queue",
+        _id(),
+        sa.Column("event_id", sa.String(36), nullable=False),
+        sa.Column("reason", sa.String(100), nullable=False),
+        sa.Column("notes", sa.Text),
+        sa.Column("duplicate_candidate_id", sa.String(36)),
+        sa.Column("duplicate_score", sa.Integer),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("resolved_at", sa.DateTime),
+        sa.Column("resolved_by", sa.String(100)),
+        _created(),
+    )
+    op.create_table(
+        "jobs",
+        _id(),
+        sa.Column("job_type", sa.String(50), nullable=False),
+        sa.Column("source_id", sa.String(36)),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("events_found", sa.Integer, nullable=False),
+        sa.Column("events_added", sa.Integer, nullable=False),
+        sa.Column("events_updated", sa.Integer, nullable=False),
+        sa.Column("events_queued", sa.Integer, nullable=False),
+        sa.Column("error_message", sa.Text),
+        sa.Column("log", sa.Text),
+        sa.Column("started_at", sa.DateTime),
+        sa.Column("finished_at", sa.DateTime),
+        _created(),
+    )
+
+
+def downgrade():
+    for table in ("jobs", "review_queue", "event_observations", "events", "sources", "venue_sources", "venues"):
+        op.drop_table(table)
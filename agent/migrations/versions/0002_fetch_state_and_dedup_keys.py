@@ -0,0 +1,49 @@
+"""Per-source request delay, conditional-GET page state, dedup blocking keys
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    # Each step is skipped if create_all already made it (see app.core.database.migrate)
+    if not _has_column("sources", "request_delay"):
+        op.add_column("sources", sa.Column("request_delay", sa.Float))
+    op.create_table(
+        "source_pages",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("source_id", sa.String(36)),
+        sa.Column("url", sa.Text, nullable=False, unique=True),
+        sa.Column("etag", sa.Text),
+        sa.Column("last_modified", sa.String(64)),
+        sa.Column("body_hash", sa.String(64)),
+        sa.Column("checked_at", sa.DateTime),
+        sa.Column("changed_at", sa.DateTime),
+        if_not_exists=True,
+    )
+    if not _has_column("events", "venue_key"):
+        op.add_column("events", sa.Column("venue_key", sa.String(255)))
+    op.create_index("ix_events_venue_key", "events", ["venue_key"], if_not_exists=True)
+    op.create_index("ix_events_start_datetime", "events", ["start_datetime"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_events_start_datetime", table_name="events")
+    op.drop_index("ix_events_venue_key", table_name="events")
+    with op.batch_alter_table("events") as batch:
+        batch.drop_column("venue_key")
+    op.drop_table("source_pages")
+    with op.batch_alter_table("sources") as batch:
+        batch.drop_column("request_delay")
@@ -0,0 +1,36 @@
+"""Indexes for the ingest, listing, export and review query paths
+
+ticket_url is unbounded Text, so Postgres gets a hash index (equality is the
+only lookup) and MySQL a 255-char prefix; SQLite takes a plain B-tree.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_events_status_canonical_start", "events", ["status", "canonical", "start_datetime"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_events_ticket_url", "events", ["ticket_url"], postgresql_using="hash", mysql_length=255,
+        if_not_exists=True,
+    )
+    op.create_index("ix_event_observations_event_id", "event_observations", ["event_id"], if_not_exists=True)
+    op.create_index("ix_review_queue_status_created", "review_queue", ["status", "created_at"], if_not_exists=True)
+    op.create_index("ix_sources_url", "sources", ["url"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_sources_url", table_name="sources")
+    op.drop_index("ix_review_queue_status_created", table_name="review_queue")
+    op.drop_index("ix_event_observations_event_id", table_name="event_observations")
+    op.drop_index("ix_events_ticket_url", table_name="events")
+    op.drop_index("ix_events_status_canonical_start", table_name="events")
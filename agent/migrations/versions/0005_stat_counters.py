@@ -0,0 +1,28 @@
+"""Incrementally maintained dashboard counters
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.workers.stat_counters import rebuild_counters
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stat_counters",
+        sa.Column("key", sa.String(100), primary_key=True),
+        sa.Column("value", sa.Integer, nullable=False),
+        if_not_exists=True,
+    )
+    rebuild_counters(op.get_bind())
+
+
+def downgrade():
+    op.drop_table("stat_counters")
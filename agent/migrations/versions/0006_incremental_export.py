@@ -0,0 +1,41 @@
+"""Incremental export snapshot and checkpoints
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "exported_events",
+        sa.Column("event_id", sa.String(36), primary_key=True),
+        sa.Column("start_datetime", sa.DateTime),
+        sa.Column("fingerprint", sa.Text, nullable=False),
+        sa.Column("payload", sa.Text, nullable=False),
+        sa.Column("exported_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_exported_events_start_datetime", "exported_events", ["start_datetime"], if_not_exists=True)
+    op.create_table(
+        "export_checkpoints",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("high_water", sa.DateTime),
+        sa.Column("content_hash", sa.String(64)),
+        sa.Column("item_count", sa.Integer, nullable=False),
+        sa.Column("written_at", sa.DateTime),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_table("export_checkpoints")
+    op.drop_index("ix_exported_events_start_datetime", table_name="exported_events")
+    op.drop_table("exported_events")
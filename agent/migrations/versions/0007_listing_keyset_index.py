@@ -0,0 +1,25 @@
+"""Add id to the public listing index so cursor pages seek on (start_datetime, id)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_events_status_canonical_start_id", "events", ["status", "canonical", "start_datetime", "id"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_events_status_canonical_start", table_name="events", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_events_status_canonical_start", "events", ["status", "canonical", "start_datetime"])
+    op.drop_index("ix_events_status_canonical_start_id", table_name="events")
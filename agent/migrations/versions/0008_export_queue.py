@@ -0,0 +1,38 @@
+"""Queue event changes for the exporter instead of tracking an updated_at high-water mark
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    op.create_table(
+        "export_queue",
+        sa.Column("event_id", sa.String(36), primary_key=True),
+        sa.Column("version", sa.Integer, nullable=False),
+        if_not_exists=True,
+    )
+    if _has_column("export_checkpoints", "high_water"):
+        with op.batch_alter_table("export_checkpoints") as batch:
+            batch.drop_column("high_water")
+    # Changes made since the last export were never queued: rebuild on the next run
+    op.execute("DELETE FROM export_checkpoints WHERE name = 'events'")
+
+
+def downgrade():
+    with op.batch_alter_table("export_checkpoints") as batch:
+        batch.add_column(sa.Column("high_water", sa.DateTime))
+    op.execute("DELETE FROM export_checkpoints WHERE name = 'events'")
+    op.drop_table("export_queue")
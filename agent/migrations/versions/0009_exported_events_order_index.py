@@ -0,0 +1,24 @@
+"""Add event_id to the exported_events start index so the snapshot streams in index order
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_exported_events_start_event", "exported_events", ["start_datetime", "event_id"], if_not_exists=True
+    )
+    op.drop_index("ix_exported_events_start_datetime", table_name="exported_events", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_exported_events_start_datetime", "exported_events", ["start_datetime"])
+    op.drop_index("ix_exported_events_start_event", table_name="exported_events")
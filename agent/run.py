@@ -6,9 +6,13 @@ Usage:
   python run.py seed            # Seed database with sources/venues
   python run.py scrape          # Scrape all active sources now
   python run.py scrape <id>     # Scrape one source by ID
-  python run.py export          # Export events.json + venues.json
+  python run.py scrape --force  # Re-ingest even pages unchanged since the last run
+  python run.py export          # Export events.json + venues.json (changes since last export)
+  python run.py export --full   # Rebuild the export from every approved event
   python run.py dedup           # Run deduplication pass
+  python run.py reindex         # Rebuild the event search index and dashboard counters
   python run.py status          # Show system status
+  python run.py bench-html [files...]  # Time the HTML parser backends (default: test fixtures)
 """
 import asyncio
 import sys
@@ -34,46 +38,53 @@ async def cmd_seed():
     console.print("[green]✓ Seed complete[/green]")
 
 
-async def cmd_scrape(source_id: str | None = None):
+async def cmd_scrape(source_id: str | None = None, force: bool = False):
     from app.core.database import AsyncSessionLocal, init_db
+    from app.core.http import http_client_scope
     from app.models.source import Source
-    from app.workers.ingestion_runner import run_source
+    from app.workers.orchestrator import run_sources
     from sqlalchemy import select
 
     await init_db()
     async with AsyncSessionLocal() as db:
         if source_id:
-            sources = [await db.get(Source, source_id)]
-            if not sources[0]:
+            if not await db.get(Source, source_id):
                 console.print(f"[red]Source {source_id} not found[/red]")
                 return
+            source_ids = [source_id]
         else:
-            result = await db.execute(select(Source).where(Source.active == True))
-            sources = result.scalars().all()
+            result = await db.execute(select(Source.id).where(Source.active == True))
+            source_ids = list(result.scalars().all())
 
-        console.print(f"[cyan]Scraping {len(sources)} sources...[/cyan]")
-        total = {"found": 0, "added": 0, "updated": 0, "queued": 0}
+    console.print(f"[cyan]Scraping {len(source_ids)} sources...[/cyan]")
 
-        for source in sources:
-            try:
-                console.print(f"  → {source.name}...", end="")
-                stats = await run_source(source.id, db)
-                console.print(f" found={stats['found']} added={stats['added']} queued={stats['queued']}")
-                for k in total:
-                    total[k] += stats.get(k, 0)
-            except Exception as e:
-                console.print(f" [red]ERROR: {e}[/red]")
+    def report(source, stats, error):
+        if error:
+            console.print(f"  → {source.name}: [red]ERROR: {error}[/red]")
+        elif stats.get("unchanged"):
+            console.print(f"  → {source.name}: unchanged")
+        else:
+            console.print(
+                f"  → {source.name}: found={stats['found']} added={stats['added']} queued={stats['queued']}"
+            )
+
+    async with http_client_scope() as client:
+        totals = await run_sources(source_ids, client=client, on_done=report, force=force)
 
-        console.print(f"\n[green]✓ Done: {total}[/green]")
+    summary = {k: totals[k] for k in ("found", "added", "updated", "queued", "unchanged")}
+    console.print(f"\n[green]✓ Done: {summary} ({totals['failed']} sources failed)[/green]")
 
 
-async def cmd_export():
+async def cmd_export(full: bool = False):
     from app.core.database import AsyncSessionLocal, init_db
     from app.workers.exporter import run_export
     await init_db()
     async with AsyncSessionLocal() as db:
-        result = await run_export(db)
-        console.print(f"[green]✓ Exported {result['events']} events, {result['venues']} venues[/green]")
+        result = await run_export(db, full=full)
+        console.print(
+            f"[green]✓ Exported {result['events']} events, {result['venues']} venues "
+            f"({result['changed']} changed, {result['removed']} removed)[/green]"
+        )
         console.print("  → exports/events.json")
         console.print("  → exports/venues.json")
 
@@ -87,31 +98,58 @@ async def cmd_dedup():
         console.print(f"[green]✓ Dedup complete: {result}[/green]")
 
 
+async def cmd_reindex():
+    from app.core.database import engine, init_db
+    from app.core.search import rebuild_search_index
+    from app.workers.stat_counters import rebuild_counters
+    await init_db()
+    async with engine.begin() as conn:
+        await conn.run_sync(rebuild_search_index)
+        await conn.run_sync(rebuild_counters)
+    console.print("[green]✓ Search index and dashboard counters rebuilt[/green]")
+
+
 async def cmd_status():
     from app.core.database import AsyncSessionLocal, init_db
-    from app.models.event import Event
-    from app.models.source import Source
-    from app.models.review import ReviewQueueItem
-    from sqlalchemy import select, func
+    from app.workers.ai_cache import ai_cache
+    from app.workers.stat_counters import dashboard_counts
     await init_db()
     async with AsyncSessionLocal() as db:
-        total = (await db.execute(select(func.count()).select_from(Event))).scalar()
-        approved = (await db.execute(select(func.count()).select_from(Event).where(Event.status == "approved"))).scalar()
-        pending = (await db.execute(select(func.count()).select_from(Event).where(Event.status == "pending"))).scalar()
-        queue = (await db.execute(select(func.count()).select_from(ReviewQueueItem).where(ReviewQueueItem.status == "pending"))).scalar()
-        sources = (await db.execute(select(func.count()).select_from(Source).where(Source.active == True))).scalar()
+        counts = await dashboard_counts(db)
 
         t = Table(title="Norwich Events Hub — Status")
         t.add_column("Metric", style="cyan")
         t.add_column("Value", style="white")
-        t.add_row("Total Events", str(total))
-        t.add_row("Approved", str(approved))
-        t.add_row("Pending", str(pending))
-        t.add_row("Review Queue", str(queue))
-        t.add_row("Active Sources", str(sources))
+        t.add_row("Total Events", str(counts["total_events"]))
+        t.add_row("Approved", str(counts["approved_events"]))
+        t.add_row("Pending", str(counts["pending_events"]))
+        t.add_row("Review Queue", str(counts["review_queue"]))
+        t.add_row("Active Sources", str(counts["sources"]))
+        cache = ai_cache.counters()
+        if cache["enabled"]:
+            t.add_row("AI Cache Entries", str(cache["entries"]))
+            t.add_row("AI Cache Hits / Misses", f"{cache['hits']} / {cache['misses']} ({cache['hit_rate']:.0%})")
         console.print(t)
 
 
+def cmd_bench_html(paths: list[str]):
+    from pathlib import Path
+    from app.connectors.html_connector import CONTAINER_SELECTORS
+    from app.workers.html_text import benchmark, default_backend
+
+    files = [Path(p) for p in paths] or sorted((Path(__file__).parent / "tests" / "fixtures" / "html").glob("*.html"))
+    pages = {f.name: f.read_text(encoding="utf-8", errors="replace") for f in files}
+    timings = benchmark(pages, CONTAINER_SELECTORS)
+
+    t = Table(title=f"HTML parsing, ms per page (default backend: {default_backend()})")
+    t.add_column("Page", style="cyan")
+    for backend in timings:
+        t.add_column(backend, justify="right")
+    for name in pages:
+        t.add_row(name, *(f"{per_page[name]:.2f}" for per_page in timings.values()))
+    console.print(t)
+
+
 if __name__ == "__main__":
     args = sys.argv[1:]
     cmd = args[0] if args else "server"
@@ -121,12 +159,17 @@ if __name__ == "__main__":
     elif cmd == "seed":
         asyncio.run(cmd_seed())
     elif cmd == "scrape":
-        asyncio.run(cmd_scrape(args[1] if len(args) > 1 else None))
+        rest = [a for a in args[1:] if a != "--force"]
+        asyncio.run(cmd_scrape(rest[0] if rest else None, force="--force" in args))
     elif cmd == "export":
-        asyncio.run(cmd_export())
+        asyncio.run(cmd_export(full="--full" in args))
     elif cmd == "dedup":
         asyncio.run(cmd_dedup())
+    elif cmd == "reindex":
+        asyncio.run(cmd_reindex())
     elif cmd == "status":
         asyncio.run(cmd_status())
+    elif cmd == "bench-html":
+        cmd_bench_html(args[1:])
     else:
         console.print(__doc__)
@@ -0,0 +1,72 @@
+"""
+Shared database test case
+Importing this module points the app settings at an in-memory SQLite database,
+so test modules import it before anything under app.models or app.workers.
+"""
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+if str(AGENT_ROOT) not in sys.path:
+    sys.path.insert(0, str(AGENT_ROOT))
+
+from app.core.config import settings  # noqa: E402
+
+# Models bind to the app engine at import; tests use their own in-memory one
+settings.database_url = settings.database_url or "sqlite+aiosqlite://"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.database import Base, enable_sqlite_savepoints, get_db  # noqa: E402
+
+
+class AsyncDBTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    A fresh in-memory schema per test: `self.engine`, `self.sessions` and an
+    open session `self.db`. Set `savepoints = True` for code that nests
+    transactions, as the app engine does, and `shared_connection = False` to
+    give each session its own connection (to a temporary database file), so
+    concurrent sessions commit and roll back independently as on a server.
+    """
+
+    savepoints = False
+    shared_connection = True
+
+    async def asyncSetUp(self):
+        if self.shared_connection:
+            # StaticPool: every session shares the one in-memory connection
+            self.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        else:
+            tmp = TemporaryDirectory()
+            self.addCleanup(tmp.cleanup)
+            self.engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp.name) / 'test.db'}")
+        self.addAsyncCleanup(self.engine.dispose)
+        if self.savepoints:
+            enable_sqlite_savepoints(self.engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.create_schema)
+        self.sessions = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        self.db = self.sessions()
+        self.addAsyncCleanup(self.db.close)
+
+    def create_schema(self, conn):
+        Base.metadata.create_all(conn)
+
+    def client_for(self, *routers) -> httpx.AsyncClient:
+        """ASGI client for an app serving `routers`, with get_db bound to this database."""
+        async def override_db():
+            async with self.sessions() as db:
+                yield db
+
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_db] = override_db
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+        self.addAsyncCleanup(client.aclose)
+        return client
@@ -0,0 +1,94 @@
+import sqlite3
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.workers import normaliser  # noqa: E402
+from app.workers.ai_cache import AIExtractionCache, cache_key  # noqa: E402
+
+
+class AIExtractionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "ai.sqlite3"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_key_depends_on_prompt_version_model_and_text(self):
+        base = cache_key("1", "model-a", "Jazz night")
+        self.assertEqual(base, cache_key("1", "model-a", "Jazz night"))
+        self.assertNotEqual(base, cache_key("2", "model-a", "Jazz night"))
+        self.assertNotEqual(base, cache_key("1", "model-b", "Jazz night"))
+        self.assertNotEqual(base, cache_key("1", "model-a", "Folk night"))
+
+    def test_hit_miss_counters(self):
+        cache = AIExtractionCache(str(self.path), ttl_seconds=60, max_entries=10)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", {"title": "Jazz night"})
+        self.assertEqual(cache.get("k"), {"title": "Jazz night"})
+        counters = cache.counters()
+        self.assertEqual((counters["hits"], counters["misses"], counters["stores"]), (1, 1, 1))
+        self.assertEqual(counters["hit_rate"], 0.5)
+
+    def test_counters_survive_reopen(self):
+        AIExtractionCache(str(self.path), ttl_seconds=60, max_entries=10).put("k", {"title": "x"})
+        reopened = AIExtractionCache(str(self.path), ttl_seconds=60, max_entries=10)
+        self.assertEqual(reopened.get("k"), {"title": "x"})
+        self.assertEqual(reopened.counters()["stores"], 1)
+
+    def test_ttl_expiry(self):
+        cache = AIExtractionCache(str(self.path), ttl_seconds=60, max_entries=10)
+        with patch("app.workers.ai_cache.time.time", return_value=1000.0):
+            cache.put("k", {"title": "x"})
+        with patch("app.workers.ai_cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.counters()["entries"], 0)
+
+    def test_lru_eviction(self):
+        cache = AIExtractionCache(str(self.path), ttl_seconds=float("inf"), max_entries=2)
+        with patch("app.workers.ai_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("a", {"n": 1})
+            cache.put("b", {"n": 2})
+            cache.get("a")  # a is now more recently used than b
+            cache.put("c", {"n": 3})
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.counters()["evictions"], 1)
+
+    def test_get_does_not_write(self):
+        cache = AIExtractionCache(str(self.path), ttl_seconds=60, max_entries=10)
+        cache.put("k", {"title": "x"})
+        statements = []
+        cache._db().set_trace_callback(statements.append)
+        cache.get("k")
+        cache.get("missing")
+        self.assertTrue(statements)
+        self.assertTrue(all(sql.lstrip().upper().startswith("SELECT") for sql in statements), statements)
+        counters = cache.counters()
+        self.assertEqual((counters["hits"], counters["misses"]), (1, 1))
+
+
+class NormaliserCacheFailureTest(unittest.IsolatedAsyncioTestCase):
+    async def test_broken_cache_falls_back_to_the_model(self):
+        broken = AIExtractionCache("unused", ttl_seconds=60, max_entries=10)
+        reply = '{"title": "Jazz Night", "start_datetime": "2026-06-12T19:30:00", "confidence": 90}'
+        with patch.object(broken, "get", side_effect=sqlite3.OperationalError("database is locked")), \
+                patch.object(broken, "put", side_effect=sqlite3.DatabaseError("file is not a database")), \
+                patch.object(normaliser, "ai_cache", broken), \
+                patch.object(normaliser, "_complete", AsyncMock(return_value=reply)) as complete:
+            data = await normaliser.normalise_with_ai("Jazz Night, Friday 12 June 2026 at 19:30", "https://x.example")
+            batch = await normaliser.normalise_batch_with_ai(["Folk Session on Sunday"], "https://x.example")
+        self.assertEqual(data["title"], "Jazz Night")
+        self.assertNotIn("error", data)
+        self.assertEqual(len(batch), 1)
+        self.assertGreaterEqual(complete.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
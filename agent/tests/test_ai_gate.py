@@ -0,0 +1,89 @@
+import asyncio
+import time
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.workers.ai_gate import AIGate  # noqa: E402
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def _gate(**overrides) -> AIGate:
+    options = dict(max_concurrency=2, requests_per_minute=6000, tokens_per_minute=10_000_000, max_retries=3)
+    options.update(overrides)
+    return AIGate(**options)
+
+
+class AIGateTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrency_cap_and_queue_depth(self):
+        gate = _gate()
+        peak = 0
+        snapshots = []
+
+        async def work():
+            nonlocal peak
+            peak = max(peak, gate.in_flight)
+            snapshots.append(gate.snapshot())
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        results = await asyncio.gather(*(gate.call(work, tokens=10) for _ in range(6)))
+        self.assertEqual(results, ["ok"] * 6)
+        self.assertEqual(peak, 2)
+        self.assertTrue(any(s["waiting"] > 0 for s in snapshots))
+        self.assertEqual(gate.snapshot()["completed"], 6)
+
+    async def test_429_honours_retry_after(self):
+        gate = _gate()
+        calls = []
+
+        async def work():
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise FakeStatusError(429, {"retry-after": "0.2"})
+            return "ok"
+
+        self.assertEqual(await gate.call(work, tokens=10), "ok")
+        self.assertGreaterEqual(calls[1] - calls[0], 0.19)
+        self.assertEqual(gate.snapshot()["rate_limited"], 1)
+
+    async def test_client_errors_are_not_retried(self):
+        gate = _gate()
+        attempts = 0
+
+        async def work():
+            nonlocal attempts
+            attempts += 1
+            raise FakeStatusError(400)
+
+        with self.assertRaises(FakeStatusError):
+            await gate.call(work, tokens=10)
+        self.assertEqual(attempts, 1)
+        self.assertEqual(gate.snapshot()["failed"], 1)
+
+    async def test_gives_up_after_max_retries(self):
+        gate = _gate(max_retries=2)
+        attempts = 0
+
+        async def work():
+            nonlocal attempts
+            attempts += 1
+            raise FakeStatusError(429, {"retry-after": "0"})
+
+        with self.assertRaises(FakeStatusError):
+            await gate.call(work, tokens=10)
+        self.assertEqual(attempts, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
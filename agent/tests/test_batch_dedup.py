@@ -0,0 +1,107 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import delete, select  # noqa: E402
+
+from app.models.event import Event  # noqa: E402
+from app.models.review import ReviewQueueItem  # noqa: E402
+from app.workers import deduplicator  # noqa: E402
+
+TITLES = ["Jazz Night", "jazz night live", "Comedy Club", "Folk Session", "Night of Jazz", "Pub Quiz", ""]
+VENUES = ["Norwich Arts Centre", "norwich arts centre ", "The Halls", "Halls, The", None, ""]
+TICKETS = ["https://t.example.com/1", "https://t.example.com/2", None]
+
+
+def _random_events(n: int, seed: int) -> list[Event]:
+    rng = random.Random(seed)
+    base = datetime(2026, 6, 12, 19, 0)
+    events = []
+    for i in range(n):
+        start = base + timedelta(hours=rng.choice([0, 1, 3, 24, 49])) if rng.random() > 0.1 else None
+        events.append(Event(
+            id=f"e{i}",
+            title=rng.choice(TITLES),
+            venue_name=rng.choice(VENUES),
+            ticket_url=rng.choice(TICKETS),
+            start_datetime=start,
+        ))
+    return events
+
+
+class BatchDedupTest(AsyncDBTestCase):
+    def test_score_matrix_matches_score_pair(self):
+        rows, cols = _random_events(40, seed=1), _random_events(60, seed=2)
+        matrix = deduplicator.score_matrix(deduplicator._features(rows), deduplicator._features(cols))
+        expected = [[deduplicator.score_pair(a, b) for b in cols] for a in rows]
+        self.assertEqual(matrix.tolist(), expected)
+
+    async def test_pass_merges_and_queues(self):
+        db = self.db
+        start = datetime(2026, 6, 12, 19, 30)
+        db.add_all([
+            Event(id="a", title="Jazz Night", venue_name="Norwich Arts Centre", start_datetime=start,
+                  status="approved", created_at=datetime(2026, 1, 1)),
+            Event(id="b", title="Jazz Night", venue_name="Norwich Arts Centre", start_datetime=start,
+                  status="pending", created_at=datetime(2026, 1, 2)),
+            Event(id="c", title="Jazz Night", venue_name="The Halls", start_datetime=start + timedelta(hours=1),
+                  status="pending", created_at=datetime(2026, 1, 3)),
+            Event(id="d", title="Pub Quiz", venue_name="The Murderers", start_datetime=start + timedelta(days=30),
+                  status="pending", created_at=datetime(2026, 1, 4)),
+        ])
+        await db.commit()
+
+        result = await deduplicator.run_deduplication_pass(db)
+        self.assertEqual(result, {"checked": 3, "merged": 1, "queued_for_review": 2})
+
+        events = {e.id: e for e in (await db.execute(select(Event))).scalars()}
+        self.assertEqual((events["b"].duplicate_of, events["b"].canonical), ("a", False))
+        review = (await db.execute(select(ReviewQueueItem))).scalars().all()
+        self.assertEqual([(r.event_id, r.duplicate_candidate_id) for r in review], [("c", "a")])
+
+    def _chain(self) -> list[Event]:
+        # a gains b's ticket URL by merging; c shares only that ticket URL with a
+        start = datetime(2026, 6, 12, 19, 30)
+        return [
+            Event(id="a", title="Jazz Night", venue_name="Norwich Arts Centre", start_datetime=start,
+                  status="approved", canonical=True, created_at=datetime(2026, 1, 1)),
+            Event(id="b", title="Jazz Night", venue_name="Norwich Arts Centre", start_datetime=start,
+                  ticket_url="https://t.example.com/jazz", status="pending", created_at=datetime(2026, 1, 2)),
+            Event(id="c", title="Jazz Night (rescheduled)", start_datetime=start + timedelta(days=30),
+                  ticket_url="https://t.example.com/jazz", status="pending", created_at=datetime(2026, 1, 3)),
+        ]
+
+    async def test_pass_matches_against_merged_fields(self):
+        for chunk_rows in (deduplicator.BATCH_CHUNK_ROWS, 1):
+            with self.subTest(chunk_rows=chunk_rows), patch.object(deduplicator, "BATCH_CHUNK_ROWS", chunk_rows):
+                await self.db.execute(delete(Event))
+                self.db.add_all(self._chain())
+                await self.db.commit()
+
+                result = await deduplicator.run_deduplication_pass(self.db)
+                self.assertEqual(result, {"checked": 2, "merged": 2, "queued_for_review": 0})
+                events = {e.id: e for e in (await self.db.execute(select(Event))).scalars()}
+                self.assertEqual((events["b"].duplicate_of, events["c"].duplicate_of), ("a", "a"))
+                self.assertEqual(events["a"].ticket_url, "https://t.example.com/jazz")
+
+    def test_candidate_index_reblocks_merged_events(self):
+        a, b, c = self._chain()
+        index = deduplicator.CandidateIndex([a])
+        self.assertEqual(deduplicator.resolve_duplicate(b, index.candidates(b), self.db), (True, "a"))
+        self.assertEqual(index.candidates(c), [])
+
+        index.refresh("a")
+        self.assertEqual(index.candidates(c), [a])
+        self.assertEqual(deduplicator.resolve_duplicate(c, index.candidates(c), self.db), (True, "a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
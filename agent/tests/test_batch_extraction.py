@@ -0,0 +1,70 @@
+import json
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.workers import normaliser  # noqa: E402
+
+LISTINGS = [
+    "Jazz Night at Norwich Arts Centre, 12 June 2026 19:30, £12",
+    "Sign up to our newsletter for the latest news and offers",
+    "Comedy Club at The Halls Norwich, 14 June 2026 20:00, £8",
+]
+
+
+def _batch_reply(prompt: str, max_tokens: int) -> str:
+    return json.dumps([
+        {"index": 2, "title": "Comedy Club", "venue_name": "The Halls Norwich", "price_text": "£8"},
+        {"index": 0, "title": "Jazz Night", "venue_name": "Norwich Arts Centre", "price_text": "£12"},
+        {"index": 1, "title": None},
+    ])
+
+
+class BatchExtractionTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = patch.object(normaliser.ai_cache, "enabled", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pack_batches_respects_budget_and_size(self):
+        texts = ["x" * 400] * 10  # ~110 tokens each
+        batches = normaliser.pack_batches(texts, token_budget=300, max_items=15)
+        self.assertEqual([len(b) for b in batches], [2, 2, 2, 2, 2])
+        batches = normaliser.pack_batches(texts, token_budget=10_000, max_items=4)
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+        self.assertEqual(sum(batches, []), list(range(10)))
+
+    async def test_single_call_maps_results_back_by_index(self):
+        with patch.object(normaliser, "_complete", AsyncMock(side_effect=_batch_reply)) as complete:
+            results = await normaliser.normalise_batch_with_ai(LISTINGS, "https://example.com")
+        complete.assert_awaited_once()
+        self.assertEqual(results[0]["title"], "Jazz Night")
+        self.assertEqual(results[0]["price_min"], 12.0)
+        self.assertIsNone(results[1]["title"])
+        self.assertEqual(results[2]["title"], "Comedy Club")
+
+    async def test_unparseable_batch_falls_back_to_per_item_calls(self):
+        replies = ["sorry, I can't do that"] + [
+            json.dumps({"title": f"Event {i}"}) for i in range(len(LISTINGS))
+        ]
+        with patch.object(normaliser, "_complete", AsyncMock(side_effect=replies)) as complete:
+            results = await normaliser.normalise_batch_with_ai(LISTINGS, "https://example.com")
+        self.assertEqual(complete.await_count, 1 + len(LISTINGS))
+        self.assertEqual([r["title"] for r in results], ["Event 0", "Event 1", "Event 2"])
+
+    async def test_missing_listing_is_retried_alone(self):
+        reply = json.dumps([{"index": 0, "title": "Jazz Night"}, {"index": 2, "title": "Comedy Club"}])
+        single = json.dumps({"title": None})
+        with patch.object(normaliser, "_complete", AsyncMock(side_effect=[reply, single])) as complete:
+            results = await normaliser.normalise_batch_with_ai(LISTINGS, "https://example.com")
+        self.assertEqual(complete.await_count, 2)
+        self.assertIn("Sign up", complete.await_args_list[1].args[0])
+        self.assertIsNone(results[1]["title"])
+
+
+if __name__ == "__main__":
+    unittest.main()
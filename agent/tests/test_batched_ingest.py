@@ -0,0 +1,81 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.models.event import Event, EventObservation  # noqa: E402
+from app.models.source import Source  # noqa: E402
+from app.workers.ingestion_runner import _ingest_events  # noqa: E402
+
+
+def _data(title, url, **extra):
+    data = {
+        "title": title,
+        "ticket_url": url,
+        "venue_name": "Norwich Arts Centre",
+        "start_datetime": "2026-06-12T19:30:00",
+        "confidence": 90,
+    }
+    data.update(extra)
+    return data
+
+
+class BatchedIngestTest(AsyncDBTestCase):
+    savepoints = True
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.source = Source(name="Arts Centre", url="https://nac.example.com", connector_type="html", source_type="venue")
+        self.db.add(self.source)
+        self.db.add(Event(
+            title="Old Gig", ticket_url="https://t.example.com/old", venue_name="The Halls",
+            start_datetime=datetime(2026, 7, 1, 20), status="approved", content_hash="stale",
+        ))
+        await self.db.commit()
+
+    async def _count(self, model, *where):
+        return (await self.db.execute(select(func.count()).select_from(model).where(*where))).scalar()
+
+    async def test_batch_resolves_updates_duplicates_and_repeats_without_committing(self):
+        stats = dict.fromkeys(("added", "updated", "queued", "errors"), 0)
+        await _ingest_events([
+            _data("Jazz Night", "https://t.example.com/1"),
+            _data("Jazz Night", "https://t.example.com/2"),  # duplicate of the first
+            _data("Jazz Night", "https://t.example.com/1"),  # repeat URL in the same batch
+            _data("Old Gig", "https://t.example.com/old", venue_name="The Halls", start_datetime="2026-07-01T21:00:00"),
+            {"title": "  "},
+        ], self.source, self.db, stats)
+
+        self.assertEqual(stats, {"added": 1, "updated": 1, "queued": 0, "errors": 0})
+        self.assertEqual(await self._count(Event, Event.canonical == True), 2)
+        merged = (await self.db.execute(select(Event).where(Event.canonical == False))).scalar_one()
+        self.assertEqual(merged.ticket_url, "https://t.example.com/2")
+        self.assertEqual(await self._count(EventObservation), 4)
+
+        # Nothing was committed: the caller owns the single commit per source
+        await self.db.rollback()
+        self.assertEqual(await self._count(Event), 1)
+
+    async def test_bad_event_only_loses_itself(self):
+        stats = dict.fromkeys(("added", "updated", "queued", "errors"), 0)
+        await _ingest_events([
+            _data("Jazz Night", "https://t.example.com/1"),
+            _data("Broken", "https://t.example.com/bad", price_min={"not": "a number"}),
+            _data("Folk Session", "https://t.example.com/3", start_datetime="2026-08-02T15:00:00",
+                  venue_name="The Halls"),
+        ], self.source, self.db, stats)
+
+        self.assertEqual(stats, {"added": 2, "updated": 0, "queued": 0, "errors": 1})
+        titles = (await self.db.execute(select(Event.title).order_by(Event.title))).scalars().all()
+        self.assertEqual(titles, ["Folk Session", "Jazz Night", "Old Gig"])
+
+
+if __name__ == "__main__":
+    unittest.main()
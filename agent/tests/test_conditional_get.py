@@ -0,0 +1,90 @@
+import hashlib
+import unittest
+from pathlib import Path
+import sys
+
+import httpx
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import select  # noqa: E402
+
+from app.connectors.base import NotModified  # noqa: E402
+from app.connectors.html_connector import HTMLConnector  # noqa: E402
+from app.models import Source, SourcePage  # noqa: E402
+from app.workers.ingestion_runner import run_source  # noqa: E402
+
+URL = "https://venue.example.com/whats-on"
+BODY = b"<html><body><article>Gig</article></body></html>"
+
+
+def _connector(handler) -> HTMLConnector:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HTMLConnector("source-1", URL, client=client, request_delay=0.001)
+
+
+class ConditionalGetTest(unittest.IsolatedAsyncioTestCase):
+    async def test_first_fetch_records_validators(self):
+        def handler(request):
+            self.assertNotIn("If-None-Match", request.headers)
+            return httpx.Response(200, content=BODY, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 10:00:00 GMT"})
+
+        connector = _connector(handler)
+        raw = await connector.fetch()
+        self.assertEqual(raw[0]["_url"], URL)
+        self.assertEqual(connector.page_state["etag"], '"v1"')
+        self.assertEqual(connector.page_state["body_hash"], hashlib.sha256(BODY).hexdigest())
+
+    async def test_304_raises_not_modified(self):
+        def handler(request):
+            self.assertEqual(request.headers["If-None-Match"], '"v1"')
+            self.assertEqual(request.headers["If-Modified-Since"], "Mon, 01 Jun 2026 10:00:00 GMT")
+            return httpx.Response(304)
+
+        connector = _connector(handler)
+        connector.cached_page = {"etag": '"v1"', "last_modified": "Mon, 01 Jun 2026 10:00:00 GMT", "body_hash": "x"}
+        with self.assertRaises(NotModified):
+            await connector.fetch()
+        self.assertEqual(connector.page_state["etag"], '"v1"')
+
+    async def test_identical_body_without_validators_raises_not_modified(self):
+        connector = _connector(lambda request: httpx.Response(200, content=BODY))
+        connector.cached_page = {"etag": None, "last_modified": None, "body_hash": hashlib.sha256(BODY).hexdigest()}
+        with self.assertRaises(NotModified):
+            await connector.fetch()
+
+    async def test_changed_body_is_fetched(self):
+        connector = _connector(lambda request: httpx.Response(200, content=BODY + b"<p>new</p>"))
+        connector.cached_page = {"etag": None, "last_modified": None, "body_hash": hashlib.sha256(BODY).hexdigest()}
+        raw = await connector.fetch()
+        self.assertIn("new", raw[0]["_html"])
+
+
+class StoredValidatorsTest(AsyncDBTestCase):
+    async def test_hash_match_with_new_validators_keeps_them_for_a_real_304(self):
+        self.db.add(Source(id="s1", name="Venue", url=URL, connector_type="html", source_type="venue",
+                           request_delay=0.001))
+        self.db.add(SourcePage(source_id="s1", url=URL, body_hash=hashlib.sha256(BODY).hexdigest()))
+        await self.db.commit()
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v2"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=BODY, headers={"ETag": '"v2"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            self.assertEqual((await run_source("s1", self.db, client=client))["unchanged"], 1)
+            page = (await self.db.execute(select(SourcePage).where(SourcePage.url == URL))).scalar_one()
+            self.assertEqual(page.etag, '"v2"')
+            self.assertEqual((await run_source("s1", self.db, client=client))["unchanged"], 1)
+
+        self.assertEqual(seen, [None, '"v2"'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from app.models.event import Event  # noqa: E402
+from app.workers.deduplicator import check_and_handle_duplicate, find_candidates, venue_key  # noqa: E402
+
+
+def _event(title, start, venue, ticket_url=None):
+    return Event(
+        title=title,
+        start_datetime=start,
+        venue_name=venue,
+        venue_key=venue_key(venue),
+        ticket_url=ticket_url,
+        status="pending",
+        canonical=True,
+    )
+
+
+class DedupBlockingTest(AsyncDBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.db.add_all([
+            _event("Jazz Night", datetime(2026, 6, 12, 19, 30), "Norwich Arts Centre"),
+            _event("Folk Session", datetime(2026, 6, 13, 15, 0), "The Halls"),
+            _event("Panto", datetime(2026, 12, 20, 14, 0), "Theatre Royal", "https://tickets.example.com/panto"),
+            _event("Quiz", datetime(2026, 9, 1, 20, 0), "The Murderers"),
+        ])
+        await self.db.commit()
+
+    def test_venue_key_ignores_order_case_and_punctuation(self):
+        self.assertEqual(venue_key("The Halls, Norwich"), venue_key("norwich the HALLS"))
+        self.assertIsNone(venue_key("  -- "))
+
+    async def test_candidates_are_blocked(self):
+        new = _event("Jazz Nite", datetime(2026, 6, 12, 20, 0), "Somewhere Else")
+        titles = {e.title for e in await find_candidates(new, self.db)}
+        self.assertEqual(titles, {"Jazz Night", "Folk Session"})
+
+        new = _event("Pantomime", datetime(2027, 1, 5, 14, 0), "Elsewhere", "https://tickets.example.com/panto")
+        self.assertEqual([e.title for e in await find_candidates(new, self.db)], ["Panto"])
+
+        new = _event("Pub Quiz", datetime(2027, 3, 1, 20, 0), "murderers, the")
+        self.assertEqual([e.title for e in await find_candidates(new, self.db)], ["Quiz"])
+
+    async def test_duplicate_is_still_merged(self):
+        new = _event("Jazz Night", datetime(2026, 6, 12, 19, 30), "Norwich Arts Centre")
+        self.db.add(new)
+        await self.db.flush()
+        is_dup, canonical_id = await check_and_handle_duplicate(new, self.db)
+        self.assertTrue(is_dup)
+        self.assertIsNotNone(canonical_id)
+        self.assertFalse(new.canonical)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.search import create_search_index, rebuild_search_index, search_filter  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.routers import events  # noqa: E402
+
+
+class EventSearchTest(AsyncDBTestCase):
+    def create_schema(self, conn):
+        super().create_schema(conn)
+        create_search_index(conn)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        async with self.sessions() as db:
+            db.add_all([
+                Event(id="desc", title="Late Night Session", description="Live jazz trio until 1am",
+                      venue_name="The Bicycle Shop", start_datetime=datetime(2026, 6, 1), status="approved"),
+                Event(id="title", title="Jazz Night", venue_name="Norwich Arts Centre",
+                      start_datetime=datetime(2026, 6, 20), status="approved"),
+                Event(id="pending", title="Jazz Brunch", start_datetime=datetime(2026, 6, 2), status="pending"),
+                Event(id="other", title="Folk Session", venue_name="The Halls",
+                      start_datetime=datetime(2026, 6, 3), status="approved"),
+            ])
+            await db.commit()
+        self.client = self.client_for(events.router)
+
+    async def _search(self, q, **params):
+        response = await self.client.get("/events/search", params={"q": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [e["id"] for e in response.json()]
+
+    async def test_ranked_prefix_search(self):
+        self.assertEqual(await self._search("jaz"), ["title", "desc"])
+        # Equal relevance falls back to start time
+        self.assertEqual(await self._search("jazz", status="all"), ["pending", "title", "desc"])
+        self.assertEqual(await self._search("halls session"), ["other"])
+        self.assertEqual(await self._search("!!"), [])
+
+    async def test_index_follows_updates_and_deletes(self):
+        async with self.sessions() as db:
+            (await db.get(Event, "other")).title = "Jazz Session"
+            await db.delete(await db.get(Event, "desc"))
+            await db.commit()
+        self.assertEqual(await self._search("jazz"), ["other", "title"])
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(rebuild_search_index)
+        self.assertEqual(await self._search("jazz"), ["other", "title"])
+
+    async def test_list_q_uses_search_index(self):
+        response = await self.client.get("/events/", params={"q": "night"})
+        self.assertEqual([e["id"] for e in response.json()], ["desc", "title"])
+
+        for q in ("!!", "  "):
+            response = await self.client.get("/events/", params={"q": q})
+            self.assertEqual(response.json(), [], q)
+
+    async def test_backends_agree_that_every_term_must_match(self):
+        for q in ("halls session", "jazz halls", "jaz nigh"):
+            matched = {}
+            for dialect in ("sqlite", "default"):
+                stmt = select(Event.id).where(search_filter(dialect, q)).order_by(Event.id)
+                matched[dialect] = list((await self.db.execute(stmt)).scalars())
+            with self.subTest(q=q):
+                self.assertEqual(matched["default"], matched["sqlite"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.dialects import sqlite  # noqa: E402
+
+from app.models.event import Event  # noqa: E402
+from app.routers import events  # noqa: E402
+
+STARTS = [
+    datetime(2026, 6, 12, 19, 30),
+    datetime(2026, 6, 12, 19, 30),
+    datetime(2026, 6, 13, 20, 0),
+    None,
+    datetime(2026, 6, 1, 10, 0),
+    None,
+    datetime(2026, 6, 13, 20, 0),
+]
+
+
+class EventsPaginationTest(AsyncDBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        async with self.sessions() as db:
+            db.add_all([
+                Event(id=f"e{i}", title=f"Event {i}", start_datetime=start, status="approved")
+                for i, start in enumerate(STARTS)
+            ])
+            await db.commit()
+        self.client = self.client_for(events.router)
+
+    async def test_cursor_pages_match_single_listing(self):
+        everything = (await self.client.get("/events/", params={"limit": 100})).json()
+        self.assertEqual([e["id"] for e in everything], ["e4", "e0", "e1", "e2", "e6", "e3", "e5"])
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = await self.client.get("/events/", params=params)
+            seen += [e["id"] for e in response.json()]
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+        self.assertEqual(seen, [e["id"] for e in everything])
+
+    async def test_cursor_pages_seek_the_listing_index(self):
+        listing = select(Event).where(Event.canonical == True, Event.status == "approved")
+        dated_cursor = (datetime(2026, 6, 12, 19, 30), "e0")
+        plans = {}
+        for after in (None, dated_cursor, (None, "e3")):
+            for i, page in enumerate(events._keyset_pages(listing, after)):
+                sql = str(page.limit(3).compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+                async with self.engine.connect() as conn:
+                    plan = "\n".join(row[-1] for row in await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+                plans[after, i] = plan
+                with self.subTest(after=after, plan=plan):
+                    self.assertIn("USING INDEX ix_events_status_canonical_start_id", plan)
+                    self.assertNotIn("TEMP B-TREE", plan)
+        self.assertIn("(start_datetime,id)>(?,?)", plans[dated_cursor, 0])
+
+    async def test_offset_still_supported(self):
+        response = await self.client.get("/events/", params={"limit": 2, "offset": 2})
+        self.assertEqual([e["id"] for e in response.json()], ["e1", "e2"])
+
+    async def test_bad_cursor_is_rejected(self):
+        response = await self.client.get("/events/", params={"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
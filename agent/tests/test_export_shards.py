@@ -0,0 +1,117 @@
+import hashlib
+import json
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.models import Event  # noqa: E402
+from app.workers import exporter  # noqa: E402
+from app.workers.json_stream import dumps  # noqa: E402
+
+TODAY = date(2026, 6, 28)
+
+
+class FixedDate(date):
+    @classmethod
+    def today(cls):
+        return TODAY
+
+
+def _event(i: int, start: datetime, category: str, **overrides) -> Event:
+    fields = dict(
+        id=f"e{i}", title=f"Gig {i}", venue_name="Norwich Arts Centre", status="approved",
+        start_datetime=start, category=category, ticket_url=f"https://t.example.com/{i}",
+    )
+    fields.update(overrides)
+    return Event(**fields)
+
+
+class ExportShardsTest(AsyncDBTestCase):
+    async def asyncSetUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        for patcher in (
+            patch.object(exporter, "EXPORTS_DIR", self.root),
+            patch.object(exporter, "date", FixedDate),
+            patch.object(settings, "google_apps_script_url", ""),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        await super().asyncSetUp()
+        self.db.add_all([
+            _event(1, datetime(2026, 6, 20, 19, 0), "music", end_datetime=datetime(2026, 7, 5, 17, 0)),
+            _event(2, datetime(2026, 6, 29, 20, 0), "comedy"),
+            _event(3, datetime(2026, 7, 4, 19, 30), "Music"),
+            _event(4, datetime(2026, 7, 20, 19, 30), "Food & Drink"),
+        ])
+        await self.db.commit()
+
+    def _load(self, name: str) -> dict:
+        return json.loads((self.root / name).read_text())
+
+    def _names(self, name: str) -> list[str]:
+        data = self._load(name)
+        self.assertEqual(data["count"], len(data["events"]))
+        return [e["name"] for e in data["events"]]
+
+    async def test_shards_and_manifest(self):
+        await exporter.run_export(self.db)
+
+        self.assertEqual(self._names("shards/month/2026-06.json"), ["Gig 1", "Gig 2"])
+        self.assertEqual(self._names("shards/month/2026-07.json"), ["Gig 3", "Gig 4"])
+        self.assertEqual(self._names("shards/category/music.json"), ["Gig 1", "Gig 3"])
+        self.assertEqual(self._names("shards/category/food-drink.json"), ["Gig 4"])
+        # Gig 1 is still running; Gig 4 is too far out
+        self.assertEqual(self._names("shards/next-7-days.json"), ["Gig 1", "Gig 2", "Gig 3"])
+
+        manifest = self._load("manifest.json")
+        self.assertEqual(manifest["all"]["count"], 4)
+        self.assertEqual((manifest["upcoming"]["from"], manifest["upcoming"]["to"]), ("2026-06-28", "2026-07-04"))
+        self.assertEqual(sorted(manifest["months"]), ["2026-06", "2026-07"])
+        self.assertEqual(manifest["categories"]["comedy"]["path"], "shards/category/comedy.json")
+        for entry in exporter._manifest_entries(manifest):
+            events = self._load(entry["path"])["events"]
+            self.assertEqual(entry["count"], len(events))
+            self.assertEqual(entry["hash"], hashlib.sha256(b",".join(dumps(e) for e in events)).hexdigest())
+
+    async def test_unchanged_shards_are_not_rewritten_and_empty_ones_removed(self):
+        await exporter.run_export(self.db)
+        june = self.root / "shards/month/2026-06.json"
+        june.write_text(june.read_text().replace('"generated_at"', '"untouched": true, "generated_at"'))
+
+        (await self.db.get(Event, "e4")).status = "rejected"
+        await self.db.commit()
+        await exporter.run_export(self.db)
+
+        self.assertTrue(self._load("shards/month/2026-06.json")["untouched"])
+        self.assertEqual(self._names("shards/month/2026-07.json"), ["Gig 3"])
+        self.assertFalse((self.root / "shards/category/food-drink.json").exists())
+        self.assertNotIn("food-drink", self._load("manifest.json")["categories"])
+
+    async def test_upcoming_window_rolls_over_without_event_changes(self):
+        await exporter.run_export(self.db)
+        global TODAY
+        previous, TODAY = TODAY, date(2026, 7, 14)
+        try:
+            result = await exporter.run_export(self.db)
+        finally:
+            TODAY = previous
+
+        self.assertFalse(result["written"])
+        self.assertEqual(self._names("shards/next-7-days.json"), ["Gig 4"])
+        self.assertEqual(self._load("manifest.json")["upcoming"]["from"], "2026-07-14")
+
+
+if __name__ == "__main__":
+    unittest.main()
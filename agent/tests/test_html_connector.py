@@ -0,0 +1,64 @@
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.connectors import html_connector  # noqa: E402
+from app.connectors.html_connector import HTMLConnector  # noqa: E402
+
+URL = "https://venue.example.com/whats-on"
+
+LISTING_PAGE = """<html><body><nav>Home | Tickets</nav>
+<article>Jazz Night, Friday 12 June 2026 at 19:30, tickets £12 on the door</article>
+<article>Comedy Club, Saturday 13 June 2026 at 20:00, tickets £8 in advance</article>
+<article>Folk Session, Sunday 14 June 2026 at 15:00, free entry all welcome</article>
+</body></html>"""
+
+SINGLE_EVENT_PAGE = """<html><body><nav>Home</nav><h1>Norwich Beer Festival</h1>
+<p>Thursday 22 October 2026, St Andrew's Hall. Over 200 real ales.</p><footer>Contact</footer></body></html>"""
+
+
+class HTMLConnectorTest(unittest.IsolatedAsyncioTestCase):
+    def _connector(self, body: str) -> tuple[HTMLConnector, list]:
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text=body)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return HTMLConnector("source-1", URL, name="Test Venue", client=client, request_delay=0.001), requests
+
+    async def test_container_strategy_fetches_once(self):
+        connector, requests = self._connector(LISTING_PAGE)
+        batch = AsyncMock(return_value=[{"title": "Jazz Night"}, {"title": None}, {"title": "Folk Session"}])
+        with patch.object(html_connector, "normalise_batch_with_ai", batch):
+            events = await connector.run()
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(connector.strategy, "containers")
+        self.assertEqual([e["title"] for e in events], ["Jazz Night", "Folk Session"])
+        self.assertEqual(events[0]["source_name"], "Test Venue")
+        self.assertEqual(len(batch.await_args.args[0]), 3)
+
+    async def test_full_page_fallback_reuses_fetched_document(self):
+        connector, requests = self._connector(SINGLE_EVENT_PAGE)
+        single = AsyncMock(return_value={"title": "Norwich Beer Festival"})
+        with patch.object(html_connector, "normalise_with_ai", single):
+            events = await connector.multi_extract()
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(connector.strategy, "full_page")
+        self.assertEqual([e["title"] for e in events], ["Norwich Beer Festival"])
+        text = single.await_args.args[0]
+        self.assertIn("Beer Festival", text)
+        self.assertNotIn("Contact", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.workers import html_text  # noqa: E402
+from app.workers.html_text import (  # noqa: E402
+    NOISE_TAGS,
+    available_backends,
+    css_to_xpath,
+    default_backend,
+    find_containers,
+    parse_html,
+)
+
+FIXTURES = AGENT_ROOT / "tests" / "fixtures" / "html"
+# Mirrors app.connectors.html_connector.CONTAINER_SELECTORS without importing the AI normaliser
+SELECTORS = ["article", "[class*='event']", "[class*='listing']", "[class*='card']", "li[class*='event']"]
+
+
+def _extract(html: str, backend: str) -> tuple[list[str], str, str]:
+    document = parse_html(html, backend)
+    containers = [document.node_text(node) for node in find_containers(document, SELECTORS)]
+    return containers, document.page_text(), parse_html(html, backend).page_text(NOISE_TAGS + ("header",))
+
+
+class HTMLTextTest(unittest.TestCase):
+    def test_every_backend_matches_beautifulsoup_on_fixtures(self):
+        for path in sorted(FIXTURES.glob("*.html")):
+            html = path.read_text(encoding="utf-8")
+            expected = _extract(html, "bs4")
+            for backend in available_backends():
+                with self.subTest(page=path.name, backend=backend):
+                    self.assertEqual(_extract(html, backend), expected)
+
+    def test_listing_fixture_uses_containers_and_drops_noise(self):
+        html = (FIXTURES / "listing.html").read_text(encoding="utf-8")
+        containers, page, _ = _extract(html, available_backends()[0])
+        self.assertEqual(len(containers), 60)
+        self.assertNotIn("<", page)
+        for backend in available_backends():
+            document = parse_html("<nav>Menu</nav><p>Gig <b>tonight</b></p><script>var x;</script>", backend)
+            self.assertEqual(document.page_text(), "Gig tonight", backend)
+
+    def test_single_event_fixture_has_no_containers(self):
+        html = (FIXTURES / "single-event.html").read_text(encoding="utf-8")
+        for backend in available_backends():
+            self.assertEqual(find_containers(parse_html(html, backend), SELECTORS), [], backend)
+
+    def test_empty_html(self):
+        for backend in available_backends():
+            document = parse_html("", backend)
+            self.assertEqual(document.page_text(), "", backend)
+            self.assertEqual(document.select("article"), [], backend)
+
+    def test_css_to_xpath_supports_only_connector_selectors(self):
+        self.assertEqual(css_to_xpath("article"), "//article")
+        self.assertEqual(css_to_xpath("[class*='event']"), "//*[contains(@class, 'event')]")
+        self.assertEqual(css_to_xpath("li[class*='event']"), "//li[contains(@class, 'event')]")
+        for selector in ("div > p", ".event", "a[href^='http']", ""):
+            with self.subTest(selector=selector), self.assertRaises(ValueError):
+                css_to_xpath(selector)
+
+    def test_backend_can_be_forced(self):
+        with patch.dict(os.environ, {"HTML_PARSER_BACKEND": "bs4"}):
+            self.assertEqual(default_backend(), "bs4")
+            self.assertIsInstance(parse_html("<p>x</p>"), html_text.BS4Document)
+        with patch.dict(os.environ, {"HTML_PARSER_BACKEND": "not-installed"}):
+            self.assertEqual(default_backend(), available_backends()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import json
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from sqlalchemy import select, update  # noqa: E402
+
+from app.models import Event, ExportQueueItem  # noqa: E402
+from app.models.export import queue_exports  # noqa: E402
+from app.workers import exporter  # noqa: E402
+
+
+def _event(i: int, **overrides) -> Event:
+    fields = dict(
+        id=f"e{i}", title=f"Gig {i}", venue_name="Norwich Arts Centre", status="approved",
+        start_datetime=datetime(2026, 6, 10 + i, 19, 30), ticket_url=f"https://t.example.com/{i}",
+    )
+    fields.update(overrides)
+    return Event(**fields)
+
+
+class IncrementalExportTest(AsyncDBTestCase):
+    async def asyncSetUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        for patcher in (
+            patch.object(exporter, "EXPORTS_DIR", Path(self._tmp.name)),
+            patch.object(settings, "google_apps_script_url", ""),
+            patch.object(exporter, "STREAM_BATCH_ROWS", 2),  # several batches per run
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        await super().asyncSetUp()
+        self.db.add_all([_event(i) for i in range(4)] + [_event(9, status="pending")])
+        await self.db.commit()
+
+    def _exported(self) -> list[str]:
+        data = json.loads((Path(self._tmp.name) / "events.json").read_text())
+        self.assertEqual(data["count"], len(data["events"]))
+        return [e["name"] for e in data["events"]]
+
+    async def test_only_changes_are_patched_and_unchanged_runs_skip_the_write(self):
+        first = await exporter.run_export(self.db)
+        self.assertEqual((first["events"], first["changed"], first["written"]), (4, 4, True))
+        self.assertEqual(self._exported(), ["Gig 0", "Gig 1", "Gig 2", "Gig 3"])
+
+        again = await exporter.run_export(self.db)
+        self.assertEqual((again["changed"], again["removed"], again["written"]), (0, 0, False))
+
+        (await self.db.get(Event, "e1")).title = "Gig 1 (moved)"
+        (await self.db.get(Event, "e2")).status = "rejected"
+        (await self.db.get(Event, "e9")).status = "approved"
+        await self.db.delete(await self.db.get(Event, "e3"))
+        await self.db.commit()
+
+        patched = await exporter.run_export(self.db)
+        self.assertEqual((patched["changed"], patched["removed"], patched["written"]), (2, 2, True))
+        self.assertEqual(self._exported(), ["Gig 0", "Gig 1 (moved)", "Gig 9"])
+
+        full = await exporter.run_export(self.db, full=True)
+        self.assertEqual(full["events"], 3)
+        self.assertEqual(self._exported(), ["Gig 0", "Gig 1 (moved)", "Gig 9"])
+
+    async def test_changes_with_an_old_timestamp_are_exported(self):
+        await exporter.run_export(self.db)
+        # A transaction that began before the export stamps updated_at with its start time
+        event = await self.db.get(Event, "e1")
+        event.title, event.updated_at = "Gig 1 (late)", datetime(2000, 1, 1)
+        await self.db.commit()
+
+        patched = await exporter.run_export(self.db)
+        self.assertEqual((patched["changed"], patched["written"]), (1, True))
+        self.assertIn("Gig 1 (late)", self._exported())
+
+    async def test_changes_made_during_an_export_stay_queued(self):
+        await exporter.run_export(self.db)
+        (await self.db.get(Event, "e1")).title = "Gig 1 (first)"
+        await self.db.commit()
+
+        patch_batch = exporter._patch_batch
+
+        async def change_after_read(db, batch, full):
+            counts = await patch_batch(db, batch, full)
+            # Another writer changes e1 after the exporter has read it
+            await db.execute(update(Event.__table__).where(Event.id == "e1").values(title="Gig 1 (second)"))
+            await db.run_sync(lambda session: queue_exports(session.connection(), ["e1"]))
+            return counts
+
+        with patch.object(exporter, "_patch_batch", change_after_read):
+            await exporter.run_export(self.db)
+        self.assertIn("Gig 1 (first)", self._exported())
+        queued = (await self.db.execute(select(ExportQueueItem.event_id))).scalars().all()
+        self.assertEqual(queued, ["e1"])
+
+        again = await exporter.run_export(self.db)
+        self.assertEqual(again["changed"], 1)
+        self.assertIn("Gig 1 (second)", self._exported())
+        self.assertEqual((await self.db.execute(select(ExportQueueItem))).scalars().all(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
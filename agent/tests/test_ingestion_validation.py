@@ -147,7 +147,9 @@ class IngestionValidationTest(unittest.TestCase):
                 encoding="utf-8",
             )
 
-            with patch.object(exporter, "EXPORTS_DIR", exports_dir), patch.object(exporter, "LOGS_DIR", logs_dir):
+            with patch.object(exporter, "EXPORTS_DIR", exports_dir), patch.object(exporter, "LOGS_DIR", logs_dir), \
+                    patch.object(exporter, "LINK_CACHE_PATH", tmp_path / "link-status.json"), \
+                    patch.object(exporter, "_http_session", return_value=exporter.requests):
                 stats = exporter.deduplicate_and_export([self._base_event(title="New Pending Event")])
 
             payload = exporter.json.loads(export_path.read_text(encoding="utf-8"))
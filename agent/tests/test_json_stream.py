@@ -0,0 +1,61 @@
+import gzip
+import json
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.workers import json_stream  # noqa: E402
+from app.workers.json_stream import JSONArrayWriter, write_json_array  # noqa: E402
+
+EVENTS = [{"name": "Café Gig", "date": "2026-06-12"}, {"name": "Folk Session", "date": "2026-06-14"}]
+
+
+class JSONStreamTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "events.json"
+
+    def test_document_shape_matches_json_dump_with_and_without_orjson(self):
+        for fast in (json_stream.orjson, None):
+            with patch.object(json_stream, "orjson", fast):
+                count = write_json_array(self.path, iter(EVENTS), generated_at="2026-06-01T00:00:00")
+            self.assertEqual(count, 2)
+            self.assertEqual(
+                json.loads(self.path.read_text(encoding="utf-8")),
+                {"events": EVENTS, "generated_at": "2026-06-01T00:00:00", "count": 2},
+            )
+
+    def test_failed_write_leaves_previous_file_and_no_temp_files(self):
+        write_json_array(self.path, EVENTS)
+
+        def broken():
+            yield EVENTS[0]
+            raise RuntimeError("database went away")
+
+        with self.assertRaises(RuntimeError):
+            write_json_array(self.path, broken())
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["count"], 2)
+        self.assertEqual([p.name for p in self.path.parent.iterdir()], ["events.json"])
+
+    def test_uncommitted_writer_is_discarded_and_hash_covers_items_only(self):
+        with JSONArrayWriter(self.path) as first:
+            for event in EVENTS:
+                first.write(event)
+        self.assertFalse(self.path.exists())
+
+        with JSONArrayWriter(self.path, compress=True) as second:
+            for event in EVENTS:
+                second.write(event)
+            second.commit(generated_at="later")
+        self.assertEqual(first.content_hash, second.content_hash)
+        self.assertEqual(gzip.decompress(Path(f"{self.path}.gz").read_bytes()), self.path.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "automation" / "botasaurus_scraper"))
+
+import exporter  # noqa: E402
+
+
+class FakeSession:
+    """Stands in for the pooled requests.Session, recording each HEAD."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.heads: list[str] = []
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def head(self, url, **kwargs):
+        with self._lock:
+            self.heads.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return Mock(status_code=404 if "missing" in url else 200)
+
+    def get(self, url, **kwargs):
+        return Mock(status_code=404)
+
+
+class LinkValidationTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.session = FakeSession(delay=0.05)
+        for patcher in (
+            patch.object(exporter, "LINK_CACHE_PATH", Path(self._tmp.name) / "link-status.json"),
+            patch.object(exporter, "_http_session", return_value=self.session),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_distinct_urls_are_checked_once_and_concurrently(self):
+        urls = [f"https://venue.example.com/event/{i % 4}" for i in range(12)]
+        urls += ["https://cdn.example.com/missing.jpg", "", "not a url"]
+        statuses = exporter.validate_links(urls)
+
+        self.assertEqual(len(self.session.heads), 5)
+        self.assertGreater(self.session.peak, 1)
+        self.assertEqual(statuses["https://venue.example.com/event/0"], "verified")
+        self.assertEqual(statuses["https://cdn.example.com/missing.jpg"], "broken")
+        self.assertEqual(statuses["not a url"], "broken")
+        self.assertNotIn("", statuses)
+
+    def test_cached_results_are_reused_until_they_expire(self):
+        verified, broken = "https://venue.example.com/whats-on", "https://cdn.example.com/missing.jpg"
+        exporter.validate_links([verified, broken], now=1_000_000)
+        self.session.heads.clear()
+
+        an_hour_later = 1_000_000 + 3600
+        self.assertEqual(exporter.validate_links([verified, broken], now=an_hour_later)[verified], "verified")
+        self.assertEqual(self.session.heads, [])
+
+        next_day = 1_000_000 + 24 * 3600
+        exporter.validate_links([verified, broken], now=next_day)
+        self.assertEqual(self.session.heads, [broken])
+
+    def test_adapted_events_use_the_batch_statuses(self):
+        event = {
+            "title": "Jazz Night", "date": "2026-06-12", "venue": "Norwich Arts Centre",
+            "source_url": "https://source.example.com/jazz", "image_url": "https://cdn.example.com/missing.jpg",
+        }
+        statuses = exporter.validate_links(exporter._event_links(event))
+        with patch("exporter.requests.head") as head:
+            adapted = exporter._adapt_scraper_event(event, statuses)
+        head.assert_not_called()
+        self.assertEqual(adapted["link_status"], "verified")
+        self.assertEqual(adapted["ticket_status"], "missing")
+        self.assertEqual(adapted["image_status"], "fallback_assigned")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+from collections import Counter
+import json
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "automation" / "botasaurus_scraper"))
+
+import normaliser  # noqa: E402
+
+PAGE_TEXT = "Jazz Night at Norwich Arts Centre, Friday 12 June 2026, 19:30. " * 4
+
+
+class ModelError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"{code} error")
+        self.code = code
+
+
+class FakeModels:
+    def __init__(self, broken: dict[str, int]):
+        self.broken = broken
+        self.calls: list[tuple[str, bool]] = []
+
+    def generate_content(self, model, contents):
+        probe = contents == "Reply with the word OK"
+        self.calls.append((model, probe))
+        if model in self.broken:
+            raise ModelError(self.broken[model])
+        return SimpleNamespace(text="OK" if probe else '[{"title": "Jazz Night", "date": "2026-06-12"}]')
+
+
+class ModelStateTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.state_path = Path(self._tmp.name) / "gemini-model.json"
+        first, second, third = normaliser.CANDIDATE_MODELS[:3]
+        self.models = FakeModels({first: 404, second: 429})
+        self.first, self.second, self.third = first, second, third
+        for patcher in (
+            patch.object(normaliser, "MODEL_STATE_PATH", self.state_path),
+            patch.object(normaliser, "get_client", return_value=SimpleNamespace(models=self.models)),
+            patch.object(normaliser, "_working_model", None),
+            patch.object(normaliser, "_unavailable_models", set()),
+            patch.object(normaliser, "rate_limiter", normaliser.RateLimiter(per_minute=0, concurrency=4)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _new_process(self):
+        normaliser._working_model = None
+        normaliser._unavailable_models.clear()
+        self.models.calls.clear()
+
+    def test_probe_result_is_reused_by_the_next_run(self):
+        self.assertEqual(normaliser.get_working_model(), self.third)
+        state = json.loads(self.state_path.read_text())
+        self.assertEqual(state["model"], self.third)
+        # Only "not found" is remembered; the rate-limited model may work next time
+        self.assertEqual(list(state["unavailable"]), [self.first])
+
+        self._new_process()
+        self.assertEqual(normaliser.get_working_model(), self.third)
+        self.assertEqual(self.models.calls, [])
+
+    def test_expired_state_reprobes_but_still_skips_unavailable_models(self):
+        normaliser.get_working_model()
+        self._new_process()
+        later = normaliser.time.time() + normaliser.MODEL_STATE_TTL_SECONDS + 60
+        with patch.object(normaliser.time, "time", return_value=later):
+            self.assertEqual(normaliser.get_working_model(), self.third)
+        self.assertEqual(self.models.calls, [(self.second, True), (self.third, True)])
+
+    def test_cached_model_that_disappears_is_replaced_lazily(self):
+        normaliser.get_working_model()
+        self._new_process()
+        self.models.broken[self.third] = 404
+
+        events = normaliser.normalise_with_gemini(PAGE_TEXT, "https://nac.example.com", "Norwich Arts Centre")
+
+        self.assertEqual([e["title"] for e in events], ["Jazz Night"])
+        fourth = normaliser.CANDIDATE_MODELS[3]
+        self.assertEqual(normaliser._working_model, fourth)
+        state = json.loads(self.state_path.read_text())
+        self.assertEqual(state["model"], fourth)
+        self.assertIn(self.third, state["unavailable"])
+
+    def test_unwritable_state_still_stops_retrying_a_missing_model(self):
+        normaliser.get_working_model()
+        self._new_process()
+        for model in normaliser.CANDIDATE_MODELS[2:]:
+            self.models.broken[model] = 404
+
+        with patch.object(normaliser, "write_json", side_effect=OSError("read-only file system")), \
+                patch.object(normaliser, "get_openai_client", return_value=None):
+            events = normaliser.normalise_with_gemini(PAGE_TEXT, "https://nac.example.com", "Norwich Arts Centre")
+
+        self.assertEqual(events, [])
+        self.assertIsNone(normaliser._working_model)
+        # The cached model is tried once, then each remaining candidate is probed once
+        self.assertEqual(self.models.calls[0], (self.third, False))
+        self.assertEqual(max(Counter(self.models.calls).values()), 1)
+        self.assertLessEqual(len(self.models.calls), len(normaliser.CANDIDATE_MODELS))
+        # The file still names the old model; only this process knows better
+        self.assertEqual(json.loads(self.state_path.read_text())["model"], self.third)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import select  # noqa: E402
+
+from app.models import Job, Source  # noqa: E402
+from app.workers import orchestrator  # noqa: E402
+
+HOSTS = ["a.example.com"] * 4 + ["b.example.com"] * 3 + ["c.example.com"]
+
+
+class RunSourcesTest(AsyncDBTestCase):
+    shared_connection = False
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.sources = [
+            Source(id=f"s{i}", name=f"Source {i}", url=f"https://{host}/page-{i}", connector_type="html",
+                   source_type="venue")
+            for i, host in enumerate(HOSTS)
+        ]
+        self.db.add_all(self.sources)
+        await self.db.commit()
+
+        self.running: dict[str, int] = {}
+        self.peak = {"total": 0}
+        self.sessions_seen: dict[str, object] = {}
+        self.job_status_during_run: dict[str, str] = {}
+        self.failing = {"s5"}
+
+        patcher = patch.object(orchestrator, "AsyncSessionLocal", self.sessions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(orchestrator, "run_source", self._fake_run_source)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _fake_run_source(self, source_id, db, client=None, force=False):
+        host = HOSTS[int(source_id[1:])]
+        self.sessions_seen[source_id] = db
+        async with self.sessions() as other:
+            job = (await other.execute(select(Job).where(Job.source_id == source_id))).scalar_one_or_none()
+        if job:
+            self.job_status_during_run[source_id] = job.status
+
+        self.running[host] = self.running.get(host, 0) + 1
+        total = sum(self.running.values())
+        self.peak["total"] = max(self.peak["total"], total)
+        self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running[host] -= 1
+        if source_id in self.failing:
+            raise RuntimeError("upstream returned 500")
+        return {"found": 2, "added": 1, "updated": 0, "queued": 1, "errors": 0, "unchanged": 0}
+
+    async def _run(self, **kwargs):
+        done = []
+        totals = await orchestrator.run_sources(
+            [s.id for s in self.sources], on_done=lambda source, stats, error: done.append(source.id), **kwargs
+        )
+        return totals, done
+
+    async def test_global_and_per_host_caps(self):
+        await self._run(concurrency=3, per_host=1)
+        self.assertLessEqual(self.peak["total"], 3)
+        self.assertEqual(self.peak["a.example.com"], 1)
+        self.assertEqual(self.peak["b.example.com"], 1)
+
+        self.peak = {"total": 0}
+        await self._run(concurrency=8, per_host=2)
+        self.assertEqual(self.peak["a.example.com"], 2)
+        self.assertGreater(self.peak["total"], 2)
+
+    async def test_each_worker_gets_its_own_session(self):
+        await self._run(concurrency=8, per_host=4)
+        self.assertEqual(set(self.sessions_seen), {s.id for s in self.sources})
+        self.assertEqual(len({id(db) for db in self.sessions_seen.values()}), len(self.sources))
+
+    async def test_one_failure_is_reported_and_the_rest_aggregated(self):
+        totals, done = await self._run(concurrency=4, per_host=2)
+        self.assertEqual(sorted(done), sorted(s.id for s in self.sources))
+        self.assertEqual((totals["sources"], totals["succeeded"], totals["failed"]), (8, 7, 1))
+        self.assertEqual((totals["found"], totals["added"], totals["queued"]), (14, 7, 7))
+        self.assertEqual(totals["per_source"]["s5"], {"error": "upstream returned 500"})
+        self.assertEqual(totals["per_source"]["s0"]["found"], 2)
+
+    async def test_jobs_move_through_running_to_done_or_failed(self):
+        job_ids = await orchestrator.queue_scrape_jobs(self.db, self.sources)
+        jobs = (await self.db.execute(select(Job))).scalars().all()
+        self.assertEqual({j.status for j in jobs}, {"pending"})
+
+        await self._run(job_ids=job_ids, concurrency=4, per_host=2)
+
+        self.assertEqual(set(self.job_status_during_run.values()), {"running"})
+        async with self.sessions() as db:
+            jobs = {j.source_id: j for j in (await db.execute(select(Job))).scalars()}
+        self.assertEqual(jobs["s5"].status, "failed")
+        self.assertEqual(jobs["s5"].error_message, "upstream returned 500")
+        for source_id, job in jobs.items():
+            self.assertIsNotNone(job.started_at)
+            self.assertIsNotNone(job.finished_at)
+            if source_id != "s5":
+                self.assertEqual((job.status, job.events_found, job.events_queued), ("done", 2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
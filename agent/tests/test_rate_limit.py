@@ -0,0 +1,75 @@
+import asyncio
+import time
+import unittest
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.core.rate_limit import HostRateLimiter, TokenBucket  # noqa: E402
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_first_request_is_free_then_waits_for_refill(self):
+        bucket = TokenBucket(rate=10.0, capacity=1.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        # Debt accumulates so queued callers are spaced out in order
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_burst_capacity(self):
+        bucket = TokenBucket(rate=1.0, capacity=3.0)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertGreater(bucket.reserve(), 0.0)
+
+
+class HostRateLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_hosts_are_limited_independently(self):
+        limiter = HostRateLimiter(default_delay=0.2)
+        started = time.monotonic()
+        await asyncio.gather(
+            limiter.acquire("https://a.example.com/1"),
+            limiter.acquire("https://b.example.com/1"),
+            limiter.acquire("https://c.example.com/1"),
+        )
+        self.assertLess(time.monotonic() - started, 0.1)
+
+    async def test_same_host_is_spaced_without_blocking_the_loop(self):
+        limiter = HostRateLimiter(default_delay=0.1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire("https://venue.example.com/whats-on")
+        elapsed = time.monotonic() - started
+        task.cancel()
+
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertGreater(ticks, 5)
+
+    async def test_per_source_override(self):
+        limiter = HostRateLimiter(default_delay=5.0)
+        started = time.monotonic()
+        await limiter.acquire("https://fast.example.com/", delay=0.05)
+        await limiter.acquire("https://fast.example.com/", delay=0.05)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_shared_host_keeps_the_strictest_delay(self):
+        limiter = HostRateLimiter(default_delay=1.0)
+        url = "https://venue.example.com/whats-on"
+        self.assertEqual(limiter.bucket(url, 2.0).rate, 0.5)
+        # A faster source on the same host does not loosen it, in either order
+        self.assertEqual(limiter.bucket(url + "/family", 0.5).rate, 0.5)
+        self.assertEqual(limiter.bucket(url, 4.0).rate, 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
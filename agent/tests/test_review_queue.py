@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import event as sa_event  # noqa: E402
+
+from app.models import Event, ReviewQueueItem  # noqa: E402
+from app.routers import review  # noqa: E402
+
+
+class ReviewQueueListingTest(AsyncDBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        async with self.sessions() as db:
+            db.add(Event(id="canon", title="Jazz Night", status="approved"))
+            for i in range(5):
+                db.add(Event(id=f"e{i}", title=f"Jazz Night {i}"))
+                db.add(ReviewQueueItem(
+                    id=f"q{i}", event_id=f"e{i}", reason="possible_duplicate",
+                    duplicate_candidate_id="canon" if i % 2 == 0 else None,
+                    duplicate_score=80, created_at=datetime(2026, 1, 1, 12, i),
+                ))
+            await db.commit()
+
+        self.selects = 0
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                self.selects += 1
+        sa_event.listen(self.engine.sync_engine, "before_cursor_execute", count)
+        self.client = self.client_for(review.router)
+
+    async def test_items_events_and_candidates_in_one_query(self):
+        items = (await self.client.get("/review/", params={"limit": 4})).json()
+        self.assertEqual(self.selects, 1)
+        self.assertEqual([i["queue_id"] for i in items], ["q0", "q1", "q2", "q3"])
+        self.assertEqual(items[0]["event"]["title"], "Jazz Night 0")
+        self.assertEqual(items[0]["duplicate_candidate"]["id"], "canon")
+        self.assertIsNone(items[1]["duplicate_candidate"])
+
+        rest = (await self.client.get("/review/", params={"limit": 4, "offset": 4})).json()
+        self.assertEqual([i["queue_id"] for i in rest], ["q4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "automation" / "botasaurus_scraper"))
+
+import main  # noqa: E402
+from normaliser import RateLimiter  # noqa: E402
+
+SOURCES = [
+    {"name": "Slow Venue", "url": "https://slow.example.com"},
+    {"name": "Fast Venue", "url": "https://fast.example.com"},
+    {"name": "Broken Venue", "url": "https://broken.example.com"},
+]
+
+
+class ScraperPipelineTest(unittest.TestCase):
+    def test_normalisation_starts_while_slow_sources_are_still_scraping(self):
+        slow_released = threading.Event()
+        fast_normalised = threading.Event()
+
+        def scrape(source):
+            if source["name"] == "Slow Venue":
+                # Only finishes once the fast source has been through the AI stage
+                self.assertTrue(fast_normalised.wait(2))
+                slow_released.set()
+            return {"source": source["name"], "url": source["url"], "text": "page text"}
+
+        def normalise(text, url, name):
+            if name == "Broken Venue":
+                raise RuntimeError("quota exceeded")
+            if name == "Fast Venue":
+                fast_normalised.set()
+            return [{"title": f"{name} event"}]
+
+        with patch.object(main, "scrape_source", scrape), patch.object(main, "normalise_with_gemini", normalise):
+            raw, events, errors = main.scrape_and_normalise(SOURCES)
+
+        self.assertTrue(slow_released.is_set())
+        self.assertEqual(len(raw), 3)
+        self.assertEqual([e["title"] for e in events], ["Slow Venue event", "Fast Venue event"])
+        self.assertEqual(errors, 1)
+
+    def test_rate_limiter_spaces_calls_and_caps_concurrency(self):
+        limiter = RateLimiter(per_minute=1200, concurrency=2)
+        starts, in_flight, peak = [], 0, 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal in_flight, peak
+            with limiter:
+                with lock:
+                    starts.append(time.monotonic())
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        self.assertLessEqual(peak, 2)
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertGreaterEqual(min(gaps), 0.045)
+
+
+if __name__ == "__main__":
+    unittest.main()
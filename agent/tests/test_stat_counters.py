@@ -0,0 +1,86 @@
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from db_case import AsyncDBTestCase  # noqa: E402
+
+from sqlalchemy import event, select  # noqa: E402
+
+from app.models import Event, ReviewQueueItem, StatCounter, Venue  # noqa: E402
+from app.models.stats import bump_counters  # noqa: E402
+from app.workers.stat_counters import dashboard_counts, rebuild_counters  # noqa: E402
+
+
+class StatCountersTest(AsyncDBTestCase):
+    savepoints = True
+
+    async def _counters(self) -> dict:
+        return dict((await self.db.execute(select(StatCounter.key, StatCounter.value))).all())
+
+    async def _rebuilt(self) -> dict:
+        await self.db.run_sync(lambda session: rebuild_counters(session.connection()))
+        return await self._counters()
+
+    async def test_counters_follow_inserts_updates_and_deletes(self):
+        tomorrow = datetime.now() + timedelta(days=1)
+        self.db.add_all([
+            Event(id="a", title="A", status="approved", start_datetime=tomorrow),
+            Event(id="b", title="B"),
+            Event(id="c", title="C"),
+            ReviewQueueItem(event_id="b", reason="low_confidence"),
+            Venue(name="Arts Centre", slug="arts-centre"),
+        ])
+        await self.db.commit()
+
+        b, c = await self.db.get(Event, "b"), await self.db.get(Event, "c")
+        b.status = "approved"
+        c.canonical, c.status = False, "merged"
+        item = (await self.db.execute(select(ReviewQueueItem))).scalar_one()
+        item.status = "resolved"
+        await self.db.commit()
+
+        async with self.db.begin_nested():
+            self.db.add(Event(id="d", title="D", status="approved"))
+        try:
+            async with self.db.begin_nested():
+                self.db.add(Event(id="e", title="E"))
+                await self.db.flush()
+                raise RuntimeError("discard")
+        except RuntimeError:
+            pass
+        await self.db.delete(await self.db.get(Event, "a"))
+        await self.db.commit()
+
+        live = await self._counters()
+        self.assertEqual(live, {"events:approved:1": 2, "events:merged:0": 1, "events:pending:1": 0,
+                                "review:pending": 0, "review:resolved": 1})
+        self.assertEqual({k: v for k, v in live.items() if v}, await self._rebuilt())
+
+        counts = await dashboard_counts(self.db)
+        self.assertEqual(
+            (counts["total_events"], counts["approved_events"], counts["pending_events"]), (3, 2, 0)
+        )
+        self.assertEqual((counts["review_queue"], counts["review_resolved"], counts["venues"]), (0, 1, 1))
+        self.assertEqual(counts["today_events"], 0)
+
+    async def test_upserts_keys_in_a_fixed_order(self):
+        written = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "stat_counters" in statement:
+                rows = parameters if executemany else [parameters]
+                written.extend(p for row in rows for p in row if isinstance(p, str))
+
+        event.listen(self.engine.sync_engine, "before_cursor_execute", capture)
+        self.addCleanup(event.remove, self.engine.sync_engine, "before_cursor_execute", capture)
+        await self.db.run_sync(lambda session: bump_counters(session.connection(), {"b": 1, "c": 2, "a": 3}))
+        self.assertEqual(written, ["a", "b", "c"])
+        self.assertEqual(await self._counters(), {"a": 3, "b": 1, "c": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import gzip
+import json
+import os
+import unittest
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+
+import httpx
+from fastapi import FastAPI
+
+AGENT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(AGENT_ROOT))
+
+from app.core.static_files import PrecompressedStaticFiles, accepted_encodings  # noqa: E402
+from app.workers.json_stream import write_json  # noqa: E402
+
+
+class PrecompressedExportsTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self.payload = {"events": [{"name": f"Gig {i}", "venue": "Norwich Arts Centre"} for i in range(50)]}
+        write_json(self.root / "events.json", self.payload, compress=True)
+
+        app = FastAPI()
+        app.mount("/exports", PrecompressedStaticFiles(directory=self.root), name="exports")
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def _get(self, encoding: str, **headers) -> tuple[httpx.Response, bytes]:
+        # Read the raw bytes so httpx does not decode them for us
+        request = self.client.build_request("GET", "/exports/events.json", headers={"accept-encoding": encoding, **headers})
+        response = await self.client.send(request, stream=True)
+        return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+    def test_minified_and_compressed_variants_match(self):
+        body = (self.root / "events.json").read_bytes()
+        self.assertNotIn(b"\n", body)
+        self.assertEqual(json.loads(body), self.payload)
+        self.assertEqual(gzip.decompress((self.root / "events.json.gz").read_bytes()), body)
+        self.assertLess((self.root / "events.json.gz").stat().st_size, len(body))
+
+    async def test_serves_gzip_with_strong_etag_and_revalidates(self):
+        response, raw = await self._get("gzip, deflate")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(json.loads(gzip.decompress(raw)), self.payload)
+        etag = response.headers["etag"]
+        self.assertFalse(etag.startswith("W/"))
+
+        again, _ = await self._get("gzip", **{"if-none-match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.headers["etag"], etag)
+
+    async def test_identity_and_stale_variants_fall_back_to_plain_file(self):
+        plain, raw = await self._get("identity")
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(json.loads(raw), self.payload)
+
+        gzipped, _ = await self._get("gzip")
+        self.assertNotEqual(plain.headers["etag"], gzipped.headers["etag"])
+
+        gz = self.root / "events.json.gz"
+        stamp = (self.root / "events.json").stat().st_mtime_ns
+        os.utime(gz, ns=(stamp - 10**9, stamp - 10**9))
+        stale, _ = await self._get("gzip")
+        self.assertNotIn("content-encoding", stale.headers)
+
+    def test_accept_encoding_parsing(self):
+        self.assertEqual(accepted_encodings("br;q=0, gzip;q=0.8, *"), {"gzip", "*"})
+
+
+if __name__ == "__main__":
+    unittest.main()
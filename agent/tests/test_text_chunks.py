@@ -0,0 +1,77 @@
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "agent"))
+sys.path.insert(0, str(ROOT / "automation" / "botasaurus_scraper"))
+
+from app.workers.text_chunks import chunk_text, merge_chunk_results  # noqa: E402
+import normaliser  # noqa: E402
+
+
+def _listing(count: int) -> tuple[str, list[str]]:
+    entries = [
+        f"Fri {1 + i % 28} Jun 2026 Event number {i} at Norwich Arts Centre. Doors 19:30, tickets £{5 + i % 10}. "
+        "A long evening of live music with support acts and a late bar for everyone." for i in range(count)
+    ]
+    return " ".join(entries), entries
+
+
+class TextChunksTest(unittest.TestCase):
+    def test_short_text_is_a_single_chunk(self):
+        self.assertEqual(chunk_text("  Jazz Night, Fri 12 Jun  "), ["Jazz Night, Fri 12 Jun"])
+        self.assertEqual(chunk_text("   "), [])
+
+    def test_windows_break_on_dates_and_every_entry_is_whole_somewhere(self):
+        text, entries = _listing(120)
+        chunks = chunk_text(text, max_chars=2000, overlap=300)
+
+        self.assertGreater(len(chunks), 5)
+        self.assertTrue(all(len(chunk) <= 2000 for chunk in chunks))
+        self.assertTrue(all(chunk.startswith(("Fri ", "A long")) for chunk in chunks[1:]))
+        for entry in entries:
+            self.assertTrue(any(entry in chunk for chunk in chunks), entry[:40])
+
+    def test_text_without_boundaries_still_splits_and_max_chunks_caps_it(self):
+        self.assertEqual([len(c) for c in chunk_text("x" * 2500, max_chars=1000, overlap=100)], [1000, 1000, 700])
+        text, _ = _listing(120)
+        self.assertEqual(len(chunk_text(text, max_chars=2000, max_chunks=3)), 3)
+
+    def test_merge_keeps_the_most_complete_duplicate_in_first_seen_order(self):
+        merged = merge_chunk_results(
+            [
+                [{"title": "Jazz Night", "date": "2026-06-12", "price": None}, {"title": "Folk", "date": "2026-06-13"}],
+                [{"title": "Jazz Night", "date": "2026-06-12", "price": "£10"}, {"title": "Comedy", "date": "2026-06-14"}],
+            ],
+            key=lambda e: (e["title"], e["date"]),
+        )
+        self.assertEqual([e["title"] for e in merged], ["Jazz Night", "Folk", "Comedy"])
+        self.assertEqual(merged[0]["price"], "£10")
+
+
+class ChunkedNormalisationTest(unittest.TestCase):
+    def test_long_pages_are_extracted_per_chunk_and_merged(self):
+        text, _ = _listing(200)
+        seen = []
+
+        def extract(chunk, url, name):
+            seen.append(chunk)
+            # Every chunk reports the first entry it contains, plus one shared duplicate
+            number = chunk.split("Event number ", 1)[1].split(" ", 1)[0]
+            return [{"title": f"Event number {number}", "date": "2026-06-01"}, {"title": "Event  NUMBER 0 ", "date": "2026-06-01"}]
+
+        with patch.object(normaliser, "_extract_events", side_effect=extract):
+            events = normaliser.normalise_with_gemini(text, "https://nac.example.com", "Norwich Arts Centre")
+
+        self.assertEqual(len(seen), len(chunk_text(text, normaliser.CHUNK_CHARS, normaliser.CHUNK_OVERLAP)))
+        self.assertGreater(len(seen), 1)
+        titles = [e["title"] for e in events]
+        self.assertEqual(titles[0], "Event number 0")
+        self.assertEqual(len(titles), len(set(t.lower() for t in titles)))
+        self.assertEqual(len(titles), len(seen))
+
+
+if __name__ == "__main__":
+    unittest.main()
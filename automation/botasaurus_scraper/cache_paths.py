@@ -0,0 +1,8 @@
+"""
+Where the scraper keeps state between runs: link checks and the chosen
+Gemini model. SCRAPER_CACHE_DIR overrides the default .cache folder.
+"""
+import os
+import pathlib
+
+CACHE_DIR = pathlib.Path(os.environ.get("SCRAPER_CACHE_DIR") or pathlib.Path(__file__).resolve().parent / ".cache")
@@ -6,10 +6,13 @@ import json
 import os
 import pathlib
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Ensure the project root is on sys.path so 'agent' package is importable
 # regardless of the working directory the script is launched from.
@@ -18,11 +21,18 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from agent.app.workers.export_format import format_event_for_website
+from agent.app.workers.json_stream import write_json, write_json_array
+from cache_paths import CACHE_DIR
 
 
 TODAY = datetime.utcnow().strftime("%Y-%m-%d")
 EXPORTS_DIR = pathlib.Path(__file__).resolve().parent.parent.parent / "exports"
 LOGS_DIR = EXPORTS_DIR / "logs"
+LINK_CACHE_PATH = CACHE_DIR / "link-status.json"
+
+# How long a link check is trusted; broken links are retried sooner
+LINK_CACHE_TTL_SECONDS = {"verified": 7 * 24 * 3600, "broken": 6 * 3600}
+LINK_CHECK_WORKERS = int(os.environ.get("LINK_CHECK_WORKERS", "16"))
 
 TRUSTED_SOURCES = {
     "Visit Norwich",
@@ -67,21 +77,71 @@ CATEGORY_FALLBACK_IMAGES = {
 }
 
 
-def _validate_url(url: str, *, timeout: int = 8) -> str:
+def _validate_url(url: str, *, timeout: int = 8, http=requests) -> str:
     if not url:
         return "missing"
     parsed = urlparse(url)
     if parsed.scheme not in {"http", "https"} or not parsed.netloc:
         return "broken"
     try:
-        response = requests.head(url, allow_redirects=True, timeout=timeout)
+        response = http.head(url, allow_redirects=True, timeout=timeout)
         if response.status_code >= 400 or response.status_code == 405:
-            response = requests.get(url, allow_redirects=True, timeout=timeout, stream=True)
+            response = http.get(url, allow_redirects=True, timeout=timeout, stream=True)
+            response.close()
         return "verified" if response.status_code < 400 else "broken"
     except Exception:
         return "broken"
 
 
+_session: requests.Session | None = None
+
+
+def _http_session() -> requests.Session:
+    """Shared keep-alive session sized for LINK_CHECK_WORKERS threads."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=LINK_CHECK_WORKERS, pool_maxsize=LINK_CHECK_WORKERS)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def _load_link_cache(now: float) -> dict[str, dict]:
+    try:
+        cache = json.loads(LINK_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {
+        url: entry for url, entry in cache.items()
+        if now - entry.get("checked_at", 0) < LINK_CACHE_TTL_SECONDS.get(entry.get("status"), 0)
+    }
+
+
+def validate_links(urls, *, now: float | None = None) -> dict[str, str]:
+    """
+    Link status for each distinct URL. Results cached on disk within their TTL
+    are reused; the rest are checked concurrently over a pooled session.
+    """
+    now = time.time() if now is None else now
+    cache = _load_link_cache(now)
+    unique = sorted({url for url in urls if url})
+    statuses = {url: cache[url]["status"] for url in unique if url in cache}
+    pending = [url for url in unique if url not in statuses]
+    if not pending:
+        return statuses
+
+    http = _http_session()
+    with ThreadPoolExecutor(max_workers=min(LINK_CHECK_WORKERS, len(pending))) as pool:
+        for url, status in zip(pending, pool.map(lambda url: _validate_url(url, http=http), pending)):
+            statuses[url] = status
+            cache[url] = {"status": status, "checked_at": now}
+
+    print(f"[LINKS] Checked {len(pending)} links ({len(unique) - len(pending)} cached)")
+    write_json(LINK_CACHE_PATH, cache)
+    return statuses
+
+
 def _resolve_fallback_image(venue_name: str, category: str) -> str:
     venue_key = (venue_name or "").strip().lower()
     if venue_key in VENUE_FALLBACK_IMAGES:
@@ -161,7 +221,8 @@ def deduplicate_and_export(events: list[dict]) -> dict:
         if event.get("title") and event.get("date") and str(event.get("date", ""))[:10] >= TODAY
     ]
 
-    adapted_events = [_adapt_scraper_event(event) for event in valid]
+    link_statuses = validate_links(url for event in valid for url in _event_links(event))
+    adapted_events = [_adapt_scraper_event(event, link_statuses) for event in valid]
 
     existing_public_events = _load_existing_public_events()
     seen_fingerprints: set[str] = {_public_event_fingerprint(event) for event in existing_public_events}
@@ -216,23 +277,11 @@ def deduplicate_and_export(events: list[dict]) -> dict:
     EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-    payload = {
-        "events": exported,
-        "generated_at": datetime.utcnow().isoformat(),
-        "count": len(exported),
-    }
-    (EXPORTS_DIR / "events.json").write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-    (LOGS_DIR / "scraper-review-queue.json").write_text(
-        json.dumps(
-            {
-                "generated_at": datetime.utcnow().isoformat(),
-                "count": len(review_queue),
-                "events": review_queue,
-            },
-            indent=2,
-            ensure_ascii=False,
-        ),
-        encoding="utf-8",
+    # Streamed to a temp file and renamed into place, so the site never
+    # reads a half-written export
+    write_json_array(EXPORTS_DIR / "events.json", exported, generated_at=datetime.utcnow().isoformat())
+    write_json_array(
+        LOGS_DIR / "scraper-review-queue.json", review_queue, generated_at=datetime.utcnow().isoformat()
     )
 
     stats = {
@@ -252,7 +301,24 @@ def deduplicate_and_export(events: list[dict]) -> dict:
     return stats
 
 
-def _adapt_scraper_event(event: dict) -> dict:
+def _event_links(event: dict) -> tuple[str, str, str]:
+    """The (source, ticket, image) URLs of a scraped event."""
+    return (
+        (event.get("source_url") or "").strip(),
+        (event.get("ticket_url") or event.get("ticketLink") or "").strip(),
+        (event.get("image_url") or event.get("image") or "").strip(),
+    )
+
+
+def _link_status(url: str, link_statuses: dict[str, str] | None) -> str:
+    """Status from a validate_links batch, or a one-off check for URLs it did not cover."""
+    if link_statuses is not None and url in link_statuses:
+        return link_statuses[url]
+    return _validate_url(url)
+
+
+def _adapt_scraper_event(event: dict, link_statuses: dict[str, str] | None = None) -> dict:
+    """Map a scraped event onto the public contract; `link_statuses` come from validate_links."""
     title = (event.get("title") or event.get("name") or "").strip()
     date = str(event.get("date", ""))[:10]
     time = _normalise_time(event.get("time"))
@@ -260,19 +326,18 @@ def _adapt_scraper_event(event: dict) -> dict:
     venue_name = (event.get("venue") or event.get("location") or "").strip()
     address = (event.get("address") or "").strip() or None
     source_name = event.get("source", "")
-    source_url = (event.get("source_url") or "").strip()
-    ticket_url = (event.get("ticket_url") or event.get("ticketLink") or "").strip()
+    source_url, ticket_url, image_url = _event_links(event)
     official_url = (event.get("official_url") or "").strip()
-    image_url = (event.get("image_url") or event.get("image") or "").strip()
 
     # Only attach a time-of-day when one was actually scraped; a fabricated
     # "00:00" would defeat the "Time TBC" fallback in format_event_for_website.
     start_datetime = f"{date}T{time}:00" if date and time else (date or None)
     end_datetime = f"{date}T{end_time}:00" if date and end_time else None
     primary_url = ticket_url or official_url or source_url
-    source_status = _validate_url(source_url)
-    ticket_status = _validate_url(ticket_url) if ticket_url else "missing"
-    image_status = _validate_url(image_url) if image_url else "missing"
+
+    source_status = _link_status(source_url, link_statuses)
+    ticket_status = _link_status(ticket_url, link_statuses) if ticket_url else "missing"
+    image_status = _link_status(image_url, link_statuses) if image_url else "missing"
     needs_flyer = image_status != "verified"
 
     resolved_image = image_url if image_status == "verified" else _resolve_fallback_image(venue_name, event.get("category") or "general")
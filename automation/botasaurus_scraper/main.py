@@ -5,6 +5,9 @@ Scrapes Norwich event sources, normalises with Gemini AI, and exports canonical
 Usage:
     cd automation/botasaurus_scraper
     GEMINI_API_KEY=xxx python main.py
+
+AI_CONCURRENCY (default 4) and AI_REQUESTS_PER_MINUTE (default 60) tune the
+normalisation stage to the API quota.
 """
 import concurrent.futures
 import json
@@ -15,7 +18,6 @@ import time
 from datetime import datetime
 
 import requests
-from bs4 import BeautifulSoup
 
 try:
     from scrapling.fetchers import StealthyFetcher
@@ -25,9 +27,13 @@ except ImportError:
 sys.path.insert(0, os.path.dirname(__file__))
 
 from exporter import deduplicate_and_export
-from normaliser import normalise_with_gemini
+from normaliser import AI_CONCURRENCY, normalise_with_gemini
 from sources import SOURCES
 
+from agent.app.workers.html_text import NOISE_TAGS, parse_html
+
+SCRAPE_WORKERS = 8
+
 
 HEADERS = {
     "User-Agent": (
@@ -42,10 +48,7 @@ HEADERS = {
 
 def _clean_html(html: str) -> str:
     """Strip nav/footer/scripts and return readable text."""
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["nav", "footer", "script", "style", "aside", "header"]):
-        tag.decompose()
-    return soup.get_text(separator=" ", strip=True)[:8000]
+    return parse_html(html).page_text(NOISE_TAGS + ("header",))
 
 
 def _scrapling_page_text(page) -> str:
@@ -57,7 +60,7 @@ def _scrapling_page_text(page) -> str:
             except TypeError:
                 value = ""
         if isinstance(value, str) and value.strip():
-            return _clean_html(value) if "<" in value and ">" in value else value.strip()[:8000]
+            return _clean_html(value) if "<" in value and ">" in value else value.strip()
 
     return _clean_html(str(page)) if page is not None else ""
 
@@ -132,6 +135,44 @@ def scrape_source(source: dict) -> dict | None:
     return scrape_source_with_requests(source)
 
 
+def scrape_and_normalise(sources: list[dict]) -> tuple[list[dict], list[dict], int]:
+    """
+    Scrape sources on one thread pool and hand each page to the AI normaliser
+    on another as soon as it arrives, so extraction overlaps slow fetches.
+    AI calls are paced by normaliser.rate_limiter. Returns (raw results,
+    events in source order, normalisation errors).
+    """
+    raw_results: list[dict] = []
+    events_by_source: dict[int, list[dict]] = {}
+    errors = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as scrape_pool, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=AI_CONCURRENCY) as ai_pool:
+        scrapes = {scrape_pool.submit(scrape_source, source): index for index, source in enumerate(sources)}
+        normalising = {}
+        for future in concurrent.futures.as_completed(scrapes):
+            raw = future.result()
+            if not raw:
+                continue
+            raw_results.append(raw)
+            print(f"[AI] Normalising {raw['source']}")
+            job = ai_pool.submit(normalise_with_gemini, raw["text"], raw["url"], raw["source"])
+            normalising[job] = (scrapes[future], raw)
+
+        print(f"\n--- Scraped {len(raw_results)}/{len(sources)} sources successfully ---\n")
+
+        for future in concurrent.futures.as_completed(normalising):
+            index, raw = normalising[future]
+            try:
+                events_by_source[index] = future.result()
+            except Exception as error:
+                print(f"[AI ERROR] {raw['source']}: {error}")
+                errors += 1
+
+    # Source order, not completion order, so deduplication keeps the same winners
+    all_events = [event for index in sorted(events_by_source) for event in events_by_source[index]]
+    return raw_results, all_events, errors
+
+
 def main() -> None:
     if not os.environ.get("GEMINI_API_KEY"):
         print("[ERROR] GEMINI_API_KEY environment variable is not set.")
@@ -143,33 +184,12 @@ def main() -> None:
     print(f"\n=== Norwich Events Scraper (Run: {run_id}) ===")
     print(f"Sources: {len(SOURCES)}\n")
 
-    raw_results: list[dict] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-        futures = {executor.submit(scrape_source, source): source for source in SOURCES}
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                raw_results.append(result)
-
-    print(f"\n--- Scraped {len(raw_results)}/{len(SOURCES)} sources successfully ---\n")
+    raw_results, all_events, errors = scrape_and_normalise(SOURCES)
 
     if not raw_results:
         print("[ERROR] No sources scraped. Exiting.")
         sys.exit(1)
 
-    all_events: list[dict] = []
-    errors = 0
-    for index, raw in enumerate(raw_results, 1):
-        try:
-            print(f"[AI] Normalising {index}/{len(raw_results)}: {raw['source']}")
-            events = normalise_with_gemini(raw["text"], raw["url"], raw["source"])
-            all_events.extend(events)
-            if index < len(raw_results):
-                time.sleep(0.5)
-        except Exception as error:
-            print(f"[AI ERROR] {raw['source']}: {error}")
-            errors += 1
-
     print(f"\n--- Gemini extracted {len(all_events)} raw events ---\n")
 
     export_stats = deduplicate_and_export(all_events)
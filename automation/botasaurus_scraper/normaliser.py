@@ -2,11 +2,31 @@
 Gemini AI event normaliser.
 Sends cleaned page text to Gemini Flash and gets back a structured list of events.
 Tries multiple Gemini models in order; falls back to OpenAI gpt-4o-mini if all fail.
+Safe to call from several threads: every AI request waits on a shared
+RateLimiter (AI_REQUESTS_PER_MINUTE, AI_CONCURRENCY).
+The working model and models known to be unavailable are remembered in a
+state file between runs; probing only happens when that expires or the
+remembered model stops working.
+Long pages are split into overlapping chunks that are extracted concurrently
+and merged, instead of being truncated.
 """
 import json
 import os
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from agent.app.workers.json_stream import write_json
+from agent.app.workers.text_chunks import chunk_text, merge_chunk_results
+from cache_paths import CACHE_DIR
+
 try:
     from google import genai as _genai
 except ImportError:
@@ -20,6 +40,17 @@ except ImportError:
 _client = None
 _working_model = None
 _openai_client = None
+_setup_lock = threading.Lock()
+_probe_lock = threading.Lock()
+# Models that failed during this run, so a state file that cannot be written
+# never hands one of them back
+_unavailable_models: set[str] = set()
+
+MODEL_STATE_PATH = CACHE_DIR / "gemini-model.json"
+# Trust the remembered model this long before probing again
+MODEL_STATE_TTL_SECONDS = 24 * 3600
+# Skip models that returned "not found" / "forbidden" for this long
+UNAVAILABLE_TTL_SECONDS = 7 * 24 * 3600
 
 CANDIDATE_MODELS = [
     "gemini-2.5-flash-preview-05-20",
@@ -31,12 +62,40 @@ CANDIDATE_MODELS = [
 ]
 
 
+class RateLimiter:
+    """Spaces calls at least 60/per_minute seconds apart, at most `concurrency` at once."""
+
+    def __init__(self, per_minute: float, concurrency: int):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._slots = threading.BoundedSemaphore(max(1, concurrency))
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        self._slots.acquire()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._slots.release()
+
+
+AI_CONCURRENCY = int(os.environ.get("AI_CONCURRENCY", "4"))
+rate_limiter = RateLimiter(float(os.environ.get("AI_REQUESTS_PER_MINUTE", "60")), AI_CONCURRENCY)
+
+
 def get_client():
     global _client
     if _genai is None:
         return None
-    if _client is None:
-        _client = _genai.Client(api_key=os.environ["GEMINI_API_KEY"])
+    with _setup_lock:
+        if _client is None:
+            _client = _genai.Client(api_key=os.environ["GEMINI_API_KEY"])
     return _client
 
 
@@ -47,11 +106,41 @@ def get_openai_client():
     api_key = os.environ.get("OPENAI_API_KEY", "")
     if not api_key:
         return None
-    if _openai_client is None:
-        _openai_client = _OpenAI(api_key=api_key)
+    with _setup_lock:
+        if _openai_client is None:
+            _openai_client = _OpenAI(api_key=api_key)
     return _openai_client
 
 
+def _model_unavailable(error: Exception) -> bool:
+    """The model itself is gone or off-limits (not a quota, key or network problem)."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    return code in (403, 404)
+
+
+def _load_model_state(now: float) -> dict:
+    try:
+        state = json.loads(MODEL_STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    fresh = now - state.get("chosen_at", 0) < MODEL_STATE_TTL_SECONDS
+    return {
+        "model": state.get("model") if fresh else None,
+        "chosen_at": state.get("chosen_at", 0),
+        "unavailable": {
+            model: marked_at for model, marked_at in (state.get("unavailable") or {}).items()
+            if now - marked_at < UNAVAILABLE_TTL_SECONDS
+        },
+    }
+
+
+def _save_model_state(state: dict) -> None:
+    try:
+        write_json(MODEL_STATE_PATH, state)
+    except OSError as error:
+        print(f"[MODEL] Could not save model state: {error}")
+
+
 def get_working_model() -> str | None:
     global _working_model
     if _working_model:
@@ -59,19 +148,58 @@ def get_working_model() -> str | None:
     client = get_client()
     if client is None:
         return None
-    for model in CANDIDATE_MODELS:
-        try:
-            client.models.generate_content(model=model, contents="Reply with the word OK")
-            _working_model = model
-            print(f"[MODEL] Using Gemini model: {model}")
-            return model
-        except Exception as error:
-            print(f"[MODEL] {model} unavailable: {error}")
-    return None
+    # One thread probes; the rest wait for its answer
+    with _probe_lock:
+        if _working_model:
+            return _working_model
+        now = time.time()
+        state = _load_model_state(now)
+        skip = _unavailable_models | state["unavailable"].keys()
+        if state["model"] in CANDIDATE_MODELS and state["model"] not in skip:
+            _working_model = state["model"]
+            print(f"[MODEL] Using Gemini model: {_working_model} (cached)")
+            return _working_model
+
+        for model in CANDIDATE_MODELS:
+            if model in skip:
+                continue
+            try:
+                with rate_limiter:
+                    client.models.generate_content(model=model, contents="Reply with the word OK")
+                _working_model = model
+                print(f"[MODEL] Using Gemini model: {model}")
+                break
+            except Exception as error:
+                print(f"[MODEL] {model} unavailable: {error}")
+                if _model_unavailable(error):
+                    _unavailable_models.add(model)
+                    state["unavailable"][model] = now
+        _save_model_state({"model": _working_model, "chosen_at": now, "unavailable": state["unavailable"]})
+    return _working_model
+
+
+def _forget_model(model: str) -> None:
+    """Record that `model` stopped working so the next call re-probes."""
+    global _working_model
+    with _probe_lock:
+        if _working_model == model:
+            _working_model = None
+        _unavailable_models.add(model)
+        now = time.time()
+        state = _load_model_state(now)
+        state["unavailable"][model] = now
+        if state["model"] == model:
+            state["model"] = None
+        _save_model_state(state)
 
 
 TODAY = datetime.utcnow().strftime("%Y-%m-%d")
 
+CHUNK_CHARS = 8000
+CHUNK_OVERLAP = 600
+# Bounds the cost of a runaway page (about 100k characters)
+MAX_CHUNKS = 12
+
 PROMPT_TEMPLATE = """You are an event data extractor for Norwich, UK.
 Extract ALL events from the webpage text below and return ONLY a valid JSON array with no markdown and no explanation.
 
@@ -112,24 +240,53 @@ def normalise_with_gemini(text: str, source_url: str, source_name: str) -> list[
     if not text or len(text.strip()) < 100:
         return []
 
+    chunks = chunk_text(text, CHUNK_CHARS, CHUNK_OVERLAP, MAX_CHUNKS)
+    if len(chunks) == 1:
+        events = _extract_events(chunks[0], source_url, source_name)
+    else:
+        print(f"[AI] {source_name}: {len(text)} chars in {len(chunks)} chunks")
+        with ThreadPoolExecutor(max_workers=min(AI_CONCURRENCY, len(chunks))) as pool:
+            results = list(pool.map(lambda chunk: _extract_events(chunk, source_url, source_name), chunks))
+        events = merge_chunk_results(results, key=_event_key)
+
+    print(f"[OK]   {source_name}: {len(events)} events extracted")
+    return events
+
+
+def _event_key(event: dict) -> tuple:
+    title = " ".join(str(event.get("title") or "").lower().split())
+    return title, str(event.get("date") or "")[:10], str(event.get("time") or "")
+
+
+def _extract_events(text: str, source_url: str, source_name: str) -> list[dict]:
+    """One AI call over one chunk of page text."""
     prompt = PROMPT_TEMPLATE.format(
         today=TODAY,
         source_name=source_name,
         source_url=source_url,
-        text=text[:8000],
+        text=text,
     )
 
     raw = None
 
     # --- Try Gemini first ---
     model = get_working_model()
-    if model:
+    # Each retry follows a model being marked unavailable, so this is never exceeded
+    for _attempt in range(len(CANDIDATE_MODELS)):
+        if not model:
+            break
         try:
-            response = get_client().models.generate_content(model=model, contents=prompt)
+            with rate_limiter:
+                response = get_client().models.generate_content(model=model, contents=prompt)
             raw = response.text.strip()
+            break
         except Exception as error:
             print(f"[WARN] {source_name}: Gemini failed - {error}")
-            raw = None
+            if not _model_unavailable(error):
+                break
+            # The remembered model has gone away; find another and retry
+            _forget_model(model)
+            model = get_working_model()
 
     # --- Fallback to OpenAI ---
     if raw is None:
@@ -137,14 +294,15 @@ def normalise_with_gemini(text: str, source_url: str, source_name: str) -> list[
         if oai:
             try:
                 print(f"[MODEL] Gemini unavailable, trying OpenAI gpt-4o-mini for {source_name}")
-                completion = oai.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are a JSON event extractor. Return only valid JSON."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.1,
-                )
+                with rate_limiter:
+                    completion = oai.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[
+                            {"role": "system", "content": "You are a JSON event extractor. Return only valid JSON."},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=0.1,
+                    )
                 raw = completion.choices[0].message.content.strip()
             except Exception as error:
                 print(f"[WARN] {source_name}: OpenAI fallback failed - {error}")
@@ -172,7 +330,6 @@ def normalise_with_gemini(text: str, source_url: str, source_name: str) -> list[
             event["isAiDiscovered"] = True
             event["status"] = "pending"
 
-        print(f"[OK]   {source_name}: {len(events)} events extracted")
         return events
 
     except json.JSONDecodeError as error:
@@ -9,6 +9,10 @@
   var isLocal = window.location.hostname === 'localhost' || window.location.hostname === '127.0.0.1';
   var AGENT_API = 'http://localhost:8000/api/v1';
   var EXPORTS_JSON = 'exports/events.json';
+  // Pages that only need a slice opt in with data-exports-shard, e.g.
+  // <script src="scripts/agent-bridge.js" data-exports-shard="shards/next-7-days.json">
+  var currentScript = document.currentScript;
+  var EXPORTS_SHARD = currentScript && currentScript.getAttribute('data-exports-shard');
   var USE_AGENT_API = isLocal;
   var USE_EXPORTS = true;
   var CACHE_TTL_MS = 5 * 60 * 1000;
@@ -223,10 +227,21 @@
   }
 
   async function tryExportsJson() {
-    var cached = readCache('exports');
+    var cacheName = EXPORTS_SHARD ? 'exports:' + EXPORTS_SHARD : 'exports';
+    var cached = readCache(cacheName);
     if (cached) return cached;
 
-    var data = await fetchJSON(EXPORTS_JSON, 8000);
+    var data = null;
+    if (EXPORTS_SHARD) {
+      try {
+        data = await fetchJSON('exports/' + EXPORTS_SHARD, 8000);
+      } catch (error) {
+        console.warn('[AgentBridge] shard ' + EXPORTS_SHARD + ' unavailable, loading all events:', error.message);
+      }
+    }
+    if (!data) {
+      data = await fetchJSON(EXPORTS_JSON, 8000);
+    }
     if (data && data.generated_at) {
       window.eventsLastUpdated = data.generated_at;
       window.dispatchEvent(new CustomEvent('eventsMetadata', {
@@ -239,7 +254,7 @@
     }
 
     var events = normaliseAll(Array.isArray(data) ? data : (data.events || []));
-    writeCache('exports', events);
+    writeCache(cacheName, events);
     return events;
   }
 